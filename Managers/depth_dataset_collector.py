@@ -1,18 +1,19 @@
 import os
 import threading
-import queue
 import numpy as np
+from collections import deque
 import math
 import datetime
 import json
+import random
 import time
 
 from Utils.capture_utils import (
-    capture_depth, capture_rgb, capture_pose, 
-    capture_distance_to_victim, _ensure_target_invisible,
+    capture_depth, capture_rgb, _ensure_target_invisible,
     check_target_visibility
 )
-from Utils.save_utils import save_batch_npz
+from Utils.save_utils import save_batch_npy_dir
+from Utils.ring_utils import RingBuffer, Empty
 from Utils.config_utils import get_default_config
 from Managers.scene_manager import SCENE_CREATION_COMPLETED, SCENE_CLEARED
 from Utils.log_utils import get_logger, DEBUG_L1, DEBUG_L2, DEBUG_L3
@@ -33,63 +34,148 @@ VICTIM_DETECTED = 'victim/detected'                   # Victim detected in frame
 DATASET_CONFIG_UPDATED = 'dataset/config/updated'     # Dataset configuration updated
 DATASET_DIR_CHANGED = 'dataset/dir/changed'           # Dataset directory changed
 
+# Cached object handles, keyed by scene path. Each sim.getObject call is a
+# Python RPC round-trip, which dwarfs the math in get_victim_direction, so
+# handles are looked up once and dropped whenever the scene is rebuilt.
+_handle_cache = {}
+
+# Reused zero-direction tuple so no-victim/error paths allocate nothing
+_ZERO_DIR = (0.0, 0.0, 0.0)
+
+def _get_cached_handle(path):
+    """Return the (cached) handle for a scene object path."""
+    handle = _handle_cache.get(path)
+    if handle is None:
+        handle = SC.sim.getObject(path)
+        _handle_cache[path] = handle
+    return handle
+
+def invalidate_handle_cache():
+    """Drop all cached object handles (call when the scene changes)."""
+    _handle_cache.clear()
+
+def _rotate_and_norm(qx, qy, qz, vx, vy, vz, gamma):
+    """
+    Pure-numeric core of get_victim_direction: world-frame positions ->
+    drone-relative unit direction and distance. Kept free of sim/log calls
+    so it can be JIT-compiled when numba is installed.
+
+    Returns:
+        tuple: (ux, uy, uz, distance)
+    """
+    # Calculate vector components and squared distance in world coordinates
+    dx_world, dy_world, dz_world = vx - qx, vy - qy, vz - qz
+    dsq = dx_world*dx_world + dy_world*dy_world + dz_world*dz_world
+
+    # Avoid division by near-zero (and skip the trig entirely)
+    if dsq < 1e-8:
+        return 0.0, 0.0, 0.0, math.sqrt(dsq)
+
+    distance = math.sqrt(dsq)
+
+    # Fix the transformation by first calculating the correct angle
+    # CoppeliaSim's coordinate system: X right, Y forward, Z up
+    # We need to adjust gamma (yaw) to match our display conventions
+    cos_yaw = math.cos(gamma)
+    sin_yaw = math.sin(gamma)
+
+    # Correct transformation with proper rotation matrix
+    # This transformation ensures "forward" on the display corresponds to
+    # the drone's forward direction (Y-axis in CoppeliaSim)
+    # We need to invert the sign of dy to fix the backwards issue
+    dx = -dx_world * sin_yaw + dy_world * cos_yaw  # Left-right axis (X in display)
+    dy = -dx_world * cos_yaw - dy_world * sin_yaw   # Forward-back axis (Y in display)
+    dz = dz_world  # Keep the original Z difference for elevation
+
+    # Normalize with one division and three multiplies
+    inv = 1.0 / distance
+    return dx * inv, dy * inv, dz * inv, distance
+
+# JIT-compile the numeric core when numba is available (optional dependency);
+# the pure-Python version above is the fallback
+try:
+    from numba import njit
+    _rotate_and_norm = njit(cache=True, fastmath=True)(_rotate_and_norm)
+except ImportError:
+    pass
+
 def get_victim_direction():
     """
     Returns a unit direction vector and distance from quadcopter to victim,
     transformed to be relative to the drone's current orientation.
-    
+
     Returns:
         tuple: ((dx, dy, dz), distance) - normalized direction vector and Euclidean distance
     """
     try:
-        # Get quadcopter handle
-        quad = SC.sim.getObject('/Quadcopter')
-        
+        # Get quadcopter handle (cached - avoids an RPC round-trip per capture)
+        quad = _get_cached_handle('/Quadcopter')
+
         # Check if victim exists
         try:
-            vic = SC.sim.getObject('/Victim')
+            vic = _get_cached_handle('/Victim')
         except Exception:
             # Victim doesn't exist
             logger.debug_at_level(2, "DepthCollector", "No victim in scene, skipping direction calculation")
-            return (0.0, 0.0, 0.0), -1.0
+            return _ZERO_DIR, -1.0
 
         # Get positions
         qx, qy, qz = SC.sim.getObjectPosition(quad, -1)
         vx, vy, vz = SC.sim.getObjectPosition(vic, -1)
 
-        # Calculate vector components and distance in world coordinates
-        dx_world, dy_world, dz_world = vx - qx, vy - qy, vz - qz
-        distance = math.sqrt(dx_world*dx_world + dy_world*dy_world + dz_world*dz_world)
-        
-        # Get drone's orientation (Euler angles in radians)
-        drone_orientation = SC.sim.getObjectOrientation(quad, -1)
-        alpha, beta, gamma = drone_orientation  # Roll, pitch, yaw
-        
-        # Fix the transformation by first calculating the correct angle
-        # CoppeliaSim's coordinate system: X right, Y forward, Z up
-        # We need to adjust gamma (yaw) to match our display conventions
-        cos_yaw = math.cos(gamma)
-        sin_yaw = math.sin(gamma)
-        
-        # Correct transformation with proper rotation matrix
-        # This transformation ensures "forward" on the display corresponds to
-        # the drone's forward direction (Y-axis in CoppeliaSim)
-        # We need to invert the sign of dy to fix the backwards issue
-        dx = -dx_world * sin_yaw + dy_world * cos_yaw  # Left-right axis (X in display)
-        dy = -dx_world * cos_yaw - dy_world * sin_yaw   # Forward-back axis (Y in display)
-        dz = dz_world  # Keep the original Z difference for elevation
-
-        # Calculate normalized direction vector (unit vector)
-        if distance < 0.0001:  # Avoid division by near-zero
-            unit_vector = (0.0, 0.0, 0.0)
-        else:
-            unit_vector = (dx / distance, dy / distance, dz / distance)
+        # Get drone's orientation (Euler angles in radians); only yaw is used
+        gamma = SC.sim.getObjectOrientation(quad, -1)[2]
 
-        return unit_vector, distance
-        
+        # Rotate into the drone frame and normalize (JIT-compiled when available)
+        ux, uy, uz, distance = _rotate_and_norm(qx, qy, qz, vx, vy, vz, gamma)
+
+        return (ux, uy, uz), distance
+
+    except Exception as e:
+        logger.error("DepthCollector", f"Error calculating victim direction: {e}")
+        # Handles may be stale (e.g. objects recreated); re-resolve next call
+        invalidate_handle_cache()
+        return _ZERO_DIR, -1.0  # Return zero vector and invalid distance on error
+
+def capture_pose_and_victim():
+    """
+    Fetch the drone pose and victim-relative data in one consolidated pass.
+
+    Pulls the quadcopter position/orientation and the victim position once
+    (three RPC round-trips) and derives pose, drone-relative direction and
+    distance locally, instead of separate capture_pose /
+    capture_distance_to_victim / get_victim_direction calls that each
+    re-fetch the same simulator state.
+
+    Returns:
+        tuple: (pose, (ux, uy, uz), distance) - float32 (6,) pose array,
+               unit direction vector and Euclidean distance (-1.0 if no victim)
+    """
+    try:
+        quad = _get_cached_handle('/Quadcopter')
+        pos = SC.sim.getObjectPosition(quad, -1)
+        ori = SC.sim.getObjectOrientation(quad, -1)
+        pose = np.array([pos[0], pos[1], pos[2], ori[0], ori[1], ori[2]], dtype=np.float32)
+    except Exception as e:
+        logger.error("DepthCollector", f"Error capturing pose: {e}")
+        invalidate_handle_cache()
+        return np.zeros(6, dtype=np.float32), _ZERO_DIR, -1.0
+
+    try:
+        # Check if victim exists
+        try:
+            vic = _get_cached_handle('/Victim')
+        except Exception:
+            logger.debug_at_level(2, "DepthCollector", "No victim in scene, skipping direction calculation")
+            return pose, _ZERO_DIR, -1.0
+
+        vx, vy, vz = SC.sim.getObjectPosition(vic, -1)
+        ux, uy, uz, distance = _rotate_and_norm(pos[0], pos[1], pos[2], vx, vy, vz, ori[2])
+        return pose, (ux, uy, uz), distance
     except Exception as e:
         logger.error("DepthCollector", f"Error calculating victim direction: {e}")
-        return (0.0, 0.0, 0.0), -1.0  # Return zero vector and invalid distance on error
+        invalidate_handle_cache()
+        return pose, _ZERO_DIR, -1.0
 
 class DepthDatasetCollector:
     def __init__(self, sensor_handle,
@@ -113,6 +199,10 @@ class DepthDatasetCollector:
         # Get config for verbose flag, defaults to False for less noise
         config = get_default_config()
         self.verbose = config.get('verbose', False)
+
+        # Cached logging gates so hot-path debug calls cost one branch instead
+        # of eagerly formatting f-strings that debug_at_level then discards
+        self._refresh_debug_flags()
         
         # Define directories
         cwd = os.getcwd()
@@ -132,26 +222,63 @@ class DepthDatasetCollector:
         # Configure batch parameters
         self.batch_size = batch_size
         self.save_every_n_frames = save_every_n_frames
-        
-        # Create buffers for batch collection
-        self.depths = []  # Array of depth maps
-        self.poses = []   # Array of poses (position, orientation)
-        self.frames = []  # Frame indices
-        self.distances = []  # Distance to victim
-        self.actions = []    # Control actions taken
-        self.victim_dirs = []  # Direction to victim
+        self.num_writer_threads = 2  # Background writers (and spare buffer sets)
+        
+        # Preallocated SoA buffers for batch collection (filled by index, not
+        # append), allocated once the depth resolution is known. A small pool
+        # of buffer sets is ping-ponged: on flush the filled set is handed to a
+        # writer as-is (zero-copy) and capture continues into a free set.
+        self.buf_idx = 0
+        self.depths = None       # (batch_size, H, W) float16 depth maps
+        self.poses = None        # (batch_size, 6) float32 position + orientation
+        self.frames = None       # (batch_size,) int32 frame indices
+        self.distances = None    # (batch_size,) float32 distance to victim
+        self.actions = None      # (batch_size,) int8 control actions taken
+        self.victim_dirs = None  # (batch_size, 3) float32 direction to victim
+        self._soa_active = None
+        self._free_bufs = deque()
+        self._allocate_buffers()
         
         # Initialize counters and state
         self.global_frame_counter = 0
         self.global_batch_counter = 0
+        # Decrement-to-zero phase counters; cheaper than a modulo per tick on
+        # the frames (the vast majority) where nothing needs to happen
+        self._capture_phase = save_every_n_frames
+        self._visibility_phase = 50
+        self._log_phase = 100
+        # UI events are decimated: captures can outpace what the UI can render,
+        # so publish every N-th capture only, reusing the payload dicts in place
+        self._ui_event_phase = 5
+        self._ui_phase_left = 1
+        self._capture_event_payload = {'frame': 0, 'distance': 0.0, 'action': 0,
+                                       'victim_vec': (0.0, 0.0, 0.0), 'is_background_thread': False}
+        self._victim_event_payload = {'frame': 0, 'distance': 0.0,
+                                      'victim_vec': (0.0, 0.0, 0.0), 'is_background_thread': False}
         self.last_action_label = 8  # Default to hover (8)
         self.active = False  # Start inactive until scene is created
         self.shutdown_requested = False
-        
-        # Initialize save queue and start background thread
-        self.save_queue = queue.Queue()
-        self.saving_thread = threading.Thread(target=self._background_saver, daemon=True)
-        self.saving_thread.start()
+        # Target invisibility only needs re-applying after scene changes; the
+        # periodic 50-frame check remains as a safety net
+        self._target_invisibility_dirty = True
+        
+        # Initialize save ring and start background writer pool. A couple of
+        # writers keep multiple batch writes in flight so disk latency on one
+        # batch overlaps with serialization of the next instead of stalling it.
+        # The lock-free ring keeps the sim thread from contending with writers.
+        self.save_queue = RingBuffer(capacity=8)
+        self._counter_lock = threading.Lock()
+        # Counter persistence is throttled: rewrite the file every K batches
+        # (and at shutdown) instead of per batch, and only when it changed
+        self._last_persisted_counter = None
+        self._persist_every_k_batches = 10
+        self._last_scene_batch_checkpoint = None
+        self.saving_threads = []
+        for i in range(self.num_writer_threads):
+            t = threading.Thread(target=self._background_saver, daemon=True,
+                                 name=f"DepthCollectorSaver-{i}")
+            t.start()
+            self.saving_threads.append(t)
         
         # Load or find the latest batch number
         self._load_or_find_latest_batch_number()
@@ -163,6 +290,66 @@ class DepthDatasetCollector:
         self.logger.info("DepthCollector", f"Data collection is INACTIVE - waiting for scene creation to begin capturing")
         self.logger.debug_at_level(DEBUG_L2, "DepthCollector", f"Capture settings: batch_size={batch_size}, save_every_n_frames={save_every_n_frames}")
 
+    def _refresh_debug_flags(self):
+        """Cache whether L2/L3 debug logging is active (refreshed on config updates)"""
+        self._debug_l2_enabled = self.logger.verbose and self.logger.current_debug_level >= DEBUG_L2
+        self._debug_l3_enabled = self.logger.verbose and self.logger.current_debug_level >= DEBUG_L3
+
+    def _allocate_buffers(self, depth_shape=None):
+        """
+        Allocate the fixed-shape batch buffers as contiguous NumPy arrays.
+
+        Args:
+            depth_shape: (H, W) of the depth maps; if None, the sensor is probed once.
+                         Allocation is deferred to the first capture if probing fails.
+        """
+        if depth_shape is None:
+            try:
+                probe = capture_depth(self.sensor_handle)
+                if probe is not None and probe.shape != (1, 1):  # (1, 1) is the capture error fallback
+                    depth_shape = probe.shape
+            except Exception as e:
+                self.logger.debug_at_level(DEBUG_L2, "DepthCollector", f"Could not probe depth sensor resolution: {e}")
+
+        if depth_shape is None:
+            # Sensor not ready yet; buffers are allocated on the first real capture
+            return
+
+        # One buffer set per writer thread plus the one being filled, so a
+        # flush can always swap to a free set while writes are in flight
+        self._free_bufs = deque(self._make_soa(depth_shape)
+                                for _ in range(self.num_writer_threads))
+        self._install_buffer(self._make_soa(depth_shape))
+        self.logger.debug_at_level(DEBUG_L2, "DepthCollector", f"Preallocated {self.num_writer_threads + 1} batch buffer sets for {self.batch_size} frames of {depth_shape} depth maps")
+
+    def _make_soa(self, depth_shape):
+        """Allocate one structure-of-arrays buffer set for batch_size frames"""
+        return {
+            # Depths are buffered as float16: normalized sensor depth does not need a
+            # 23-bit mantissa, and halving bytes halves both flush and disk cost
+            'depths': np.empty((self.batch_size,) + tuple(depth_shape), dtype=np.float16),
+            'poses': np.empty((self.batch_size, 6), dtype=np.float32),
+            'frames': np.empty(self.batch_size, dtype=np.int32),
+            'distances': np.empty(self.batch_size, dtype=np.float32),
+            'actions': np.empty(self.batch_size, dtype=np.int8),
+            'victim_dirs': np.empty((self.batch_size, 3), dtype=np.float32),
+        }
+
+    def _install_buffer(self, soa):
+        """Make the given SoA buffer set the active capture target"""
+        self._soa_active = soa
+        self.depths = soa['depths']
+        self.poses = soa['poses']
+        self.frames = soa['frames']
+        self.distances = soa['distances']
+        self.actions = soa['actions']
+        self.victim_dirs = soa['victim_dirs']
+        self.buf_idx = 0
+
+    def _reset_buffers(self):
+        """Discard any buffered frames by rewinding the write index (no reallocation)"""
+        self.buf_idx = 0
+
     def _setup_folders(self):
         """Set up the dataset directories"""
         for folder in [self.base_folder, self.train_folder, self.val_folder, self.test_folder, self.config_folder]:
@@ -178,7 +365,7 @@ class DepthDatasetCollector:
                 self.logger.debug_at_level(DEBUG_L1, "DepthCollector", f"Changing base directory to: {new_base_dir}")
             
             # First, flush any existing data
-            if self.depths:
+            if self.buf_idx > 0:
                 self._flush_buffer()
             
             # Update all directory paths
@@ -219,17 +406,16 @@ class DepthDatasetCollector:
         
     def _on_scene_completed(self, _):
         """Handle scene creation completion event"""
-        # Clear any existing data
-        self.depths.clear()
-        self.poses.clear()
-        self.frames.clear()
-        self.distances.clear()
-        self.actions.clear()
-        self.victim_dirs.clear()
-        
-        # Reset frame counter
+        # Discard any existing buffered data and stale object handles
+        self._reset_buffers()
+        invalidate_handle_cache()
+        self._target_invisibility_dirty = True
+
+        # Reset frame counter and phase counters
         self.global_frame_counter = 0
-        
+        self._capture_phase = self.save_every_n_frames
+        self._visibility_phase = 50
+
         # Activate data collection
         self.active = True
         self.logger.info("DepthCollector", "Scene creation completed. Activating data capture.")
@@ -244,14 +430,10 @@ class DepthDatasetCollector:
         """Handle scene cleared event by deactivating data collection"""
         self.active = False
         self.logger.info("DepthCollector", "Scene cleared, deactivating data collection")
-        
-        # Clear any pending data
-        self.depths.clear()
-        self.poses.clear()
-        self.frames.clear()
-        self.distances.clear()
-        self.actions.clear()
-        self.victim_dirs.clear()
+
+        # Discard any pending buffered data and stale object handles
+        self._reset_buffers()
+        invalidate_handle_cache()
         
     def capture(self):
         """Manually trigger a data capture"""
@@ -261,82 +443,92 @@ class DepthDatasetCollector:
         """Handle simulation frame events for data capture"""
         # Increment global frame counter
         self.global_frame_counter += 1
-        
+
         # If not active for capturing, return immediately
         if not self.active:
-            if self.global_frame_counter % 100 == 0:  # Log only occasionally to avoid spam
-                self.logger.debug_at_level(DEBUG_L2, "DepthCollector", 
-                                          f"Skipping data capture (frame {self.global_frame_counter}) - waiting for scene creation")
+            self._log_phase -= 1
+            if self._log_phase <= 0:  # Log only occasionally to avoid spam
+                self._log_phase = 100
+                if self._debug_l2_enabled:
+                    self.logger.debug_at_level(DEBUG_L2, "DepthCollector",
+                                              f"Skipping data capture (frame {self.global_frame_counter}) - waiting for scene creation")
             return
-        
+
         # Check target visibility periodically (every 50 frames)
-        if self.global_frame_counter % 50 == 0:
+        self._visibility_phase -= 1
+        if self._visibility_phase <= 0:
+            self._visibility_phase = 50
             _ensure_target_invisible()  # Re-apply invisibility settings
             check_target_visibility()   # Log the current visibility status
-        
+
         # Skip frames for data capture
-        if self.global_frame_counter % self.save_every_n_frames != 0:
+        self._capture_phase -= 1
+        if self._capture_phase > 0:
             return
-
-        # Ensure target is invisible before any data capture - critical for data quality!
-        _ensure_target_invisible()
-
-        # Calculate distance to victim
-        distance = capture_distance_to_victim()
-        victim_dir = (0.0, 0.0, 0.0)
-        
-        # Only attempt to calculate victim direction if we have a valid distance
-        if distance > 0:
-            # Calculate normalized direction to victim
-            try:
-                victim_dir, victim_dist = get_victim_direction()
-                
-                # Only override distance if the one from get_victim_direction is valid
-                if victim_dist > 0:
-                    distance = victim_dist
-                    
-                    # Publish victim detected event for UI updates
-                    # This will update the victim indicator in the UI
-                    EM.publish(VICTIM_DETECTED, {
-                        'frame': self.global_frame_counter,
-                        'distance': victim_dist,
-                        'victim_vec': victim_dir,
-                        'is_background_thread': False
-                    })
-            except Exception as e:
-                self.logger.error("DepthCollector", f"Error getting victim direction: {e}")
-                victim_dir = (0.0, 0.0, 0.0)
+        self._capture_phase = self.save_every_n_frames
+
+        # Decide whether this capture also refreshes the UI (decimated publish)
+        self._ui_phase_left -= 1
+        publish_ui = self._ui_phase_left <= 0
+        if publish_ui:
+            self._ui_phase_left = self._ui_event_phase
+
+        # Ensure target is invisible before data capture - critical for data
+        # quality! Only re-applied after a scene change (idempotent RPC
+        # otherwise); the periodic check above catches anything unexpected.
+        if self._target_invisibility_dirty:
+            _ensure_target_invisible()
+            self._target_invisibility_dirty = False
+
+        # Consolidated fetch: drone pose plus victim direction/distance in
+        # three RPC round-trips instead of separate capture calls
+        pose, victim_dir, distance = capture_pose_and_victim()
+
+        # Publish victim detected event for UI updates (decimated)
+        # This will update the victim indicator in the UI
+        if distance > 0 and publish_ui:
+            payload = self._victim_event_payload
+            payload['frame'] = self.global_frame_counter
+            payload['distance'] = distance
+            payload['victim_vec'] = victim_dir
+            EM.publish(VICTIM_DETECTED, payload)
 
         # Log the current action label before capture for debugging
-        self.logger.debug_at_level(DEBUG_L2, "DepthCollector", f"Frame {self.global_frame_counter}: Capturing with action label {self.last_action_label}")
+        if self._debug_l2_enabled:
+            self.logger.debug_at_level(DEBUG_L2, "DepthCollector", f"Frame {self.global_frame_counter}: Capturing with action label {self.last_action_label}")
 
-        # Capture depth and pose data
+        # Capture depth data
         depth_array = capture_depth(self.sensor_handle)
-        pose = capture_pose()
 
-        # Add data to buffers
+        # Store data into the preallocated buffers by index
         if depth_array is not None:
-            self.depths.append(depth_array)
-            self.poses.append(pose)
-            self.frames.append(self.global_frame_counter)
-            self.distances.append(distance)
-            self.actions.append(self.last_action_label)
-            self.victim_dirs.append(victim_dir)
-
-        # publish capture complete event with thread safety info
-        try:
-            EM.publish(DATASET_CAPTURE_COMPLETE, {
-                'frame': self.global_frame_counter,
-                'distance': distance,
-                'action': self.last_action_label,
-                'victim_vec': victim_dir,
-                'is_background_thread': False  # Main simulation thread
-            })
-        except Exception as e:
-            self.logger.error("DepthCollector", f"Error publishing capture event: {e}")
+            if self.depths is None or self.depths.shape[1:] != depth_array.shape:
+                # First capture (or sensor resolution changed): (re)allocate buffers
+                self._allocate_buffers(depth_array.shape)
+            idx = self.buf_idx
+            self.depths[idx] = depth_array
+            self.poses[idx] = pose
+            self.frames[idx] = self.global_frame_counter
+            self.distances[idx] = distance
+            self.actions[idx] = self.last_action_label
+            self.victim_dirs[idx] = victim_dir
+            self.buf_idx = idx + 1
+
+        # publish capture complete event with thread safety info (decimated,
+        # payload dict reused in place to avoid a per-capture allocation)
+        if publish_ui:
+            try:
+                payload = self._capture_event_payload
+                payload['frame'] = self.global_frame_counter
+                payload['distance'] = distance
+                payload['action'] = self.last_action_label
+                payload['victim_vec'] = victim_dir
+                EM.publish(DATASET_CAPTURE_COMPLETE, payload)
+            except Exception as e:
+                self.logger.error("DepthCollector", f"Error publishing capture event: {e}")
 
         # flush if batch full
-        if len(self.depths) >= self.batch_size:
+        if self.buf_idx >= self.batch_size:
             self._flush_buffer()
 
     def shutdown(self):
@@ -359,29 +551,35 @@ class DepthDatasetCollector:
             self.logger.error("DepthCollector", f"Error unsubscribing from events: {e}")
         
         # Flush any remaining data
-        if self.depths:
+        if self.buf_idx > 0:
             try:
                 self._flush_buffer()
                 self.logger.debug_at_level(DEBUG_L1, "DepthCollector", "Buffer flushed during shutdown")
             except Exception as e:
                 self.logger.error("DepthCollector", f"Error flushing buffer during shutdown: {e}")
                 
-        # Wait for background thread to finish
+        # Wait for background writer threads to finish
         try:
-            # Put None in the queue to signal end
-            self.save_queue.put(None)
-            
-            # Wait for a short time for the thread to finish
-            if hasattr(self, 'saving_thread') and self.saving_thread.is_alive():
-                self.saving_thread.join(timeout=2.0)
-                if self.saving_thread.is_alive():
-                    self.logger.warning("DepthCollector", "Background saving thread did not finish in time")
+            # Put one None per writer in the queue to signal end
+            for _ in self.saving_threads:
+                self.save_queue.push(None)
+
+            # Wait for a short time for the threads to finish
+            for t in self.saving_threads:
+                if t.is_alive():
+                    t.join(timeout=2.0)
+                    if t.is_alive():
+                        self.logger.warning("DepthCollector", f"Background saving thread {t.name} did not finish in time")
         except Exception as e:
-            self.logger.error("DepthCollector", f"Error waiting for background thread: {e}")
-            
+            self.logger.error("DepthCollector", f"Error waiting for background threads: {e}")
+
+        # Persist the final batch counter (writes are throttled during capture)
+        self._save_batch_counter(force=True)
+
         self.logger.info("DepthCollector", "Depth dataset collector shutdown complete")
 
     def _safe_stack(self, name, arr_list, dtype=None):
+        """Fallback stacker for ragged per-frame data (not used on the preallocated hot path)"""
         try:
             return np.stack(arr_list)
         except Exception as e:
@@ -396,37 +594,39 @@ class DepthDatasetCollector:
 
     def _flush_buffer(self):
         """Flush the current batch to disk"""
-        if not self.depths:
+        if self.buf_idx == 0 or self.depths is None:
             return  # Don't attempt to save empty batch
-            
+
         # Determine destination folder based on ratios
         split = self._select_split()
 
-        # Stack arrays safely with fallback
+        # Hand the filled buffer set to a writer as-is (zero-copy views of the
+        # filled prefix) and swap in a free set for capture to continue into.
+        # If every set is in flight the fields are copied instead - rare, and
+        # only when the disk is badly behind.
         try:
-            batch = {
-                'depths': self._safe_stack('depths', self.depths),
-                'poses': self._safe_stack('poses', self.poses),
-                'frames': self._safe_stack('frames', self.frames),
-                'distances': self._safe_stack('distances', self.distances),
-                'actions': self._safe_stack('actions', self.actions),
-                'victim_dirs': self._safe_stack('victim_dirs', self.victim_dirs),
-                'split': split
-            }
-            
+            n = self.buf_idx
+            soa = self._soa_active
+            try:
+                next_buf = self._free_bufs.popleft()
+            except IndexError:
+                next_buf = None
+
+            if next_buf is not None:
+                batch = {key: arr[:n] for key, arr in soa.items()}
+                batch['split'] = split
+                batch['_soa'] = soa  # Returned to the free pool after writing
+                self._install_buffer(next_buf)
+            else:
+                batch = {key: arr[:n].copy() for key, arr in soa.items()}
+                batch['split'] = split
+                self.buf_idx = 0
+
             # Add to save queue
-            self.save_queue.put(batch)
-            
-            self.logger.debug_at_level(DEBUG_L1, "DepthCollector", f"Queued batch with {len(self.depths)} frames for saving.")
-            
-            # Clear in-memory batch
-            self.depths.clear()
-            self.poses.clear()
-            self.frames.clear()
-            self.distances.clear()
-            self.actions.clear()
-            self.victim_dirs.clear()
-            
+            self.save_queue.push(batch)
+
+            self.logger.debug_at_level(DEBUG_L1, "DepthCollector", f"Queued batch with {n} frames for saving.")
+
         except Exception as e:
             self.logger.error("DepthCollector", f"Error preparing batch for saving: {e}")
 
@@ -435,16 +635,15 @@ class DepthDatasetCollector:
         self.logger.info("DepthCollector", "Background saving thread started")
         while not self.shutdown_requested:
             try:
-                batch = self.save_queue.get(timeout=1.0)
-                
+                batch = self.save_queue.pop(timeout=1.0)
+
                 # Check for shutdown signal
                 if batch is None:
                     self.logger.debug_at_level(DEBUG_L1, "DepthCollector", "Received shutdown signal in background saver")
                     break
-                
+
                 self._save_batch(batch)
-                self.save_queue.task_done()
-            except queue.Empty:
+            except Empty:
                 # Timeout is expected, just continue the loop
                 continue
             except Exception as e:
@@ -456,84 +655,113 @@ class DepthDatasetCollector:
         """
         Determines the latest batch number by:
         1. Checking if batch_counter.txt exists and reading it
-        2. If not, scanning all directories for batch_*.npz files and finding the highest number
+        2. If not, scanning all directories for batch_* entries and finding the highest number
         """
         counter_file = os.path.join(self.base_folder, "batch_counter.txt")
+        persisted = 0
         try:
             # First try to load from counter file
             if os.path.exists(counter_file):
                 with open(counter_file, "r") as f:
-                    self.global_batch_counter = int(f.read().strip())
+                    persisted = int(f.read().strip())
                     if self.verbose:
-                        self.logger.debug_at_level(DEBUG_L1, "DepthCollector", 
-                                                f"Loaded batch counter: {self.global_batch_counter}")
-                    return
+                        self.logger.debug_at_level(DEBUG_L1, "DepthCollector",
+                                                f"Loaded batch counter: {persisted}")
         except Exception as e:
             self.logger.warning("DepthCollector", f"Could not read batch counter file: {e}")
-        
-        # If we get here, we need to scan directories
-        self.global_batch_counter = self._find_latest_batch_number()
-        self._save_batch_counter()  # Save it for next time
+
+        # Take the max of the persisted counter and an on-disk scan; counter
+        # persistence is throttled, so the file may lag the actual batches
+        scanned = self._find_latest_batch_number()
+        self.global_batch_counter = max(persisted, scanned)
+        self._last_persisted_counter = persisted if persisted == self.global_batch_counter else None
+        if self._last_persisted_counter is None:
+            self._save_batch_counter(force=True)  # Save it for next time
         if self.verbose:
-            self.logger.debug_at_level(DEBUG_L1, "DepthCollector", 
-                                    f"Found latest batch number from files: {self.global_batch_counter}")
+            self.logger.debug_at_level(DEBUG_L1, "DepthCollector",
+                                    f"Latest batch number: {self.global_batch_counter} (file: {persisted}, scan: {scanned})")
 
     def _find_latest_batch_number(self):
         """
-        Scans all split directories for batch_*.npz files and returns the highest batch number found.
+        Scans all split directories for batch_* entries (legacy .npz files or
+        .npy batch directories) and returns the highest batch number found.
         Returns 0 if no batch files are found.
         """
-        import glob
-        import re
-        
         highest_batch = 0
-        batch_pattern = re.compile(r'batch_(\d+)\.npz$')
-        
-        # Check all split directories
+
+        # One os.scandir pass per split directory; the batch_N / batch_N.npz
+        # names are simple enough to slice without glob's fnmatch or a regex
         for split_dir in [self.train_folder, self.val_folder, self.test_folder]:
-            if not os.path.exists(split_dir):
+            try:
+                with os.scandir(split_dir) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if not name.startswith('batch_'):
+                            continue
+                        if name.endswith('.npz'):
+                            name = name[:-4]
+                        num = name[6:]
+                        if num.isdigit():
+                            batch_num = int(num)
+                            if batch_num > highest_batch:
+                                highest_batch = batch_num
+            except FileNotFoundError:
                 continue
-                
-            # Find all batch_*.npz files
-            batch_files = glob.glob(os.path.join(split_dir, "batch_*.npz"))
-            
-            for file in batch_files:
-                # Extract batch number from filename
-                match = batch_pattern.search(file)
-                if match:
-                    batch_num = int(match.group(1))
-                    highest_batch = max(highest_batch, batch_num)
-        
+
         return highest_batch
 
-    def _save_batch_counter(self):
-        """Save the current batch counter to a file"""
+    def _save_batch_counter(self, force=False):
+        """
+        Persist the current batch counter, throttled and atomic.
+
+        The file is rewritten via a temp-file + os.replace so a crash never
+        leaves it truncated, skipped when the value is unchanged, and (unless
+        force=True) only flushed every _persist_every_k_batches batches to
+        keep metadata-journal traffic off the save hot path. Startup takes the
+        max of the persisted counter and an on-disk scan, so a throttled
+        (stale-low) value can never cause existing batches to be overwritten.
+        """
+        counter = self.global_batch_counter
+        if counter == self._last_persisted_counter:
+            return
+        if not force and counter % self._persist_every_k_batches != 0:
+            return
         counter_file = os.path.join(self.base_folder, "batch_counter.txt")
         try:
-            with open(counter_file, "w") as f:
-                f.write(str(self.global_batch_counter))
+            tmp_file = counter_file + ".tmp"
+            with open(tmp_file, "w") as f:
+                f.write(str(counter))
+            os.replace(tmp_file, counter_file)
+            self._last_persisted_counter = counter
         except Exception as e:
             self.logger.warning("DepthCollector", f"Could not save batch counter: {e}")
 
     def _save_batch(self, batch):
-        """Save a batch of data as NPZ file"""
+        """Save a batch of data as a directory of uncompressed .npy files"""
         try:
             depths = batch['depths']
             split = batch['split']
-            # Use global batch counter for naming
-            self.global_batch_counter += 1
-            self._save_batch_counter()
-            batch_id = self.global_batch_counter
+            # Use global batch counter for naming (lock: several writers run concurrently)
+            with self._counter_lock:
+                self.global_batch_counter += 1
+                batch_id = self.global_batch_counter
+                self._save_batch_counter()
             if split == 'train':
                 folder = self.train_folder
             elif split == 'val':
                 folder = self.val_folder
             else:
                 folder = self.test_folder
-            filename = f"batch_{batch_id:06d}.npz"
+            filename = f"batch_{batch_id:06d}"
             filepath = os.path.join(folder, filename)
-            save_batch_npz(filepath, batch)
-            total_saved = self.global_batch_counter
+            save_batch_npy_dir(filepath, batch)
+            total_saved = batch_id
+
+            # Return the buffer set to the free pool now that its bytes are on
+            # disk (unless the pool was reallocated for a new resolution)
+            soa = batch.get('_soa')
+            if soa is not None and self.depths is not None and soa['depths'].shape == self.depths.shape:
+                self._free_bufs.append(soa)
             # Publish event for UI update
             try:
                 EM.publish(DATASET_BATCH_SAVED, {
@@ -553,7 +781,8 @@ class DepthDatasetCollector:
             
     def _select_split(self):
         """Select train/val/test split probabilistically"""
-        p = np.random.random()
+        # stdlib RNG: a single draw avoids NumPy's global RNG state/locking
+        p = random.random()
         if p < self.train_ratio:
             return 'train'
         elif p < self.train_ratio + self.val_ratio:
@@ -569,7 +798,8 @@ class DepthDatasetCollector:
             # Only update last_action_label if non-hover or if hover is explicitly set from no movement
             if action_label != 8 or (abs(dx) < 0.05 and abs(dy) < 0.05 and abs(dz) < 0.05):
                 self.last_action_label = action_label
-                self.logger.debug_at_level(DEBUG_L3, "DepthCollector", f"Action label updated: {action_label}")
+                if self._debug_l3_enabled:
+                    self.logger.debug_at_level(DEBUG_L3, "DepthCollector", f"Action label updated: {action_label}")
         else:
             # Fallback for backward compatibility
             dx, dy, dz = delta
@@ -584,7 +814,8 @@ class DepthDatasetCollector:
                     self.last_action_label = 2 if dy > 0 else 3  # Forward/Back
                 else:
                     self.last_action_label = 4 if dz > 0 else 5  # Up/Down
-                self.logger.debug_at_level(DEBUG_L3, "DepthCollector", f"Action label updated (fallback): {self.last_action_label}")
+                if self._debug_l3_enabled:
+                    self.logger.debug_at_level(DEBUG_L3, "DepthCollector", f"Action label updated (fallback): {self.last_action_label}")
                 
     def _on_rotate(self, delta):
         """Handle rotation commands to track last action"""
@@ -594,12 +825,14 @@ class DepthDatasetCollector:
             # Only update last_action_label if it's rotation (6,7) or if explicitly hover with no rotation
             if action_label in (6, 7) or (action_label == 8 and abs(delta_val) < 0.01):
                 self.last_action_label = action_label
-                self.logger.debug_at_level(DEBUG_L3, "DepthCollector", f"Rotation action label updated: {action_label}")
+                if self._debug_l3_enabled:
+                    self.logger.debug_at_level(DEBUG_L3, "DepthCollector", f"Rotation action label updated: {action_label}")
         else:
             # Fallback for backward compatibility
             if abs(delta) > 0.01:
                 self.last_action_label = 6 if delta > 0 else 7  # Turn Right/Left
-                self.logger.debug_at_level(DEBUG_L3, "DepthCollector", f"Rotation action label updated (fallback): {self.last_action_label}")
+                if self._debug_l3_enabled:
+                    self.logger.debug_at_level(DEBUG_L3, "DepthCollector", f"Rotation action label updated (fallback): {self.last_action_label}")
             elif self.last_action_label not in (0, 1, 2, 3, 4, 5):  # Don't override movement with hover
                 self.last_action_label = 8  # Hover / No rotation
 
@@ -608,6 +841,7 @@ class DepthDatasetCollector:
         # Update verbose flag when configuration changes
         config = get_default_config()
         self.verbose = config.get('verbose', False)
+        self._refresh_debug_flags()
 
     def save_config_to_json(self, config, custom_name=None):
         """
@@ -659,13 +893,20 @@ class DepthDatasetCollector:
         Saves the current batch number to a file when a new scene is created.
         This allows tracking which batch numbers correspond to which scene creation events.
         """
+        # Skip the write when the value is unchanged
+        if self.global_batch_counter == self._last_scene_batch_checkpoint:
+            return
+
         scene_batch_file = os.path.join(self.base_folder, "scene_batch_number.txt")
-        
+
         try:
-            # Simply write the current batch number to the file
-            with open(scene_batch_file, "w") as f:
+            # Write atomically via temp file + rename
+            tmp_file = scene_batch_file + ".tmp"
+            with open(tmp_file, "w") as f:
                 f.write(str(self.global_batch_counter))
-                
+            os.replace(tmp_file, scene_batch_file)
+            self._last_scene_batch_checkpoint = self.global_batch_counter
+
             self.logger.info("DepthCollector", f"Scene batch number saved: {self.global_batch_counter}")
         except Exception as e:
             self.logger.warning("DepthCollector", f"Could not save scene batch number: {e}")
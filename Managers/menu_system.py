@@ -19,29 +19,483 @@ SC = SimConnection.get_instance()
 from Core.event_manager import EventManager
 EM = EventManager.get_instance()
 
+# O(1) field lookup for config updates instead of scanning FIELDS per key
+_FIELD_INDEX = {f['key']: f for f in FIELDS}
+
+# Config tab partitions of FIELDS are constant, so they are computed once
+# at import instead of refiltering on every tab build
+_ENV_KEYS = frozenset(('num_rocks', 'num_bushes', 'num_foliage'))
+_SIM_EXCLUDE = frozenset((
+    'num_rocks', 'num_bushes', 'num_foliage',
+    'num_birds', 'num_falling_trees', 'tree_spawn_interval',
+    'num_trees', 'rc_sensitivity', 'bird_speed',
+))
+_ENV_FIELDS = tuple(f for f in FIELDS if f['key'] in _ENV_KEYS)
+_SIM_FIELDS = tuple(f for f in FIELDS if f['key'] not in _SIM_EXCLUDE)
+
+# Config-load preview categorization: frozen key sets give O(1) membership
+# tests and the display-name map is built once instead of per section
+_PREVIEW_RC_KEYS = frozenset((
+    'rc_sensitivity', 'rc_deadzone', 'rc_yaw_sensitivity',
+    'single_axis_mode', 'rc_mappings',
+))
+_PREVIEW_MOVEMENT_KEYS = frozenset(('move_step', 'rotate_step_deg'))
+_PREVIEW_ENV_KEYS = frozenset((
+    'num_trees', 'num_rocks', 'num_bushes', 'num_birds',
+    'num_falling_trees', 'num_foliage', 'area_size',
+    'tree_spawn_interval', 'bird_speed',
+))
+
+# One dict lookup per key replaces the membership-test chain when
+# categorizing a loaded config; unknown keys fall back to "Other Settings"
+_PREVIEW_KEY_TO_SECTION = MappingProxyType({
+    key: section
+    for section, keys in (
+        ("RC Controller Settings", _PREVIEW_RC_KEYS),
+        ("Movement Settings", _PREVIEW_MOVEMENT_KEYS),
+        ("Environment Settings", _PREVIEW_ENV_KEYS),
+    )
+    for key in keys
+})
+
+# Mapping of raw settings to human-readable names
+_SETTING_NAMES = MappingProxyType({
+    # RC Settings
+    "rc_sensitivity": "RC Sensitivity",
+    "rc_deadzone": "RC Deadzone",
+    "rc_yaw_sensitivity": "RC Yaw Sensitivity",
+    "rc_mappings": "RC Control Mappings",
+    "single_axis_mode": "Single-Axis Mode",
+
+    # Movement Settings
+    "move_step": "Movement Speed",
+    "rotate_step_deg": "Rotation Speed",
+
+    # Environment Settings
+    "num_trees": "Static Trees",
+    "num_rocks": "Rocks",
+    "num_bushes": "Bushes",
+    "num_foliage": "Foliage",
+    "num_birds": "Birds",
+    "tree_spawn_interval": "Tree Spawn Interval (s)",
+    "num_falling_trees": "Falling Trees",
+    "area_size": "Area Size",
+    "bird_speed": "Bird Speed",
+})
+
+# Keyboard control tables are constant, so they live once at module scope
+# (read-only via MappingProxyType) instead of being rebuilt per instance
+_KEY_DIRECTION_MAP = MappingProxyType({
+    'w': ('forward', 1),
+    's': ('forward', -1),
+    'a': ('sideward', -1),
+    'd': ('sideward', 1),
+    'space': ('upward', 1),  # Use 'space' instead of ' ' for Tkinter
+    'z': ('upward', -1),
+    'q': ('yaw', 1),
+    'e': ('yaw', -1),
+})
+
+_KNOWN_KEYSYMS = MappingProxyType({
+    'space': 'space',
+    'w': 'w', 'a': 'a', 's': 's', 'd': 'd',
+    'z': 'z', 'q': 'q', 'e': 'e',
+    'W': 'w', 'A': 'a', 'S': 's', 'D': 'd',
+    'Z': 'z', 'Q': 'q', 'E': 'e',
+})
+
+# Bit assigned to each movement key; pressed keys are tracked as an
+# 8-bit mask so the hot path can resolve movement with one LUT lookup
+_KEY_BITS = MappingProxyType({
+    'w': 1, 's': 2, 'a': 4, 'd': 8,
+    'space': 16, 'z': 32, 'q': 64, 'e': 128,
+})
+
+# Config tab rows that are laid out by hand rather than straight from
+# FIELDS: (key, label, type, bold, default)
+_DYNAMIC_ROWS = (
+    ("num_falling_trees", "Number of Falling Trees:", int, True, 5),
+    ("tree_spawn_interval", "Tree Spawn Interval (s):", float, False, 30.0),
+    ("num_birds", "Number of Birds:", int, True, 10),
+    ("bird_speed", "Bird Movement Speed:", float, True, 1.0),
+    ("keep_fallen_trees", "Keep Fallen Trees:", bool, True, False),
+)
+_STATIC_TREES_ROW = ("num_trees", "Number of Static Trees:", int, True, 0)
+
+# Help tab content: (section title, body text). Static data shared at
+# module level; the builder just loops over it
+_HELP_SECTIONS = (
+    ("Version Information", """
+• Version: HyperDrive Pathway v1.4.0B
+• Build: 21.05.2025
+"""),
+    ("Scene Tab", """
+• Scene Creation Controls:
+  - Create Environment: Generates a new disaster simulation environment with all configured objects
+  - Clear Environment: Removes all objects from the current scene
+  - Cancel Creating Environment: Stops the environment creation process if in progress
+  - Progress bar shows creation status with category and element counts
+
+• Scene Configuration:
+  - Scene settings are controlled in the Config tab
+  - Dynamic objects like birds and falling trees can be adjusted during runtime
+"""),
+    ("Controls Tab", """
+• Movement Mode:
+  - Single-Axis Movement: Toggle between multi-directional and single-axis movement
+  - When enabled, restricts movement to one axis at a time
+  - Only the axis with the largest input will be active, all others will be disabled
+  - For example, if you use pitch control, all other controls will be disabled until you release it
+
+• Keyboard Controls:
+  - Movement Speed: Adjust how quickly the drone moves with keyboard input
+  - Rotation Speed: Adjust how quickly the drone rotates with keyboard input
+  - Apply Keyboard Settings: Save changes to keyboard control settings
+
+• RC Controller Settings:
+  - Sensitivity: Adjust overall controller sensitivity (range 0.1-20.0)
+  - Deadzone: Set minimum input threshold to prevent drift
+  - Yaw Sensitivity: Set specific sensitivity for rotation control
+  - Axis Mapping: Configure which joystick axes control which movements
+  - Invert Controls: Toggle direction inversion for each axis
+  - Test Controls: View real-time input values from the controller with visual joystick representation
+  - RC Mapping Wizard: Visual interface for mapping controller axes with real-time feedback
+"""),
+    ("Config Tab", """
+• Dynamic Objects:
+  - Number of Birds: Controls how many birds appear in the scene
+  - Bird Movement Speed: Sets how fast birds fly (0.1-5.0)
+  - Number of Falling Trees: Sets how many trees will randomly fall
+  - Tree Spawn Interval: Time between tree spawns (in seconds)
+  - Keep Fallen Trees: Select whether trees remain on ground after falling or are removed
+  - Note: Birds and falling trees are managed separately
+
+• Environment Settings:
+  - Number of Static Trees: Sets the number of non-falling trees
+  - Number of Rocks: Controls how many rock formations appear
+  - Number of Bushes: Sets the amount of bush clusters
+  - Number of Foliage: Controls ground vegetation density
+  - Area Size: Sets the overall simulation area dimensions
+
+• Simulation Settings:
+  - Victim Count: Number of victims to place in the scene
+  - Drone Speed: Maximum velocity of the drone
+  - Move Step: Distance increment per movement command
+  - Rotate Step: Angle increment per rotation command
+  - Enable Collisions: Toggle collision detection
+  - Enable Physics: Toggle physics simulation
+  - Apply Changes: Save all configuration changes
+
+• Save/Load Settings:
+  - Save Settings: Save your current configuration to a file with custom name and location
+                   (Default location is Config folder, same as rc_mapping.json and rc_settings.json)
+  - Load Settings: Load previously saved configurations
+"""),
+    ("Status Tab", """
+• Control Status: Shows whether keyboard controls are active
+  - Green: UI control active and ready for keyboard input
+  - Red: UI control inactive (click window to activate)
+
+• Victim Detection:
+  - Distance: Shows how far the victim is from the drone
+  - Elevation: Indicates height difference between drone and victim
+  - Direction: Visual indicator showing victim's location
+  - Signal Strength: Bar showing signal quality:
+    > Green: Strong signal (close proximity)
+    > Yellow: Moderate signal
+    > Orange: Weak signal
+    > Red: Very weak signal (far distance)
+
+• HUD-style radar display shows victim location relative to drone
+"""),
+    ("Monitor Tab", """
+• Performance Monitoring Toggle:
+  - Enable/disable real-time performance tracking
+  - When disabled, conserves CPU resources
+
+• System Information:
+  - OS Version: Shows operating system version
+  - Python Version: Shows Python interpreter version
+  - CPU Cores: Number of processor cores available
+
+• Performance Metrics:
+  - FPS: Frames per second of the application
+  - Memory Usage: Application memory consumption in MB
+  - Memory %: Percentage of system memory in use
+  - CPU Usage: Processor utilization percentage
+  - CPU Frequency: Current processor clock speed
+  - Active Threads: Number of running threads
+
+• Simulation Statistics:
+  - Total Objects: Count of all objects in the scene
+  - Individual counts for birds, trees, rocks, bushes, and foliage
+
+• Runtime Statistics:
+  - Uptime: Duration the application has been running
+"""),
+    ("Dataset Tab", """
+• Dataset Directory:
+  - View current dataset storage location
+  - Select Directory: Change the directory where captures are saved
+  - Uses timestamped subfolders for organization
+
+• Batch Information:
+  - Current Batch: Displays the latest batch number that was created
+  - Scene Batch: Shows the batch number when the current scene was created
+  - Refresh Batch Information: Updates the displayed batch numbers
+  - Remove Batches From Current Scene: Deletes all batches created after the scene batch number
+
+• Dataset Collection:
+  - Automatically captures depth images during simulation
+  - Organizes data into train/val/test splits
+  - Stores depth maps, poses, and victim direction vectors
+  - Includes distance-to-victim measurements
+
+• Tools:
+  - Open Depth Image Viewer: Launch a tool to examine and manipulate captured depth images
+"""),
+    ("Logging Tab", """
+• Log Level:
+  - DEBUG: Shows all messages including detailed debugging
+  - INFO: Shows information, warnings, and errors
+  - WARNING: Shows only warnings and errors
+  - ERROR: Shows only errors
+  - CRITICAL: Shows only critical errors
+
+• Debug Verbosity:
+  - L1 (Basic): High-level information and important events
+  - L2 (Medium): Detailed operations and parameters
+  - L3 (Verbose): All events including frequent updates
+
+• File Logging:
+  - Enable/disable logging to file
+  - Open logs directory to view saved logs
+  - Logs are stored with timestamps for reference
+
+• Verbose Mode:
+  - Enable for maximum detail in debugging
+  - Affects console output and file logging
+"""),
+    ("Keyboard Controls", """
+• Movement Controls:
+  - W: Move forward
+  - S: Move backward
+  - A: Move left
+  - D: Move right
+  - Space: Move up
+  - Z: Move down
+  - Q: Rotate counterclockwise
+  - E: Rotate clockwise
+
+• Movement Modes:
+  - Multi-directional: Default mode allowing movement in multiple directions at once
+  - Single-axis: Restricts movement to one axis at a time:
+    * Only the axis with the largest input will be active
+    * All other axes will be disabled until you release the active axis
+    * This creates clean, isolated movements for dataset collection
+"""),
+    ("RC Joystick Controls", """
+• Controller Setup:
+  - Connect your joystick to the computer before starting the application
+  - Select RC Controller at startup when prompted
+  - Configure mappings in the Controls tab if needed
+
+• Default Mappings:
+  - Left stick X: Yaw (rotation)
+  - Left stick Y: Throttle (up/down movement)
+  - Right stick X: Roll (left/right movement)
+  - Right stick Y: Pitch (forward/backward movement)
+
+• Sensitivity Settings:
+  - Main sensitivity (0.1-20.0): Adjusts overall responsiveness
+  - Deadzone: Prevents drift when sticks are near center
+  - Yaw sensitivity: Specifically adjusts rotation speed
+
+• Visual Feedback:
+  - Test window shows real-time joystick position with visual representations
+  - Pitch/Roll visualizer shows forward/backward and left/right movement
+  - Throttle/Yaw visualizer shows up/down movement and rotation
+  - Progress bars show raw axis values for all detected joystick axes
+"""),
+    ("Keyboard Shortcuts", """
+• General Shortcuts:
+  - Enter: Apply changes in configuration fields
+  - Ctrl+S: Save current configuration
+  - Ctrl+O: Load saved configuration
+  - Esc: Cancel ongoing operations
+
+• Tab Navigation:
+  - Click tabs to switch between different sections
+  - Some tabs provide real-time updates when selected
+"""),
+)
+
+# Main window size, shared by geometry(), minsize() and centering math
+_WINDOW_W, _WINDOW_H = 700, 900
+
+
+# Keystroke validators for the numeric config entries: accept any string
+# that can still become a number, so the Tk variable never holds text the
+# typed get() would choke on
+def _is_int_prefix(text):
+    return text in ('', '-') or text.lstrip('-').isdigit()
+
+
+def _is_float_prefix(text):
+    if text in ('', '-', '.', '-.'):
+        return True
+    try:
+        float(text)
+        return True
+    except ValueError:
+        return False
+
+# Theme palette - Modern dark theme with accent colors
+_BG_COLOR = "#1a1a1a"       # Dark background
+_FG_COLOR = "#ffffff"       # White text
+_ACCENT_COLOR = "#00b4d8"   # Modern blue accent
+_SUCCESS_COLOR = "#2ecc71"  # Modern green
+_WARNING_COLOR = "#f1c40f"  # Modern yellow
+_ERROR_COLOR = "#e74c3c"    # Modern red
+_HOVER_COLOR = "#2d2d2d"    # Slightly lighter for hover states
+
 import math
+import re
 import json
 import time
+import bisect
+import functools
 import psutil
 import platform
 import threading
+from collections import deque
 from datetime import datetime
+from types import MappingProxyType
 import os
 import sys
 from Tools.scroll_frame import ScrollFrame
 
+# Icon locations, resolved once at import time so window construction
+# (including any re-instantiation after a scene reload) pays no path
+# computation or filesystem stat cost
+_ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets')
+
+# Serialize config files with orjson when available (optional dependency);
+# the stdlib json path is the fallback. orjson emits bytes directly, so
+# both branches expose a bytes-level interface
+try:
+    import orjson
+
+    def _json_dumps_bytes(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _json_loads_bytes(data):
+        return orjson.loads(data)
+except ImportError:
+    def _json_dumps_bytes(obj):
+        return json.dumps(obj, indent=4).encode('utf-8')
+
+    def _json_loads_bytes(data):
+        return json.loads(data)
+
+# Characters stripped from user-supplied config filenames; the compiled
+# pattern keeps the sanitization loop in C instead of per-char Python
+_FILENAME_SANITIZE_RE = re.compile(r'[^\w.\- ]')
+
+# Default directory for saved/loaded configuration files, resolved once
+# at import instead of per dialog
+_CONFIG_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Config"))
+_ICO_PATH = os.path.join(_ASSETS_DIR, 'icon.ico')
+_PNG_PATH = os.path.join(_ASSETS_DIR, 'icon.png')
+_ICO_EXISTS = os.path.exists(_ICO_PATH)
+_PNG_EXISTS = os.path.exists(_PNG_PATH)
+
+# Rotation terms for the direction-indicator arrowhead (±150° off the
+# vector), computed once so per-update drawing needs no atan2/cos/sin
+_ARROW_COS150 = math.cos(math.radians(150))
+_ARROW_SIN150 = math.sin(math.radians(150))
+
+# Data-driven color/style thresholds for the Status tab, resolved with a
+# bisect over sorted boundaries instead of if/elif ladders in the hot path
+_ELEV_THRESHOLDS = (-3.0, -0.1, 0.1, 3.0)
+_ELEV_COLORS = ('orange', 'green', 'green', 'orange', 'red')
+_SIGNAL_THRESHOLDS = (0.25, 0.5, 0.85)
+_SIGNAL_STYLES = ('Red.Horizontal.TProgressbar', 'Orange.Horizontal.TProgressbar',
+                  'Yellow.Horizontal.TProgressbar', 'Green.Horizontal.TProgressbar')
+
+
+# Cached label formatters: capture and scene creation repeat the same
+# values over and over, so the float->str work is memoized on the
+# centimeter-rounded input instead of redone per event
+@functools.lru_cache(maxsize=256)
+def _fmt_meters(d100):
+    return f"{d100 / 100:.2f} meters"
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_elevation(dz100):
+    if dz100 > 0:
+        return f"{dz100 / 100:.2f}m above drone"
+    return f"{-dz100 / 100:.2f}m below drone"
+
+
+@functools.lru_cache(maxsize=32)
+def _fmt_category(name):
+    return name.capitalize()
+
+
+# Config previews repeat the same scalar values across sections and
+# loads (defaults like 0.0 or 1.0), so the formatted strings are cached
+@functools.lru_cache(maxsize=256)
+def _fmt_preview_scalar(key, value):
+    if value == "Not set":
+        return value
+
+    # Format booleans
+    if isinstance(value, bool):
+        return "Enabled" if value else "Disabled"
+
+    # Format floats with appropriate precision
+    if isinstance(value, float):
+        if key == "rc_yaw_sensitivity":
+            return f"{int(value * 100)}%"  # Display as percentage
+        elif abs(value) < 0.1:
+            return f"{value:.3f}"  # More precision for very small values
+        elif abs(value) < 1:
+            return f"{value:.2f}"
+        else:
+            return f"{value:.1f}"
+
+    # Default formatting
+    return str(value)
+
 
 class MenuSystem:
+    # Keysym guarded against by _safe_button_action (space doubles as the
+    # "move up" drone key, so it must never activate a focused button)
+    _SPACE = 'space'
+
+    # radius -> [(ring radius, color)] for the direction indicator; the
+    # gradient depends only on the canvas radius, so each size is computed
+    # once and shared across instances
+    _RING_COLOR_CACHE = {}
+
     def __init__(self, config: dict, sim_command_queue):
         self.sim_queue = sim_command_queue
         self.sim = SC.sim
         self.config = config
-        # Map to hold config UI variables and widgets
+        # Map to hold config UI variables and widgets, plus the key
+        # partition by variable kind so refresh loops skip per-entry
+        # isinstance dispatch
         self._config_vars = {}
         self._config_widgets = {}
+        self._bool_var_keys = set()
+        self._num_var_keys = set()
 
         # Flag to track UI state
         self._ui_active = True
+        self._shutting_down = False
         
         # Get logger instance
         self.logger = get_logger()
@@ -49,22 +503,130 @@ class MenuSystem:
         # Track current selected tab
         self._current_tab = "Scene"  # Default tab
 
+        # Every EM subscription is recorded here so cleanup can unsubscribe
+        # them all; dangling callbacks pin the whole MenuSystem (and with it
+        # every Tk widget) after shutdown
+        self._subs = []
+
         # Subscribe to config updates to sync UI
-        EM.subscribe('config/updated', self._on_config_updated_gui)
+        self._sub('config/updated', self._on_config_updated_gui)
 
         self.progress_var = None  # For progress bar
 
+        # Widgets created lazily when their tab is first built. Initialized
+        # to None so event handlers can test `is not None` instead of the
+        # costlier hasattr() on every scene/victim event
+        self.status_label = None
+        self.distance_var = None
+        self.elevation_var = None
+        self.direction_canvas = None
+        self.scene_buttons = None
+        self.remove_batches_btn = None
+        self.single_axis_mode_var = None
+        self._quit_dialog = None
+        # Config preview dialog is built lazily and reused across loads;
+        # _preview_sections/_preview_pending hold the rows and the
+        # (loaded_config, file_path) pair being previewed
+        self._preview_dialog = None
+        self._preview_sections = None
+        self._preview_section_items = None
+        self._preview_mappings = None
+        self._preview_pending = None
+        # Last-applied state per scene button; _set_scene_buttons_state
+        # skips buttons already in the target state
+        self._scene_button_states = None
+
+        # Coalesced repaint state: simulation frames only mark the UI dirty;
+        # a single after-loop repaints at most ~60 Hz
+        self._ui_dirty = False
+        self._last_paint = 0.0
+
+        # Debounce state for tab-width restyling on window resize
+        self._tab_width_after = None
+        self._last_tab_width = None
+
+        # Direction-indicator canvas: size the static layer (circles,
+        # crosshair, rings) was last drawn for, and the last victim vector
+        # so a resize can rebuild the full picture
+        self._static_dir_size = None
+        self._last_dir_vec = (None, None, None)
+        # Canvas geometry cached from <Configure> events so the draw path
+        # never round-trips through winfo_width/winfo_height; 250 matches
+        # the pre-map fallback size
+        self._set_dir_canvas_geometry(250, 250)
+        # Persistent canvas items for the moving parts (vector, arrowhead,
+        # reticle, "NO SIGNAL" text) — created once, then repositioned with
+        # coords() instead of delete+create on every victim update
+        self._dyn_item_ids = None
+        self._dyn_mode = None
+        # Last rendered (dx, dy, dz, distance), rounded; identical updates
+        # skip the whole label/canvas pass
+        self._last_victim_state = None
+        # Last-applied label/style values so unchanged ones skip the
+        # configure round-trip
+        self._last_elev_color = None
+        self._last_signal_style = None
+        self._last_distance_color = None
+        self._remove_batches_state = None
+        # Latest victim payload staged for the scheduled apply method; a
+        # single tuple write keeps the publisher thread closure-free
+        self._pending_victim = None
+
+        # Coalescing dispatcher for event-driven UI callbacks: same-key
+        # updates overwrite each other and one after() drains them all, so
+        # an event burst can't flood the Tk queue with duplicate closures
+        self._pending_ui_updates = {}
+        self._pending_ui_lock = threading.Lock()
+        self._ui_flush_scheduled = False
+
+        # Coalesced scene-creation progress state: events park their latest
+        # payload here and a single rate-limited flush renders it
+        self._last_progress_update = 0.0
+        self._pending_progress_data = None
+        self._progress_flush_scheduled = False
+        self._last_drawn_progress = -1.0
+        self._last_progress_msg = ''
+        self._progress_bar_visible = False
+
+        # Tcl variable name -> (config key, BooleanVar) so all checkbox
+        # traces can share one bound callback
+        self._bool_vars_by_name = {}
+
+        # Widgets highlighted by a config sync, reverted together by one
+        # 800 ms timer instead of one timer per widget
+        self._pending_highlight_reverts = set()
+        self._revert_scheduled = False
+
+        # Debounced entry commits: config key -> after id. <Return>
+        # followed by <FocusOut> (or a FocusOut right before Apply)
+        # collapses to one trailing commit per key.
+        self._pending_commits = {}
+
+        # Latest psutil samples, produced by a background daemon thread so
+        # the Tk callbacks never issue the syscalls themselves
+        self._psutil_thread = None
+        self._metrics_subscribed = False
+        self._last_cpu = 0.0
+        self._last_cpu_freq = 0.0
+        self._last_mem_mb = 0.0
+        self._last_mem_percent = 0.0
+
         # Performance tracking
         self._last_ui_update = 0
         self._last_fps_update = 0
-        self._frame_times = []
-        self._sim_frame_times = []
+        # Bounded so rolling FPS windows can't grow without limit
+        # (two seconds of history at 60 Hz); append auto-evicts the oldest
+        self._frame_times = deque(maxlen=120)
+        self._sim_frame_times = deque(maxlen=120)
         self._start_time = time.time()
         self._monitoring_active = False
         self._monitoring_after_id = None
         
-        # Set default monitoring state to disabled
+        # Set default monitoring state to disabled. The flag is mirrored in
+        # an attribute so the tab-switch/monitoring paths skip the dict
+        # lookup; it is refreshed wherever the config value changes.
         self.config["enable_performance_monitoring"] = False
+        self._perf_monitoring_enabled = False
         
         # Ensure default values for tree spawn interval and bird speed
         if "tree_spawn_interval" not in self.config:
@@ -82,41 +644,36 @@ class MenuSystem:
         # Build and style main window
         self.root = tk.Tk()
         self.root.title("Disaster Simulation with Drone Navigation v1.4.0B - HyperDrive Pathway")
-        self.root.geometry("700x900")  # Increased width to ensure all tabs are visible
+        self.root.geometry(f"{_WINDOW_W}x{_WINDOW_H}")  # Increased width to ensure all tabs are visible
         self.root.configure(bg="#1a1a1a")  # Dark background
         
         # Initialize Tkinter variables after root window is created
         self.control_status_var = tk.StringVar(value="UI Control: Initializing (5x Speed)...")
+
+        # Shared keystroke validators for the numeric config entries
+        self._vcmd_int = self.root.register(_is_int_prefix)
+        self._vcmd_float = self.root.register(_is_float_prefix)
         
-        # Set window icon
+        # Set window icon (paths and existence checks are resolved once at
+        # module import; see _ICO_PATH/_PNG_PATH above)
         try:
-            # Get the absolute path to the assets directory
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            assets_dir = os.path.join(os.path.dirname(current_dir), 'assets')
-            
-            # Try to load the icon file
-            icon_path = os.path.join(assets_dir, 'icon.ico')
-            png_path = os.path.join(assets_dir, 'icon.png')
-            
-            self.logger.debug_at_level(DEBUG_L2, "MenuSystem", f"Looking for icons in: {assets_dir}")
-            self.logger.debug_at_level(DEBUG_L2, "MenuSystem", f"ICO path: {icon_path}")
-            self.logger.debug_at_level(DEBUG_L2, "MenuSystem", f"PNG path: {png_path}")
-            
+            self.logger.debug_at_level(DEBUG_L2, "MenuSystem", f"Looking for icons in: {_ASSETS_DIR}")
+
             if platform.system() == 'Darwin':  # macOS
-                if os.path.exists(png_path):
+                if _PNG_EXISTS:
                     self.logger.debug_at_level(DEBUG_L1, "MenuSystem", "Found PNG file, setting icon for macOS")
                     # For macOS, we need to use iconphoto with a PhotoImage
-                    icon_image = tk.PhotoImage(file=png_path)
+                    icon_image = tk.PhotoImage(file=_PNG_PATH)
                     self.root.iconphoto(True, icon_image)  # True means apply to all windows
                 else:
                     self.logger.warning("MenuSystem", "No PNG file found for macOS")
             else:  # Windows/Linux
-                if os.path.exists(icon_path):
+                if _ICO_EXISTS:
                     self.logger.debug_at_level(DEBUG_L1, "MenuSystem", "Found ICO file, setting icon")
-                    self.root.iconbitmap(icon_path)
-                elif os.path.exists(png_path):
+                    self.root.iconbitmap(_ICO_PATH)
+                elif _PNG_EXISTS:
                     self.logger.debug_at_level(DEBUG_L1, "MenuSystem", "Found PNG file, setting icon")
-                    icon_image = tk.PhotoImage(file=png_path)
+                    icon_image = tk.PhotoImage(file=_PNG_PATH)
                     self.root.iconphoto(True, icon_image)
                 else:
                     self.logger.warning("MenuSystem", "No icon files found")
@@ -125,11 +682,14 @@ class MenuSystem:
             
         # Make window resizable with minimum size
         self.root.resizable(True, True)
-        self.root.minsize(700, 900)  # Increased minimum width to ensure all tabs are visible
-        
-        # Add window shadow effect
-        self.root.attributes('-alpha', 0.98)  # Slight transparency for modern look
+        self.root.minsize(_WINDOW_W, _WINDOW_H)  # Increased minimum width to ensure all tabs are visible
         
+        # Window translucency is opt-in: -alpha forces the window onto the
+        # compositor's layered rendering path, which adds blend work to every
+        # repaint. Default is the fast opaque-blit path.
+        if self.config.get('ui_translucency', False):
+            self.root.attributes('-alpha', 0.98)  # Slight transparency for modern look
+
         # Configure styles
         self._configure_styles()
         self._build_ui()
@@ -142,75 +702,94 @@ class MenuSystem:
 
         # Set up keyboard control from UI
         self._setup_keyboard_control()
-        
+
+        # Start the coalesced repaint loop
+        self._ui_tick()
+
+    def _ui_tick(self):
+        """
+        Coalesced repaint loop. Simulation frames can arrive at hundreds of Hz;
+        instead of pumping Tk per frame, they set _ui_dirty and this loop
+        flushes pending redraws at most once per ~16 ms. A frame arriving after
+        an idle period repaints immediately since the deadline has long passed.
+        """
+        if not self._ui_active:
+            return
+        if self._ui_dirty:
+            now = time.monotonic()
+            if now - self._last_paint >= 0.016:
+                self._ui_dirty = False
+                self._last_paint = now
+                if self._monitoring_active:
+                    # Feed the rolling FPS window with real repaint times
+                    self._frame_times.append(time.time())
+                try:
+                    self.root.update_idletasks()
+                except Exception as e:
+                    self.logger.error("MenuSystem", f"Error updating UI: {e}")
+        try:
+            self.root.after(8, self._ui_tick)
+        except Exception:
+            pass  # Window is being torn down
+
     # Add keyboard control setup method
     def _setup_keyboard_control(self):
         """Set up keyboard event handling for drone control from UI window"""
-        # Map keys to movement directions
-        self.key_direction_map = {
-            'w': ('forward', 1),
-            's': ('forward', -1),
-            'a': ('sideward', -1),
-            'd': ('sideward', 1),
-            'space': ('upward', 1),  # Use 'space' instead of ' ' for Tkinter
-            'z': ('upward', -1),
-            'q': ('yaw', 1),
-            'e': ('yaw', -1),
-        }
-        
-        # Track specific key names
-        self.known_keysyms = {
-            'space': 'space',
-            'w': 'w', 'a': 'a', 's': 's', 'd': 'd',
-            'z': 'z', 'q': 'q', 'e': 'e',
-            'W': 'w', 'A': 'a', 'S': 's', 'D': 'd',
-            'Z': 'z', 'Q': 'q', 'E': 'e'
-        }
-        
-        # Bind key press and release events
+        # Constant key tables shared across instances (see module scope)
+        self.key_direction_map = _KEY_DIRECTION_MAP
+        self.known_keysyms = _KNOWN_KEYSYMS
+        self._KEY_BIT = _KEY_BITS
+        self._key_mask = 0
+        self._build_movement_luts()
+        self._refresh_movement_steps()
+        self._refresh_debug_flags()
+
+        # Bind key press and release events; the generic handlers cover space
+        # too (keysym 'space'), so no separate <space> binding is needed
         self.root.bind("<KeyPress>", self._on_ui_key_press)
         self.root.bind("<KeyRelease>", self._on_ui_key_release)
-        
-        # Add specific space key binding
-        self.root.bind("<space>", lambda e: self._on_ui_key_press_special('space'))
-        self.root.bind("<KeyRelease-space>", lambda e: self._on_ui_key_release_special('space'))
-        
+
         # Bind focus events
         self.root.bind("<FocusIn>", self._on_focus_in)
         self.root.bind("<FocusOut>", self._on_focus_out)
         
-        # Schedule regular movement updates based on pressed keys
-        self._schedule_movement_updates()
-        
+        # Movement publishing is demand-driven: the 20 ms loop only runs while
+        # keys are held, so an idle UI schedules no timers and publishes nothing
+        self._movement_loop_running = False
+        self._hover_published = True  # Drone starts hovering; nothing to publish
+        self._input_dirty = False     # Set by key events, cleared once per tick
+
         # Make sure we grab focus for keyboard events
         self.root.after(100, self._ensure_focus)
     
     def _on_focus_in(self, event):
         """Handle window gaining focus"""
         self.control_status_var.set("UI Control Active")
-        self.control_status_label.configure(foreground="#00FF00")  # Green
-        
+        if hasattr(self, 'control_status_label'):
+            self.control_status_label.configure(foreground="#00FF00")  # Green
+
         # Ensure we don't have any stuck keys from previous state
         self._ui_pressed_keys.clear()
-        
+        self._key_mask = 0
+
         # Stop any existing movement to ensure clean state
-        EM.publish('keyboard/move', (0.0, 0.0, 0.0, 8))
-        EM.publish('keyboard/rotate', (0.0, 8))
-        
+        self._hover_published = False
+        self._publish_hover()
+
         self.logger.info("MenuSystem", "UI control active - window regained focus")
     
     def _on_focus_out(self, event):
         """Handle when the UI loses focus - stop keyboard controls"""
         self.control_status_var.set("UI Control Inactive - Click window to activate")
-        self.control_status_label.configure(foreground="#FF3333")  # Red
-        
-        # Clear currently pressed keys and stop drone movement
+        if hasattr(self, 'control_status_label'):
+            self.control_status_label.configure(foreground="#FF3333")  # Red
+
+        # Clear currently pressed keys and stop drone movement (8 = hover)
         self._ui_pressed_keys.clear()
-        
-        # Send stop movement events
-        EM.publish('keyboard/move', (0.0, 0.0, 0.0, 8))  # 8 = hover
-        EM.publish('keyboard/rotate', (0.0, 8))
-        
+        self._key_mask = 0
+        self._hover_published = False
+        self._publish_hover()
+
         self.logger.warning("MenuSystem", "UI control inactive - window lost focus")
     
     def _ensure_focus(self):
@@ -220,131 +799,128 @@ class MenuSystem:
         # Update status message
         if self.root.focus_get():
             self.control_status_var.set("UI Control Active")
-            self.control_status_label.configure(foreground="#00FF00")  # Green
+            if hasattr(self, 'control_status_label'):
+                self.control_status_label.configure(foreground="#00FF00")  # Green
             self.logger.info("MenuSystem", "UI control active - window has focus")
         else:
             self.control_status_var.set("UI Control Inactive - Click window to activate")
-            self.control_status_label.configure(foreground="#FF3333")  # Red
+            if hasattr(self, 'control_status_label'):
+                self.control_status_label.configure(foreground="#FF3333")  # Red
             self.logger.warning("MenuSystem", "UI control inactive - window lacks focus")
     
     def _on_ui_key_press(self, event):
         """Handle key press events from UI"""
-        # Get the key symbol or character
-        key = event.keysym.lower() if hasattr(event, 'keysym') else event.char.lower()
-        
-        # Map to known key if possible
-        if key in self.known_keysyms:
-            key = self.known_keysyms[key]
-        
-        # Ignore if the key is not in our mapping
-        if key not in self.key_direction_map:
-            self.logger.debug_at_level(DEBUG_L3, "MenuSystem", f"Ignoring unknown key: {key}")
+        # Single lookup maps the raw keysym (either case) to its canonical
+        # key, or None for anything we don't handle — no per-keystroke
+        # .lower() allocation needed since known_keysyms carries both cases
+        key = self.known_keysyms.get(event.keysym)
+        if key is None:
             return
-        
-        # Add to pressed keys set
-        self._ui_pressed_keys.add(key)
-        
-        # Log key press for debugging
-        self.logger.debug_at_level(DEBUG_L3, "MenuSystem", f"UI key press: {key}")
-    
-    def _on_ui_key_press_special(self, key):
-        """Handle special key press events that need specific handling"""
+
+        # Record the key and make sure the movement loop is running; the loop
+        # publishes at most once per tick, so OS auto-repeat bursts collapse
+        # into a single state update here instead of one publish per event
         self._ui_pressed_keys.add(key)
-        self.logger.debug_at_level(DEBUG_L3, "MenuSystem", f"UI special key press: {key}")
-        return "break"  # Prevent default handling
-    
+        self._key_mask |= self._KEY_BIT[key]
+        self._input_dirty = True
+        self._ensure_movement_loop()
+
+        # Log key press for debugging (flag-gated: no f-string when L3 is off)
+        if self._log_l3:
+            self.logger.debug_at_level(DEBUG_L3, "MenuSystem", f"UI key press: {key}")
+        return "break"  # Prevent default handling (e.g. space activating buttons)
+
     def _on_ui_key_release(self, event):
         """Handle key release events from UI"""
-        # Get the key symbol or character
-        key = event.keysym.lower() if hasattr(event, 'keysym') else event.char.lower()
-        
-        # Map to known key if possible
-        if key in self.known_keysyms:
-            key = self.known_keysyms[key]
-        
+        # Same single-lookup mapping as _on_ui_key_press
+        key = self.known_keysyms.get(event.keysym)
+        if key is None:
+            return
+
         # Remove from pressed keys set if present
         if key in self._ui_pressed_keys:
             self._ui_pressed_keys.discard(key)
-            
-        # Log key release for debugging
-        self.logger.debug_at_level(DEBUG_L3, "MenuSystem", f"UI key release: {key}")
-    
-    def _on_ui_key_release_special(self, key):
-        """Handle special key release events that need specific handling"""
-        if key in self._ui_pressed_keys:
-            self._ui_pressed_keys.discard(key)
-        self.logger.debug_at_level(DEBUG_L3, "MenuSystem", f"UI special key release: {key}")
+            self._key_mask &= ~self._KEY_BIT[key]
+            self._input_dirty = True
+
+        # Log key release for debugging (flag-gated: no f-string when L3 is off)
+        if self._log_l3:
+            self.logger.debug_at_level(DEBUG_L3, "MenuSystem", f"UI key release: {key}")
         return "break"  # Prevent default handling
+
+    def _refresh_debug_flags(self):
+        """Cache whether L3 debug logging is active so the key handlers can
+        skip the f-string build and logger call with one attribute check"""
+        self._log_l3 = self.logger.verbose and self.logger.current_debug_level >= DEBUG_L3
+
+    def _ensure_movement_loop(self):
+        """Start the 20 ms movement loop when the first key goes down"""
+        if not self._movement_loop_running and self._key_mask:
+            self._movement_loop_running = True
+            self._hover_published = False
+            # Run the first tick immediately for responsive first input
+            self._movement_tick()
+
+    def _movement_tick(self):
+        """Re-publish movement while keys are held (the control manager decays
+        velocity each sim frame); stop and publish hover once when input ends.
+        Key events between ticks only mutate the mask, so however fast the OS
+        auto-repeats, at most one publish goes out per 20 ms tick."""
+        if self._key_mask:
+            self._process_movement()
+            self._input_dirty = False
+            self.root.after(20, self._movement_tick)
+        elif self._input_dirty:
+            # X11 auto-repeat delivers release/press pairs; if the tick lands
+            # between them the mask is momentarily empty. Give input one more
+            # tick to settle before concluding the keys are really up.
+            self._input_dirty = False
+            self.root.after(20, self._movement_tick)
+        else:
+            self._movement_loop_running = False
+            self._publish_hover()
+
+    def _publish_hover(self):
+        """Publish the stop/hover state, deduplicated"""
+        if not self._hover_published:
+            self._hover_published = True
+            EM.publish('keyboard/move', (0.0, 0.0, 0.0, 8))
+            EM.publish('keyboard/rotate', (0.0, 8))
     
-    def _schedule_movement_updates(self):
-        """Schedule regular movement updates based on pressed keys"""
-        # Process current key state
-        self._process_movement()
-        
-        # Schedule next update (every 20ms for smooth control)
-        self.root.after(20, self._schedule_movement_updates)
-    
-    def _process_movement(self):
-        """Process keyboard movement commands and send events"""
-        forward = 0  # Forward/backward
-        sideward = 0  # Left/right
-        upward = 0  # Up/down
-        yaw = 0  # Rotation
-        
-        # Check which keys are pressed
-        for key in self._ui_pressed_keys:
-            if key == 'w':
-                forward += 1
-            elif key == 's':
-                forward -= 1
-            elif key == 'a':
-                sideward -= 1
-            elif key == 'd':
-                sideward += 1
-            elif key == 'space':
-                upward += 1
-            elif key == 'z':
-                upward -= 1
-            elif key == 'q':
-                yaw += 1
-            elif key == 'e':
-                yaw -= 1
-        
-        # Apply single-axis movement restriction if enabled
-        if self.config.get("single_axis_mode", False):
-            # Determine which input has the largest magnitude
+    def _build_movement_luts(self):
+        """Precompute movement for every possible pressed-key mask.
+
+        _process_movement runs every 20 ms while flying, so instead of
+        scanning the pressed-key set and walking the single-axis/action-label
+        ladders per tick, the full decision tree is evaluated once here for
+        all 256 masks. The hot path then reduces to a single list index.
+        Each entry is (forward, sideward, upward, yaw, action_label)."""
+        self._MOVE_LUT = []
+        self._MOVE_LUT_SINGLE = []
+        for mask in range(256):
+            forward = ((mask >> 0) & 1) - ((mask >> 1) & 1)   # w / s
+            sideward = ((mask >> 3) & 1) - ((mask >> 2) & 1)  # d / a
+            upward = ((mask >> 4) & 1) - ((mask >> 5) & 1)    # space / z
+            yaw = ((mask >> 6) & 1) - ((mask >> 7) & 1)       # q / e
+            self._MOVE_LUT.append(self._movement_entry(forward, sideward, upward, yaw))
+
+            # Single-axis variant: only the axis with the largest magnitude
+            # moves, with the priority forward > sideward > yaw > upward
             max_input = max(abs(forward), abs(sideward), abs(yaw), abs(upward))
-            
-            # Only allow the axis with the largest input, zero out all others
             if max_input > 0:
-                if abs(forward) == max_input:  # Forward/backward has priority
-                    sideward = 0
-                    upward = 0
-                    yaw = 0
-                elif abs(sideward) == max_input:  # Left/right has priority
-                    forward = 0
-                    upward = 0
-                    yaw = 0
-                elif abs(yaw) == max_input:  # Rotation has priority
-                    forward = 0
-                    sideward = 0
-                    upward = 0
-                elif abs(upward) == max_input:  # Up/down has priority
-                    forward = 0
-                    sideward = 0
-                    yaw = 0
-        
-        # Get movement parameters from config
-        move_step = self.config.get('move_step', 0.2)
-        rotate_step = self.config.get('rotate_step_deg', 15.0)
-        
-        # Increase the movement speed for UI control by 6x
-        # We'll also apply a small adjustment factor since we're updating more frequently
-        ui_speed_multiplier = 6.0  # 5 times faster for UI control
-        smooth_move_step = move_step * ui_speed_multiplier * 0.5
-        smooth_rotate_step = math.radians(rotate_step) * 0.5
-        
-        # Compute action label based on movement
+                if abs(forward) == max_input:
+                    sideward = upward = yaw = 0
+                elif abs(sideward) == max_input:
+                    forward = upward = yaw = 0
+                elif abs(yaw) == max_input:
+                    forward = sideward = upward = 0
+                else:
+                    forward = sideward = yaw = 0
+            self._MOVE_LUT_SINGLE.append(self._movement_entry(forward, sideward, upward, yaw))
+
+    @staticmethod
+    def _movement_entry(forward, sideward, upward, yaw):
+        """Compute the action label for one axis combination (LUT build only)"""
         action_label = 8  # Default hover
         if abs(sideward) > 0.1 or abs(forward) > 0.1 or abs(upward) > 0.1:
             max_dir = max(abs(sideward), abs(forward), abs(upward))
@@ -356,53 +932,190 @@ class MenuSystem:
                 action_label = 4 if upward > 0 else 5  # Up/Down
         elif abs(yaw) > 0.01:
             action_label = 6 if yaw > 0 else 7  # Turn Right/Left
-        
-        # Send movement events if there are active keys
-        if self._ui_pressed_keys:
+        return (forward, sideward, upward, yaw, action_label)
+
+    def _refresh_movement_steps(self):
+        """Recompute the cached movement step sizes from config.
+
+        move_step/rotate_step_deg only change on config/updated, so the dict
+        lookups and math.radians call are hoisted out of the 20 ms movement
+        tick. The UI speed multiplier (6x) and the smoothing factor (0.5,
+        since we update more frequently than CLI control) are folded in."""
+        self._smooth_move_step = self.config.get('move_step', 0.2) * 6.0 * 0.5
+        self._smooth_rotate_step = math.radians(self.config.get('rotate_step_deg', 15.0)) * 0.5
+        self._active_move_lut = (self._MOVE_LUT_SINGLE
+                                 if self.config.get('single_axis_mode', False)
+                                 else self._MOVE_LUT)
+        # Invalidate the cached event tuples; they bake in the step sizes
+        self._last_pub_mask = None
+        self._move_tup = None
+        self._rotate_tup = None
+
+    def _process_movement(self):
+        """Publish movement events for the current pressed-key mask.
+
+        The publish itself must repeat every tick — the drone control
+        manager decays the commanded velocity each sim frame — but while a
+        key is held the payload is identical, so the event tuples are built
+        once per mask change and reused on the following ticks."""
+        if not self._key_mask:
+            return
+
+        if self._key_mask != self._last_pub_mask:
+            forward, sideward, upward, yaw, action_label = self._active_move_lut[self._key_mask]
+            smooth_move_step = self._smooth_move_step
             if forward or sideward or upward:
-                EM.publish('keyboard/move', (sideward * smooth_move_step, forward * smooth_move_step, upward * smooth_move_step, action_label))
-            
+                self._move_tup = (sideward * smooth_move_step, forward * smooth_move_step,
+                                  upward * smooth_move_step, action_label)
+            else:
+                self._move_tup = None
             if yaw:
-                EM.publish('keyboard/rotate', (yaw * smooth_rotate_step, action_label))
-        
-        # Always process movement, which helps ensure smooth control
-        # This gets called regularly via _schedule_movement_updates
+                self._rotate_tup = (yaw * self._smooth_rotate_step, action_label)
+            else:
+                self._rotate_tup = None
+            self._last_pub_mask = self._key_mask
+
+        if self._move_tup is not None:
+            EM.publish('keyboard/move', self._move_tup)
+
+        if self._rotate_tup is not None:
+            EM.publish('keyboard/rotate', self._rotate_tup)
 
     def _center_window(self):
-        """Center the window on the screen"""
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
-        self.root.geometry(f'{width}x{height}+{x}+{y}')
+        """Center the window on the screen.
+
+        The window size is a known constant, so no update_idletasks flush
+        is needed just to read it back from winfo_width/height."""
+        x = (self.root.winfo_screenwidth() // 2) - (_WINDOW_W // 2)
+        y = (self.root.winfo_screenheight() // 2) - (_WINDOW_H // 2)
+        self.root.geometry(f'{_WINDOW_W}x{_WINDOW_H}+{x}+{y}')
 
     def _configure_styles(self):
         """Configure modern styles for the application"""
-        style = ttk.Style(self.root)
+        # One Style instance is enough; every later reconfiguration
+        # (tab widths, dialogs) reuses it instead of constructing a new one
+        style = self._style = ttk.Style(self.root)
         style.theme_use('clam')
         
-        # Configure colors - Modern dark theme with accent colors
-        bg_color = "#1a1a1a"  # Dark background
-        fg_color = "#ffffff"  # White text
-        accent_color = "#00b4d8"  # Modern blue accent
-        success_color = "#2ecc71"  # Modern green
-        warning_color = "#f1c40f"  # Modern yellow
-        error_color = "#e74c3c"  # Modern red
-        hover_color = "#2d2d2d"  # Slightly lighter for hover states
-        
-        # Configure notebook style
-        style.configure("TNotebook", background=bg_color, borderwidth=0)
-        style.configure("TNotebook.Tab", 
-                       background=bg_color,
-                       foreground=fg_color,
-                       padding=[18, 8],  # Increased horizontal padding for wider tabs
-                       font=("Segoe UI", 10, "bold"),
-                       justify="center")  # Center text in tabs
-        style.map("TNotebook.Tab",
-                 background=[("selected", hover_color)],
-                 foreground=[("selected", accent_color)])
-        
+        # Theme colors come from the module-level palette so the hex strings
+        # exist once and any style rebuild reuses them
+        bg_color = _BG_COLOR
+        fg_color = _FG_COLOR
+        accent_color = _ACCENT_COLOR
+        success_color = _SUCCESS_COLOR
+        warning_color = _WARNING_COLOR
+        error_color = _ERROR_COLOR
+        hover_color = _HOVER_COLOR
+
+        # Shared option blocks, merged into the specs below
+        base_font = ("Segoe UI", 10)
+        bold_font = ("Segoe UI", 12, "bold")
+        # Common options of the large colored action buttons
+        btn_base = {
+            "foreground": "#ffffff",
+            "padding": [20, 15],  # Increased padding for larger buttons
+            "font": bold_font,  # Larger font
+            "borderwidth": 1,
+            "relief": "solid",
+        }
+        # Common hover/press behaviour of the colored action buttons
+        def btn_map(active_bg):
+            return {
+                "background": [("active", active_bg)],
+                "foreground": [("active", "#ffffff")],
+                "relief": [("pressed", "sunken")],
+            }
+        # Shared progress bar options
+        bar_base = {"troughcolor": bg_color, "bordercolor": accent_color, "thickness": 10}
+
+        # All style.configure calls, dict-driven so they can be issued in one
+        # loop instead of ~30 separate call sites
+        style_spec = {
+            "TNotebook": {"background": bg_color, "borderwidth": 0},
+            "TNotebook.Tab": {
+                "background": bg_color,
+                "foreground": fg_color,
+                "padding": [18, 8],  # Increased horizontal padding for wider tabs
+                "font": ("Segoe UI", 10, "bold"),
+                "justify": "center",  # Center text in tabs
+            },
+            "TFrame": {"background": bg_color},
+            "TLabelframe": {"background": bg_color, "foreground": fg_color,
+                            "borderwidth": 1, "relief": "solid"},
+            "TLabelframe.Label": {"background": bg_color, "foreground": accent_color,
+                                  "font": ("Segoe UI", 11, "bold"), "padding": [0, 5]},
+            "TLabel": {"background": bg_color, "foreground": fg_color,
+                       "font": base_font, "padding": [5, 2]},
+            "Title.TLabel": {"font": ("Segoe UI", 18, "bold"),
+                             "foreground": accent_color, "padding": [0, 10]},
+            "Subtitle.TLabel": {"font": ("Segoe UI", 12, "bold"),
+                                "foreground": fg_color, "padding": [0, 5]},
+            "TButton": {"background": bg_color, "foreground": fg_color,
+                        "padding": [20, 15], "font": bold_font,
+                        "borderwidth": 1, "relief": "solid",
+                        "anchor": "center", "justify": "center"},
+            # Apply button with light green color
+            "Apply.TButton": {**btn_base, "background": "#4CAF50"},
+            # Scene control buttons: Create green, Clear orange, Cancel red
+            "Create.TButton": {**btn_base, "background": success_color, "width": 30},
+            "Clear.TButton": {**btn_base, "background": "#e67e22", "width": 30},
+            "Cancel.TButton": {**btn_base, "background": error_color, "width": 30},
+            "Quit.TButton": {"background": bg_color, "foreground": error_color,
+                             "padding": [15, 10], "font": bold_font,
+                             "borderwidth": 1, "relief": "solid"},
+            # Confirmation dialog buttons (registered once here so opening a
+            # dialog doesn't re-run a style.configure round-trip)
+            "Confirmation.TButton": {"padding": [10, 10],
+                                     "font": ("Segoe UI", 11, "bold"),
+                                     "anchor": "center", "justify": "center"},
+            "TEntry": {"fieldbackground": hover_color, "foreground": fg_color,
+                       "borderwidth": 1, "relief": "solid",
+                       "font": base_font, "padding": [5, 2]},
+            "TCheckbutton": {"background": bg_color, "foreground": fg_color,
+                             "font": base_font, "padding": [5, 2]},
+            # Progress bars
+            "Red.Horizontal.TProgressbar": {**bar_base, "background": error_color},
+            "Orange.Horizontal.TProgressbar": {**bar_base, "background": warning_color},
+            "Yellow.Horizontal.TProgressbar": {**bar_base, "background": warning_color},
+            "Green.Horizontal.TProgressbar": {**bar_base, "background": success_color},
+            # Dark styles specifically for dialogs with white backgrounds
+            "Dark.TFrame": {"background": _BG_COLOR},
+            "Dark.TLabelframe": {"background": _BG_COLOR, "foreground": fg_color,
+                                 "borderwidth": 1, "relief": "solid"},
+            "Dark.TLabelframe.Label": {"background": _BG_COLOR, "foreground": accent_color,
+                                       "font": ("Segoe UI", 11, "bold"), "padding": [0, 5]},
+        }
+
+        # All style.map calls (hover/selected/pressed state behaviour)
+        style_maps = {
+            "TNotebook.Tab": {"background": [("selected", hover_color)],
+                              "foreground": [("selected", accent_color)]},
+            "TButton": {"background": [("active", hover_color)],
+                        "foreground": [("active", accent_color)],
+                        "relief": [("pressed", "sunken")]},
+            "Apply.TButton": btn_map("#3E8E41"),    # Darker green on hover
+            "Create.TButton": btn_map("#27ae60"),   # Darker green on hover
+            "Clear.TButton": btn_map("#d35400"),    # Darker orange on hover
+            "Cancel.TButton": btn_map("#c0392b"),   # Darker red on hover
+            "Quit.TButton": {"background": [("active", hover_color)],
+                             "foreground": [("active", error_color)],
+                             "relief": [("pressed", "sunken")]},
+            "TCheckbutton": {
+                "background": [("active", bg_color)],
+                "foreground": [("active", accent_color)],
+                "indicatorcolor": [("selected", accent_color), ("!selected", hover_color)],
+                "indicatorbackground": [("selected", hover_color), ("!selected", hover_color)],
+                "indicatorrelief": [("selected", "flat"), ("!selected", "flat")],
+                "indicatorborderwidth": [("selected", 0), ("!selected", 0)],
+                "indicatorforeground": [("selected", accent_color), ("!selected", hover_color)],
+            },
+        }
+
+        for name, opts in style_spec.items():
+            style.configure(name, **opts)
+        for name, opts in style_maps.items():
+            style.map(name, **opts)
+
         # Make tabs expand to fill entire width
         style.layout("TNotebook", [("TNotebook.client", {"sticky": "nswe"})])
         style.layout("TNotebook.Tab", [
@@ -420,221 +1133,113 @@ class MenuSystem:
             })
         ])
         
-        # Configure frame styles
-        style.configure("TFrame", background=bg_color)
-        style.configure("TLabelframe", 
-                       background=bg_color, 
-                       foreground=fg_color,
-                       borderwidth=1,
-                       relief="solid")
-        style.configure("TLabelframe.Label", 
-                       background=bg_color,
-                       foreground=accent_color,
-                       font=("Segoe UI", 11, "bold"),
-                       padding=[0, 5])
-        
-        # Configure label styles
-        style.configure("TLabel", 
-                       background=bg_color,
-                       foreground=fg_color,
-                       font=("Segoe UI", 10),
-                       padding=[5, 2])
-        style.configure("Title.TLabel",
-                       font=("Segoe UI", 18, "bold"),
-                       foreground=accent_color,
-                       padding=[0, 10])
-        style.configure("Subtitle.TLabel",
-                       font=("Segoe UI", 12, "bold"),
-                       foreground=fg_color,
-                       padding=[0, 5])
-        
-        # Configure button styles
-        style.configure("TButton",
-                       background=bg_color,
-                       foreground=fg_color,
-                       padding=[20, 15],  # Increased padding for larger buttons
-                       font=("Segoe UI", 12, "bold"),  # Larger font
-                       borderwidth=1,
-                       relief="solid",
-                       anchor="center",
-                       justify="center")
-        style.map("TButton",
-                 background=[("active", hover_color)],
-                 foreground=[("active", accent_color)],
-                 relief=[("pressed", "sunken")])
-        
-        # Configure Apply button style with light green color
-        style.configure("Apply.TButton",
-                       background="#4CAF50",  # Light green
-                       foreground="#ffffff",
-                       padding=[20, 15],
-                       font=("Segoe UI", 12, "bold"),
-                       borderwidth=1,
-                       relief="solid")
-        style.map("Apply.TButton",
-                 background=[("active", "#3E8E41")],  # Darker green on hover
-                 foreground=[("active", "#ffffff")],
-                 relief=[("pressed", "sunken")])
-        
-        # Configure scene control button styles with colors
-        # Create button - Green
-        style.configure("Create.TButton",
-                       background=success_color,
-                       foreground="#ffffff",
-                       padding=[20, 15],  # Increased padding for larger buttons
-                       font=("Segoe UI", 12, "bold"),  # Larger font
-                       borderwidth=1,
-                       width=30,  # Increased width
-                       relief="solid")
-        style.map("Create.TButton",
-                 background=[("active", "#27ae60")],  # Darker green on hover
-                 foreground=[("active", "#ffffff")],
-                 relief=[("pressed", "sunken")])
-                 
-        # Clear button - Orange
-        style.configure("Clear.TButton",
-                       background="#e67e22",  # Orange
-                       foreground="#ffffff",
-                       padding=[20, 15],  # Increased padding for larger buttons
-                       font=("Segoe UI", 12, "bold"),  # Larger font
-                       borderwidth=1,
-                       width=30,  # Increased width
-                       relief="solid")
-        style.map("Clear.TButton",
-                 background=[("active", "#d35400")],  # Darker orange on hover
-                 foreground=[("active", "#ffffff")],
-                 relief=[("pressed", "sunken")])
-                 
-        # Cancel button - Red
-        style.configure("Cancel.TButton",
-                       background=error_color,
-                       foreground="#ffffff",
-                       padding=[20, 15],  # Increased padding for larger buttons
-                       font=("Segoe UI", 12, "bold"),  # Larger font
-                       borderwidth=1,
-                       width=30,  # Increased width
-                       relief="solid")
-        style.map("Cancel.TButton",
-                 background=[("active", "#c0392b")],  # Darker red on hover
-                 foreground=[("active", "#ffffff")],
-                 relief=[("pressed", "sunken")])
-        
-        # Configure quit button style
-        style.configure("Quit.TButton",
-                       background=bg_color,
-                       foreground=error_color,
-                       padding=[15, 10],
-                       font=("Segoe UI", 12, "bold"),
-                       borderwidth=1,
-                       relief="solid")
-        style.map("Quit.TButton",
-                 background=[("active", hover_color)],
-                 foreground=[("active", error_color)],
-                 relief=[("pressed", "sunken")])
-        
-        # Configure entry styles
-        style.configure("TEntry",
-                       fieldbackground=hover_color,
-                       foreground=fg_color,
-                       borderwidth=1,
-                       relief="solid",
-                       font=("Segoe UI", 10),
-                       padding=[5, 2])
-        
-        # Configure checkbutton styles
-        style.configure("TCheckbutton",
-                       background=bg_color,
-                       foreground=fg_color,
-                       font=("Segoe UI", 10),
-                       padding=[5, 2])
-        style.map("TCheckbutton",
-                 background=[("active", bg_color)],
-                 foreground=[("active", accent_color)],
-                 indicatorcolor=[("selected", accent_color), ("!selected", hover_color)],
-                 indicatorbackground=[("selected", hover_color), ("!selected", hover_color)],
-                 indicatorrelief=[("selected", "flat"), ("!selected", "flat")],
-                 indicatorborderwidth=[("selected", 0), ("!selected", 0)],
-                 indicatorforeground=[("selected", accent_color), ("!selected", hover_color)])
-        
-        # Configure progress bar styles with gradients
-        style.configure("Red.Horizontal.TProgressbar", 
-                       troughcolor=bg_color,
-                       background=error_color,
-                       bordercolor=accent_color,
-                       thickness=10)
-        style.configure("Orange.Horizontal.TProgressbar", 
-                       troughcolor=bg_color,
-                       background=warning_color,
-                       bordercolor=accent_color,
-                       thickness=10)
-        style.configure("Yellow.Horizontal.TProgressbar", 
-                       troughcolor=bg_color,
-                       background=warning_color,
-                       bordercolor=accent_color,
-                       thickness=10)
-        style.configure("Green.Horizontal.TProgressbar", 
-                       troughcolor=bg_color,
-                       background=success_color,
-                       bordercolor=accent_color,
-                       thickness=10)
-
-        # Dark styles specifically for dialogs with white backgrounds
-        style.configure("Dark.TFrame", background="#1a1a1a")
-        style.configure("Dark.TLabelframe", 
-                       background="#1a1a1a", 
-                       foreground=fg_color,
-                       borderwidth=1,
-                       relief="solid")
-        style.configure("Dark.TLabelframe.Label", 
-                       background="#1a1a1a",
-                       foreground=accent_color,
-                       font=("Segoe UI", 11, "bold"),
-                       padding=[0, 5])
+
+    def _sub(self, event, callback):
+        """Subscribe to an EM event and record it for cleanup"""
+        EM.subscribe(event, callback)
+        self._subs.append((event, callback))
 
     def _register_event_handlers(self):
         """Set up event handlers for scene-related events"""
         # Scene creation events
-        EM.subscribe(SCENE_CREATION_PROGRESS, self._on_scene_progress)
-        EM.subscribe(SCENE_CREATION_COMPLETED, self._on_scene_completed)
-        EM.subscribe(SCENE_CREATION_CANCELED, self._on_scene_canceled)
-        EM.subscribe(SCENE_CLEARED, self._on_scene_cleared)
-        
+        self._sub(SCENE_CREATION_PROGRESS, self._on_scene_progress)
+        self._sub(SCENE_CREATION_COMPLETED, self._on_scene_completed)
+        self._sub(SCENE_CREATION_CANCELED, self._on_scene_canceled)
+        self._sub(SCENE_CLEARED, self._on_scene_cleared)
+
         # Handle scene creation requests from menus
-        EM.subscribe('scene/request_creation', self._on_scene_creation_request)
-        
-        EM.subscribe('simulation/frame', self._on_simulation_frame)
-        EM.subscribe('simulation/shutdown', self.cleanup)
-        
+        self._sub('scene/request_creation', self._on_scene_creation_request)
+
+        self._sub('simulation/frame', self._on_simulation_frame)
+        self._sub('simulation/shutdown', self.cleanup)
+
         # Subscribe to UI update trigger
-        EM.subscribe('trigger_ui_update', self._force_ui_update)
-        
+        self._sub('trigger_ui_update', self._force_ui_update)
+
         # Subscribe to dataset capture complete for victim distance updates
-        EM.subscribe('dataset/capture/complete', self._update_victim_indicator)
-        
+        self._sub('dataset/capture/complete', self._update_victim_indicator)
+
         # Subscribe to victim detection events
-        EM.subscribe('victim/detected', self._update_victim_indicator)
-        
+        self._sub('victim/detected', self._update_victim_indicator)
+
         # Subscribe to dataset events
-        EM.subscribe('dataset/batch/saved', self._on_batch_saved)
-        EM.subscribe('dataset/config/updated', self._on_dataset_config_updated)
+        self._sub('dataset/batch/saved', self._on_batch_saved)
+        self._sub('dataset/config/updated', self._on_dataset_config_updated)
 
     def _force_ui_update(self, _):
-        """Force the UI to update immediately"""
-        try:
-            self.root.update()
-        except Exception as e:
-            if hasattr(self, 'verbose') and self.verbose:
-                self.logger.error("MenuSystem", f"Error updating UI: {e}")
+        """Request a UI redraw.
+
+        Marks the UI dirty for the _ui_tick coalescing loop instead of
+        flushing synchronously: any number of trigger_ui_update events in
+        one burst cost a single repaint, and the handler stays safe to call
+        from non-Tk threads (a bare attribute store, like
+        _on_simulation_frame).
+        """
+        self._ui_dirty = True
 
     def _on_simulation_frame(self, _):
-        """Wrapper method to handle simulation frame events and update the UI safely"""
+        """Handle simulation frame events by marking the UI dirty.
+
+        This runs on the publisher's thread, so it must not touch Tk: a
+        single attribute store is atomic under the GIL and needs no lock.
+        The _ui_tick after() loop — which runs inside the Tk mainloop — is
+        the only place that performs the actual repaint."""
+        self._ui_dirty = True
+
+    def _schedule_ui(self, key, fn):
+        """Queue a UI callback, coalescing repeats of the same kind.
+
+        Safe to call from any thread. N updates sharing a key collapse to
+        the latest one, and a single after() drains the whole map, so
+        event bursts cost at most one queued flush per ~16 ms instead of
+        one closure per event."""
+        with self._pending_ui_lock:
+            self._pending_ui_updates[key] = fn
+            if self._ui_flush_scheduled:
+                return
+            self._ui_flush_scheduled = True
         try:
-            self.root.update()
-        except Exception as e:
-            self.logger.error("MenuSystem", f"Error updating UI: {e}")
+            self.root.after(16, self._flush_ui)
+        except Exception:
+            with self._pending_ui_lock:
+                self._ui_flush_scheduled = False  # Tearing down
+
+    def _flush_ui(self):
+        """Run all pending coalesced UI callbacks (Tk thread only)."""
+        with self._pending_ui_lock:
+            updates = list(self._pending_ui_updates.values())
+            self._pending_ui_updates.clear()
+            self._ui_flush_scheduled = False
+        for fn in updates:
+            try:
+                fn()
+            except Exception as e:
+                self.logger.error("MenuSystem", f"Error in deferred UI update: {e}")
 
     def _update_tab_widths(self, event=None):
+        """Debounce tab-width updates during window resizes.
+
+        A window drag fires <Configure> dozens of times per second and each
+        restyle is a Tcl round-trip over every tab, so the actual work is
+        deferred until the resize has been quiet for 50 ms."""
+        # <Configure> bubbles up from every child widget; only the toplevel's
+        # own geometry changes are relevant here
+        if event is not None and event.widget is not self.root:
+            return
+        if self._tab_width_after:
+            self.root.after_cancel(self._tab_width_after)
+        self._tab_width_after = self.root.after(50, self._do_update_tab_widths)
+
+    def _do_update_tab_widths(self):
         """Update tab widths to fill the notebook width evenly when the window is resized."""
+        self._tab_width_after = None
+        self._apply_tab_width()
+
+    def _apply_tab_width(self, margin=2):
+        """Restyle the notebook tabs to share the available width evenly.
+
+        Uses the cached Style instance and skips the Tcl call entirely when
+        the computed width hasn't changed."""
         try:
             tab_count = self.notebook.index('end')
             if tab_count > 0:
@@ -642,10 +1247,13 @@ class MenuSystem:
                 notebook_width = self.notebook.winfo_width()
                 if notebook_width > 0:
                     # Calculate new tab width (with a small margin)
-                    tab_width = max(1, (notebook_width // tab_count) - 2)
+                    tab_width = max(1, (notebook_width // tab_count) - margin)
+                    # Skip the Tcl call when the width didn't actually change
+                    if tab_width == self._last_tab_width:
+                        return
+                    self._last_tab_width = tab_width
                     # Update the style while maintaining centered text
-                    style = ttk.Style()
-                    style.configure('TNotebook.Tab', width=tab_width, justify="center", anchor="center")
+                    self._style.configure('TNotebook.Tab', width=tab_width, justify="center", anchor="center")
         except Exception as e:
             # Ignore errors during resize
             pass
@@ -660,61 +1268,41 @@ class MenuSystem:
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.pack(fill=tk.BOTH, expand=True)
         
-        # Scene tab
-        scene_tab = ttk.Frame(self.notebook)
-        self.notebook.add(scene_tab, text="Scene")
-        self._build_scene_tab(scene_tab)
-        
-        # Controls tab
-        controls_tab = ttk.Frame(self.notebook)
-        self.notebook.add(controls_tab, text="Controls")
-        self._build_controls_tab(controls_tab)
-        
-        # Config tab
-        config_tab = ttk.Frame(self.notebook)
-        self.notebook.add(config_tab, text="Config")
-        self._build_config_tab(config_tab)
-        
-        # Status tab
-        status_tab = ttk.Frame(self.notebook)
-        self.notebook.add(status_tab, text="Status")
-        self._build_status_tab(status_tab)
-        
-        # Help tab
-        help_tab = ttk.Frame(self.notebook)
-        self.notebook.add(help_tab, text="Help")
-        self._build_help_tab(help_tab)
-        
-        # Performance tab
-        perf_tab = ttk.Frame(self.notebook)
-        self.notebook.add(perf_tab, text="Monitor")
-        self._build_performance_tab(perf_tab)
-        
-        # Dataset tab
-        dataset_tab = ttk.Frame(self.notebook)
-        self.notebook.add(dataset_tab, text="Dataset")
-        self._build_dataset_tab(dataset_tab)
-        
-        # Logging tab
-        logging_tab = ttk.Frame(self.notebook)
-        self.notebook.add(logging_tab, text="Logging")
-        self._build_logging_tab(logging_tab)
-        
-        # Configure tab stretching - ensure tabs take full width
-        self.root.update_idletasks()  # Force geometry update
-        tab_count = self.notebook.index('end')
-        if tab_count > 0:
-            # Set tab width to distribute evenly
-            tab_width = self.notebook.winfo_width() // tab_count
-            style = ttk.Style()
-            style.configure('TNotebook.Tab', width=tab_width, justify="center", anchor="center")
-        
+        # Create a placeholder frame per tab and defer the real widget tree
+        # until the tab is first selected. Tk widget creation dominates
+        # startup time, and the user only ever sees one tab at launch —
+        # lazy building amortizes 7/8 of that work over the session.
+        tabs = [
+            ("Scene", self._build_scene_tab),
+            ("Controls", self._build_controls_tab),
+            ("Config", self._build_config_tab),
+            ("Status", self._build_status_tab),
+            ("Help", self._build_help_tab),
+            ("Monitor", self._build_performance_tab),
+            ("Dataset", self._build_dataset_tab),
+            ("Logging", self._build_logging_tab),
+        ]
+        for text, builder in tabs:
+            tab = ttk.Frame(self.notebook)
+            self.notebook.add(tab, text=text)
+            tab._build_fn = builder
+
+        # Configure tab stretching - ensure tabs take full width. This is
+        # the single synchronous geometry flush during construction; the
+        # notebook needs a realized width before the tabs can be sized.
+        self.root.update_idletasks()
+        self._apply_tab_width(margin=0)
+
         # Bind window resize to update tab widths
         self.root.bind("<Configure>", self._update_tab_widths)
             
         # Connect tab change event
         self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
-        
+
+        # Build the initially selected tab right away; the selection event
+        # for the first tab fired before the binding above existed
+        self._lazy_build_current()
+
         # Add quit button at the bottom
         quit_frame = ttk.Frame(self.root)
         quit_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=10)
@@ -723,76 +1311,139 @@ class MenuSystem:
                            style="Quit.TButton", command=self._quit)
         quit_btn.pack(fill=tk.X)
 
+    def _lazy_build_current(self):
+        """Build the widget tree of the selected tab on first visit"""
+        try:
+            tab = self.notebook.nametowidget(self.notebook.select())
+        except (tk.TclError, KeyError):
+            return
+        builder = getattr(tab, '_build_fn', None)
+        if builder is not None:
+            tab._build_fn = None
+            builder(tab)
+
     def _on_tab_changed(self, event):
         """Handle tab selection change"""
-        self._pause_monitoring()  # Always pause first
-        
         # Get the current tab index and name
         tab_idx = event.widget.index('current')
         tab_name = event.widget.tab(tab_idx, 'text')
-        
+
+        # Re-selecting the already-active tab needs no rebuild or refresh
+        if tab_name == self._current_tab:
+            return
+
+        # Materialize the tab before anything below touches its widgets
+        self._lazy_build_current()
+
+        self._pause_monitoring()  # Always pause first
+
         # Update the current tab attribute
         self._current_tab = tab_name
-        
+
         self.logger.debug_at_level(DEBUG_L2, "MenuSystem", f"Tab changed to: {tab_name}")
-        
+
+        # Per-tab refreshes are queued via after_idle so they coalesce with
+        # the pending redraw instead of running synchronously in the handler
         if tab_name == "Monitor":
             # Resume monitoring only if needed
-            if self.config.get("enable_performance_monitoring", False):
+            if self._perf_monitoring_enabled:
                 self._resume_monitoring()
         elif tab_name == "Logging":
             # Update logging status when tab is selected
-            self._update_logging_status()
+            self.root.after_idle(self._update_logging_status)
         elif tab_name == "Status":
             # Update status indicators
-            self._update_victim_indicator({'victim_vec': (0, 0, 0, 0)})
+            self.root.after_idle(self._update_victim_indicator, {'victim_vec': (0, 0, 0, 0)})
         elif tab_name == "Config":
             # Update config values
-            self._on_config_updated_gui(None)
+            self.root.after_idle(self._on_config_updated_gui, None)
         elif tab_name == "Dataset":
             # Update batch numbers when Dataset tab is selected
             if hasattr(self, '_update_batch_numbers'):
-                self._update_batch_numbers()
-            
-        # Force a single update
-        self.root.update_idletasks()
+                self.root.after_idle(self._update_batch_numbers)
+
+        # No forced update_idletasks here: Tk flushes idle work as soon as
+        # this handler returns
 
     def _pause_monitoring(self):
         """Pause performance monitoring"""
         if self._monitoring_after_id:
             self.root.after_cancel(self._monitoring_after_id)
             self._monitoring_after_id = None
+        if self._metrics_subscribed:
+            EM.unsubscribe('metrics/updated', self._on_metrics_event)
+            self._metrics_subscribed = False
         self._monitoring_active = False
 
     def _resume_monitoring(self):
         """Resume performance monitoring"""
-        if not self._monitoring_active and self.config.get("enable_performance_monitoring", False):
-            self._monitoring_active = True
+        if not self._monitoring_active and self._perf_monitoring_enabled:
             self._schedule_ui_update()
 
+    def _ensure_psutil_thread(self):
+        """Start the background psutil sampler if it isn't already running"""
+        if self._psutil_thread is None or not self._psutil_thread.is_alive():
+            self._psutil_thread = threading.Thread(target=self._psutil_loop, daemon=True)
+            self._psutil_thread.start()
+
+    def _psutil_loop(self):
+        """Sample psutil metrics at ~1 Hz off the Tk mainloop.
+
+        cpu_percent(interval=1.0) blocks in native code with the GIL
+        released, which both paces the loop and keeps the sampling cost out
+        of the UI thread; the Tk-side refresh just reads the cached floats
+        (single attribute stores are atomic under the GIL). After each
+        sample the loop publishes metrics/updated so the UI refreshes on
+        real data instead of polling. The thread exits on its own when
+        monitoring is paused or the UI shuts down."""
+        try:
+            process = psutil.Process()
+            while self._monitoring_active and self._ui_active:
+                self._last_cpu = psutil.cpu_percent(interval=1.0)
+                self._last_mem_mb = process.memory_info().rss / (1024 * 1024)
+                self._last_mem_percent = psutil.virtual_memory().percent
+                try:
+                    self._last_cpu_freq = psutil.cpu_freq().current
+                except Exception:
+                    self._last_cpu_freq = 0.0
+                EM.publish('metrics/updated', None)
+        except Exception as e:
+            self.logger.error("MenuSystem", f"psutil sampler stopped: {e}")
+
+    def _on_metrics_event(self, _):
+        """Marshal a metrics sample into a coalesced Tk-side refresh.
+
+        Runs on the sampler thread; the actual widget updates are queued via
+        after_idle so they merge with pending redraws in the mainloop. A
+        max-rate guard keeps bursts from stacking idle callbacks."""
+        if not self._monitoring_active or self._current_tab != "Monitor":
+            return
+        now = time.monotonic()
+        if now - self._last_ui_update < 0.1:
+            return
+        self._last_ui_update = now
+        try:
+            self.root.after_idle(self._update_performance_metrics)
+        except Exception:
+            pass  # Window is being torn down
+
     def _schedule_ui_update(self):
-        """Schedule the next UI update with optimized timing"""
-        # Cancel any existing scheduled update
-        if self._monitoring_after_id:
-            self.root.after_cancel(self._monitoring_after_id)
-            self._monitoring_after_id = None
-        
-        # Only schedule new update if monitoring is enabled
-        if self.config.get("enable_performance_monitoring", False):
-            current_time = time.time()
-            self._frame_times.append(current_time)
-            
-            # Only update the UI if we're on the Monitor tab
-            if self._current_tab == "Monitor":
-                if current_time - self._last_ui_update >= 0.1:  # 100ms update interval
-                    self._last_ui_update = current_time
-                    self._update_performance_metrics()
-            
-            # Schedule next update regardless of current tab
-            self._monitoring_after_id = self.root.after(100, self._schedule_ui_update)
+        """Activate or deactivate push-driven performance monitoring.
+
+        Metric refreshes are event-driven: the sampler thread publishes
+        metrics/updated when it has fresh data, so there is no fixed-rate
+        Tk polling loop waking the mainloop while nothing changes."""
+        if self._perf_monitoring_enabled:
+            if not self._metrics_subscribed:
+                EM.subscribe('metrics/updated', self._on_metrics_event)
+                self._metrics_subscribed = True
             self._monitoring_active = True
+            self._ensure_psutil_thread()
         else:
             # Only clear metrics if monitoring is disabled
+            if self._metrics_subscribed:
+                EM.unsubscribe('metrics/updated', self._on_metrics_event)
+                self._metrics_subscribed = False
             self._monitoring_active = False
             self._clear_performance_metrics()
 
@@ -800,15 +1451,19 @@ class MenuSystem:
         """
         Wrapper for button actions to prevent space key from triggering them.
         This prevents accidental scene operations when using space for drone movement.
+
+        Returns a partial over one shared dispatcher instead of minting a
+        fresh closure per button, so every click runs the same code object.
         """
-        def safe_action(*args, **kwargs):
-            # Check if space key is currently pressed
-            if 'space' in self._ui_pressed_keys:
-                self.logger.debug_at_level(DEBUG_L1, "MenuSystem", "Ignoring button action triggered by space key")
-                return
-            # Call the original action function
-            return action_func(*args, **kwargs)
-        return safe_action
+        return functools.partial(self._dispatch_safe_action, action_func)
+
+    def _dispatch_safe_action(self, action_func, *args, **kwargs):
+        # Check if space key is currently pressed
+        if self._SPACE in self._ui_pressed_keys:
+            self.logger.debug_at_level(DEBUG_L1, "MenuSystem", "Ignoring button action triggered by space key")
+            return
+        # Call the original action function
+        return action_func(*args, **kwargs)
 
     def _build_scene_tab(self, parent):
         # Title with modern styling
@@ -819,16 +1474,19 @@ class MenuSystem:
         # Progress bar container with modern styling
         progress_frame = ttk.Frame(parent)
         progress_frame.pack(fill="x", pady=10)
-        
-        # Progress bar for scene creation with enhanced styling
+        progress_frame.columnconfigure(0, weight=1)
+
+        # Progress bar for scene creation with enhanced styling. Gridded so
+        # visibility toggles via grid_remove()/grid(), which restores the
+        # saved slot instead of re-running pack layout on the whole frame
         self.progress_var = tk.DoubleVar()
-        self.progress_bar = ttk.Progressbar(progress_frame, 
-                                          variable=self.progress_var, 
+        self.progress_bar = ttk.Progressbar(progress_frame,
+                                          variable=self.progress_var,
                                           maximum=1.0,
                                           style="Green.Horizontal.TProgressbar",
                                           mode='determinate')
-        self.progress_bar.pack(fill="x", pady=5)
-        self.progress_bar.pack_forget()  # Hide initially
+        self.progress_bar.grid(row=0, column=0, sticky="ew", pady=5)
+        self.progress_bar.grid_remove()  # Hide initially
         
         # Status label with enhanced styling
         status_frame = ttk.Frame(parent)
@@ -843,7 +1501,7 @@ class MenuSystem:
         def create_scene_with_event():
             # Check if this was triggered by a space key press (which should be ignored)
             # This prevents accidental scene creation when using space for drone movement
-            if 'space' in self._ui_pressed_keys:
+            if self._SPACE in self._ui_pressed_keys:
                 self.logger.debug_at_level(DEBUG_L1, "MenuSystem", "Ignoring scene creation triggered by space key")
                 return
                 
@@ -862,16 +1520,12 @@ class MenuSystem:
             self.config["tree_spawn_interval"] = float(self.config.get("tree_spawn_interval", 30.0))
             self.config["bird_speed"] = float(self.config.get("bird_speed", 1.0))
             
-            # Disable all buttons during scene creation
-            for btn in self.scene_buttons:
-                if "Cancel" not in btn["text"]:
-                    btn.configure(state="disabled")
-                else:
-                    # Enable the cancel button during scene creation
-                    btn.configure(state="normal")
-            
+            # Disable all buttons during scene creation (Cancel stays enabled)
+            self._set_scene_buttons_state("disabled", cancel="normal")
+
+
             # Show progress bar with animation
-            self.progress_bar.pack(fill="x", pady=5)
+            self._set_progress_bar_visible(True)
             self.progress_var.set(0.0)
             self.status_label.configure(text="Creating scene...", foreground="#00b4d8")
             
@@ -899,16 +1553,12 @@ class MenuSystem:
             # Create confirmation dialog
             dialog = tk.Toplevel(self.root)
             dialog.title("Confirm Clear")
-            dialog.geometry("300x150")
             dialog.configure(bg="#1a1a1a")
             dialog.transient(self.root)  # Make dialog modal
             dialog.grab_set()  # Make dialog modal
-            
+
             # Center dialog on parent window
-            dialog.update_idletasks()
-            x = self.root.winfo_x() + (self.root.winfo_width() - dialog.winfo_width()) // 2
-            y = self.root.winfo_y() + (self.root.winfo_height() - dialog.winfo_height()) // 2
-            dialog.geometry(f"+{x}+{y}")
+            self._center_dialog(dialog, 300, 150)
             
             # Add padding frame
             frame = ttk.Frame(dialog, padding=20)
@@ -923,16 +1573,10 @@ class MenuSystem:
             # Buttons frame
             btn_frame = ttk.Frame(frame)
             btn_frame.pack(fill="x", pady=(0, 10))
-            
-            # Create a style specifically for these confirmation buttons
-            style = ttk.Style()
+
+            # Registered once in _configure_styles
             btn_style = "Confirmation.TButton"
-            style.configure(btn_style, 
-                           padding=[10, 10], 
-                           font=("Segoe UI", 11, "bold"),
-                           anchor="center",
-                           justify="center")
-            
+
             # Yes button
             yes_btn = ttk.Button(btn_frame, 
                               text="Yes, Clear",
@@ -1000,6 +1644,7 @@ class MenuSystem:
         # Initially disable the Cancel button since creation is not in progress
         cancel_btn.configure(state="disabled")
         self.scene_buttons.append(cancel_btn)
+        self._scene_button_states = ["normal", "normal", "disabled"]
             
         # Add visual separator
         separator = ttk.Separator(parent, orient='horizontal')
@@ -1011,6 +1656,94 @@ class MenuSystem:
         self.status_label.configure(text="Clearing scene...", foreground="#e74c3c")
         clear_scene()
 
+    def _make_row(self, parent, key, label, typ, bold=False, default='', pady=2):
+        """Create one labelled config row and register its var and widget."""
+        frame = ttk.Frame(parent)
+        frame.pack(fill="x", pady=pady)
+        if bold:
+            ttk.Label(frame, text=label, width=25, style="TLabel",
+                      font=("Segoe UI", 10, "bold")).pack(side="left", padx=(0, 10))
+        else:
+            ttk.Label(frame, text=label, width=25, style="TLabel").pack(side="left", padx=(0, 10))
+
+        if typ is bool:
+            var = tk.BooleanVar(value=self.config.get(key, bool(default)))
+            widget = ttk.Checkbutton(frame, variable=var)
+            widget.pack(side="left", fill="x", expand=True)
+            # One bound method for every checkbox trace; the Tcl variable
+            # name passed to the callback maps back to the config key
+            self._bool_vars_by_name[str(var)] = (key, var)
+            var.trace_add('write', self._on_bool_var_write)
+        else:
+            # Typed variables skip the string round-trip on every commit;
+            # keystroke validation keeps unparseable text out of the entry
+            value = self.config.get(key, default)
+            try:
+                value = typ(value)
+            except (TypeError, ValueError):
+                value = typ(0)
+            if typ is int:
+                var = tk.IntVar(value=value)
+                vcmd = self._vcmd_int
+            else:
+                var = tk.DoubleVar(value=value)
+                vcmd = self._vcmd_float
+            widget = ttk.Entry(frame, textvariable=var, width=20,
+                               validate='key', validatecommand=(vcmd, '%P'))
+            widget.pack(side="left", fill="x", expand=True)
+            # One bound method for every entry; the key rides on the widget
+            widget._config_key = key
+            widget.bind('<Return>', self._on_config_row_commit)
+            widget.bind('<FocusOut>', self._on_config_row_commit)
+
+        self._config_vars[key] = var
+        self._config_widgets[key] = widget
+        (self._bool_var_keys if typ is bool else self._num_var_keys).add(key)
+        return widget
+
+    def _on_bool_var_write(self, var_name, *_):
+        """Shared write trace for all config checkbox variables."""
+        entry = self._bool_vars_by_name.get(var_name)
+        if entry is not None:
+            key, var = entry
+            self._update_config(key, var.get())
+
+    def _on_config_row_commit(self, event):
+        """Shared <Return>/<FocusOut> handler for all config entry rows.
+
+        Commits are debounced per key: back-to-back fires (hitting Return
+        then tabbing away, or the FocusOut that precedes an Apply click)
+        cost a single trailing _update_config call."""
+        key = getattr(event.widget, '_config_key', None)
+        if key is None:
+            return
+        pending = self._pending_commits.pop(key, None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self._pending_commits[key] = self.root.after(50, self._do_commit, key)
+
+    def _do_commit(self, key):
+        """Trailing edge of a debounced entry commit."""
+        self._pending_commits.pop(key, None)
+        try:
+            value = self._config_vars[key].get()
+        except tk.TclError:
+            return  # Entry is empty or mid-edit; keep the stored value
+        self._update_config(key, value)
+
+    def _center_dialog(self, dialog, width, height, parent=None):
+        """Size and center a dialog over its parent in one geometry call.
+
+        Dialog sizes are fixed, so the position can be computed from the
+        parent's geometry alone — no update_idletasks flush just to ask Tk
+        for the dialog's own (not yet realized) dimensions, and no visible
+        reposition after the first map.
+        """
+        parent = parent if parent is not None else self.root
+        x = parent.winfo_x() + (parent.winfo_width() - width) // 2
+        y = parent.winfo_y() + (parent.winfo_height() - height) // 2
+        dialog.geometry(f"{width}x{height}+{x}+{y}")
+
     def _build_config_tab(self, parent):
         # Create a ScrollFrame for the config options
         scroll_frame = ScrollFrame(parent, bg="#0a0a0a")
@@ -1026,65 +1759,11 @@ class MenuSystem:
         dynamic_frame = ttk.LabelFrame(scrollable_frame, text="Dynamic Objects", padding=15, labelanchor="n")
         dynamic_frame.pack(fill="x", pady=10, padx=5)
         
-        # Falling Trees control
-        trees_frame = ttk.Frame(dynamic_frame)
-        trees_frame.pack(fill="x", pady=2)
-        ttk.Label(trees_frame, text="Number of Falling Trees:", width=25, style="TLabel", font=("Segoe UI", 10, "bold")).pack(side="left", padx=(0, 10))
-        trees_var = tk.StringVar(value=str(self.config.get("num_falling_trees", 5)))
-        trees_entry = ttk.Entry(trees_frame, textvariable=trees_var, width=20)
-        trees_entry.pack(side="left", fill="x", expand=True)
-        trees_entry.bind('<Return>', lambda e: self._update_config("num_falling_trees", trees_var.get()))
-        trees_entry.bind('<FocusOut>', lambda e: self._update_config("num_falling_trees", trees_var.get()))
-        self._config_vars["num_falling_trees"] = trees_var
-        self._config_widgets["num_falling_trees"] = trees_entry
-        
-        # Tree Spawn Interval control
-        spawn_frame = ttk.Frame(dynamic_frame)
-        spawn_frame.pack(fill="x", pady=2)
-        ttk.Label(spawn_frame, text="Tree Spawn Interval (s):", width=25, style="TLabel").pack(side="left", padx=(0, 10))
-        spawn_var = tk.StringVar(value=str(self.config.get("tree_spawn_interval", 30.0)))
-        spawn_entry = ttk.Entry(spawn_frame, textvariable=spawn_var, width=20)
-        spawn_entry.pack(side="left", fill="x", expand=True)
-        spawn_entry.bind('<Return>', lambda e: self._update_config("tree_spawn_interval", spawn_var.get()))
-        spawn_entry.bind('<FocusOut>', lambda e: self._update_config("tree_spawn_interval", spawn_var.get()))
-        self._config_vars["tree_spawn_interval"] = spawn_var
-        self._config_widgets["tree_spawn_interval"] = spawn_entry
-
-        # Birds control
-        birds_frame = ttk.Frame(dynamic_frame)
-        birds_frame.pack(fill="x", pady=2)
-        ttk.Label(birds_frame, text="Number of Birds:", width=25, style="TLabel", font=("Segoe UI", 10, "bold")).pack(side="left", padx=(0, 10))
-        birds_var = tk.StringVar(value=str(self.config.get("num_birds", 10)))
-        birds_entry = ttk.Entry(birds_frame, textvariable=birds_var, width=20)
-        birds_entry.pack(side="left", fill="x", expand=True)
-        birds_entry.bind('<Return>', lambda e: self._update_config("num_birds", birds_var.get()))
-        birds_entry.bind('<FocusOut>', lambda e: self._update_config("num_birds", birds_var.get()))
-        self._config_vars["num_birds"] = birds_var
-        self._config_widgets["num_birds"] = birds_entry
-
-        # Bird Speed control
-        bird_speed_frame = ttk.Frame(dynamic_frame)
-        bird_speed_frame.pack(fill="x", pady=2)
-        ttk.Label(bird_speed_frame, text="Bird Movement Speed:", width=25, style="TLabel", font=("Segoe UI", 10, "bold")).pack(side="left", padx=(0, 10))
-        bird_speed_var = tk.StringVar(value=str(self.config.get("bird_speed", 1.0)))
-        bird_speed_entry = ttk.Entry(bird_speed_frame, textvariable=bird_speed_var, width=20)
-        bird_speed_entry.pack(side="left", fill="x", expand=True)
-        bird_speed_entry.bind('<Return>', lambda e: self._update_config("bird_speed", bird_speed_var.get()))
-        bird_speed_entry.bind('<FocusOut>', lambda e: self._update_config("bird_speed", bird_speed_var.get()))
-        self._config_vars["bird_speed"] = bird_speed_var
-        self._config_widgets["bird_speed"] = bird_speed_entry
-        
-        # Keep Fallen Trees toggle
-        keep_trees_frame = ttk.Frame(dynamic_frame)
-        keep_trees_frame.pack(fill="x", pady=5)
-        ttk.Label(keep_trees_frame, text="Keep Fallen Trees:", width=25, style="TLabel", font=("Segoe UI", 10, "bold")).pack(side="left", padx=(0, 10))
-        keep_trees_var = tk.BooleanVar(value=self.config.get("keep_fallen_trees", False))
-        keep_trees_chk = ttk.Checkbutton(keep_trees_frame, variable=keep_trees_var)
-        keep_trees_chk.pack(side="left", fill="x", expand=True)
-        keep_trees_var.trace_add('write', lambda *_: self._update_config("keep_fallen_trees", keep_trees_var.get()))
-        self._config_vars["keep_fallen_trees"] = keep_trees_var
-        self._config_widgets["keep_fallen_trees"] = keep_trees_chk
-        
+        # Dynamic object rows share one factory instead of hand-rolled blocks
+        for key, label, typ, bold, default in _DYNAMIC_ROWS:
+            self._make_row(dynamic_frame, key, label, typ, bold, default,
+                           pady=5 if typ is bool else 2)
+
         # Add a tooltip or help text for the keep fallen trees option
         keep_trees_info = ttk.Label(dynamic_frame, text="Note: When checked, fallen trees will stay on the ground instead of being removed when new trees spawn", 
                                    style="Small.TLabel", foreground="#aaaaaa")
@@ -1095,85 +1774,23 @@ class MenuSystem:
         env_frame.pack(fill="x", pady=10, padx=5)
         
         # Add static tree settings first in Environment Settings
-        static_trees_frame = ttk.Frame(env_frame)
-        static_trees_frame.pack(fill="x", pady=2)
-        ttk.Label(static_trees_frame, text="Number of Static Trees:", width=25, style="TLabel", font=("Segoe UI", 10, "bold")).pack(side="left", padx=(0, 10))
-        static_trees_var = tk.StringVar(value=str(self.config.get("num_trees", 0)))
-        static_trees_entry = ttk.Entry(static_trees_frame, textvariable=static_trees_var, width=20)
-        static_trees_entry.pack(side="left", fill="x", expand=True)
-        static_trees_entry.bind('<Return>', lambda e: self._update_config("num_trees", static_trees_var.get()))
-        static_trees_entry.bind('<FocusOut>', lambda e: self._update_config("num_trees", static_trees_var.get()))
-        self._config_vars["num_trees"] = static_trees_var
-        self._config_widgets["num_trees"] = static_trees_entry
-        
+        self._make_row(env_frame, *_STATIC_TREES_ROW)
+
         # Add other environment-related fields
-        env_fields = [f for f in FIELDS if f['key'] in ['num_rocks', 'num_bushes', 'num_foliage']]
-        for field in env_fields:
-            key, desc, typ = field['key'], field['desc'], field['type']
-            frame = ttk.Frame(env_frame)
-            frame.pack(fill="x", pady=2)
-            
-            # Make specific labels bold
-            if key in ['num_rocks', 'num_bushes', 'num_foliage']:
-                label = ttk.Label(frame, text=desc+":", width=25, style="TLabel", font=("Segoe UI", 10, "bold"))
-            else:
-                label = ttk.Label(frame, text=desc+":", width=25, style="TLabel")
-            label.pack(side="left", padx=(0, 10))
-            
-            if typ is bool:
-                var = tk.BooleanVar(value=self.config.get(key, False))
-                chk = ttk.Checkbutton(frame, variable=var)
-                chk.pack(side="left", fill="x", expand=True)
-                var.trace_add('write', lambda *_, k=key, v=var: self._update_config(k, v.get()))
-                widget = chk
-            else:
-                var = tk.StringVar(value=str(self.config.get(key, '')))
-                ent = ttk.Entry(frame, textvariable=var, width=20)
-                ent.pack(side="left", fill="x", expand=True)
-                ent.bind('<Return>', lambda e, k=key, v=var: self._update_config(k, v.get()))
-                ent.bind('<FocusOut>', lambda e, k=key, v=var: self._update_config(k, v.get()))
-                widget = ent
-            self._config_vars[key] = var
-            self._config_widgets[key] = widget
-            
+        for field in _ENV_FIELDS:
+            self._make_row(env_frame, field['key'], field['desc'] + ":",
+                           field['type'], bold=True)
+
         # Simulation Settings Section with centered title
         sim_frame = ttk.LabelFrame(scrollable_frame, text="Simulation Settings", padding=15, labelanchor="n")
         sim_frame.pack(fill="x", pady=10, padx=5)
         
         # Add simulation-related fields
-        sim_fields = [f for f in FIELDS if f['key'] not in [
-            'num_rocks', 'num_bushes', 'num_foliage', 
-            'num_birds', 'num_falling_trees', 'tree_spawn_interval', 
-            'num_trees', 'rc_sensitivity', 'bird_speed'
-        ]]
-        for field in sim_fields:
-            key, desc, typ = field['key'], field['desc'], field['type']
-            frame = ttk.Frame(sim_frame)
-            frame.pack(fill="x", pady=2)
-            
+        for field in _SIM_FIELDS:
             # Make area size label bold
-            if key == 'area_size':
-                label = ttk.Label(frame, text=desc+":", width=25, style="TLabel", font=("Segoe UI", 10, "bold"))
-            else:
-                label = ttk.Label(frame, text=desc+":", width=25, style="TLabel")
-            label.pack(side="left", padx=(0, 10))
-            
-            if typ is bool:
-                var = tk.BooleanVar(value=self.config.get(key, False))
-                chk = ttk.Checkbutton(frame, variable=var)
-                chk.pack(side="left", fill="x", expand=True)
-                var.trace_add('write', lambda *_, k=key, v=var: self._update_config(k, v.get()))
-                widget = chk
-            else:
-                var = tk.StringVar(value=str(self.config.get(key, '')))
-                ent = ttk.Entry(frame, textvariable=var, width=20)
-                ent.pack(side="left", fill="x", expand=True)
-                ent.bind('<Return>', lambda e, k=key, v=var: self._update_config(k, v.get()))
-                ent.bind('<FocusOut>', lambda e, k=key, v=var: self._update_config(k, v.get()))
-                widget = ent
-            self._config_vars[key] = var
-            self._config_widgets[key] = widget
-            
+            self._make_row(sim_frame, field['key'], field['desc'] + ":",
+                           field['type'], bold=(field['key'] == 'area_size'))
+
         # Add a single "Apply Changes" button to handle all changes
         apply_btn = ttk.Button(scrollable_frame, text="Apply Changes", 
                               command=self._apply_all_changes,
@@ -1202,10 +1819,10 @@ class MenuSystem:
             self._apply_all_config_changes()
             
             # Get and validate dynamic object values
-            num_birds = max(0, int(self._config_vars["num_birds"].get()))
-            num_trees = max(0, int(self._config_vars["num_falling_trees"].get()))
-            tree_spawn = max(5.0, float(self._config_vars["tree_spawn_interval"].get()))
-            bird_speed = max(0.1, min(5.0, float(self._config_vars["bird_speed"].get())))  # Limit speed between 0.1 and 5.0
+            num_birds = max(0, self._config_vars["num_birds"].get())
+            num_trees = max(0, self._config_vars["num_falling_trees"].get())
+            tree_spawn = max(5.0, self._config_vars["tree_spawn_interval"].get())
+            bird_speed = max(0.1, min(5.0, self._config_vars["bird_speed"].get()))  # Limit speed between 0.1 and 5.0
             keep_fallen_trees = bool(self._config_vars["keep_fallen_trees"].get())
             
             # Update the config
@@ -1233,52 +1850,93 @@ class MenuSystem:
             return False
 
     def _apply_all_config_changes(self):
-        """Apply all changes to the configuration."""
+        """Apply all changes to the configuration.
+
+        Conversion happens for every field, but config/updated is only
+        published for keys whose stored value actually changed — an apply
+        typically touches one or two fields, so subscribers no longer get a
+        full storm of no-op notifications."""
+        # Cancel any debounced entry commits first; the loop below covers
+        # every key, so letting them fire afterwards would double-process
+        for after_id in self._pending_commits.values():
+            self.root.after_cancel(after_id)
+        self._pending_commits.clear()
+
         for key, var in self._config_vars.items():
-            self._update_config(key, var.get())
-            
+            try:
+                value = var.get()
+            except tk.TclError:
+                continue  # Empty/mid-edit entry keeps its stored value
+            if self._update_config(key, value, publish=False):
+                EM.publish('config/updated', key)
+
         # Provide feedback to the user
         self.status_label.configure(text="Configuration updated!")
         self.root.after(1000, lambda: self.status_label.configure(text=""))
 
-    def _update_config(self, key, value):
-        # convert value to proper type and update
-        for field in FIELDS:
-            if field['key'] == key:
-                typ = field['type']
+    def _update_config(self, key, value, publish=True):
+        """Convert value to the field's type and store it in config.
+
+        Args:
+            key: Configuration key to update
+            value: New value (usually a string from a Tk variable)
+            publish: Publish config/updated when the stored value changed
+
+        Returns:
+            True if the stored value changed.
+        """
+        field = _FIELD_INDEX.get(key)
+        if field is None:
+            return False
+        typ = field['type']
+        old_value = self.config.get(key)
+        try:
+            # Special handling for move_step to round to two decimal places (changed from 1 to 2)
+            if key == "move_step" and typ is float:
                 try:
-                    # Special handling for move_step to round to two decimal places (changed from 1 to 2)
-                    if key == "move_step" and typ is float:
-                        try:
-                            # Make sure we don't set a zero value if a non-zero value already exists
-                            new_value = float(value)
-                            if new_value == 0.0 and key in self.config and self.config[key] > 0:
-                                self.logger.info("MenuSystem", f"Preserving non-zero value for {key}: {self.config[key]}")
-                            else:
-                                # Round to 2 decimal places to preserve values like 0.05
-                                self.config[key] = round(new_value, 2)
-                                self.logger.info("MenuSystem", f"Set value for {key}: {self.config[key]}")
-                        except ValueError:
-                            # If conversion fails, use the current value or 0.2 as default
-                            self.config[key] = self.config.get(key, 0.2)
-                    elif typ is int:
-                        # Handle conversion of floating-point strings to integers
-                        try:
-                            # First convert to float to handle values like "10.0"
-                            float_value = float(value)
-                            # Then convert to int
-                            self.config[key] = int(float_value)
-                        except ValueError as e:
-                            self.logger.error("MenuSystem", f"Error converting {value} to int: {e}")
-                            # Keep the current value if conversion fails
-                            if key in self.config:
-                                self.logger.info("MenuSystem", f"Keeping current value for {key}: {self.config[key]}")
+                    # Make sure we don't set a zero value if a non-zero value already exists
+                    new_value = float(value)
+                    if new_value == 0.0 and old_value is not None and old_value > 0:
+                        self.logger.info("MenuSystem", f"Preserving non-zero value for {key}: {old_value}")
+                        new_value = old_value
                     else:
-                        self.config[key] = typ(value)
-                    EM.publish('config/updated', key)
-                except Exception as e:
-                    self.logger.error("MenuSystem", f"Error updating configuration {key}: {e}")
-                break
+                        # Round to 2 decimal places to preserve values like 0.05
+                        new_value = round(new_value, 2)
+                except ValueError:
+                    # If conversion fails, use the current value or 0.2 as default
+                    new_value = old_value if old_value is not None else 0.2
+            elif typ is int:
+                # Handle conversion of floating-point strings to integers
+                try:
+                    # First convert to float to handle values like "10.0"
+                    new_value = int(float(value))
+                except ValueError as e:
+                    self.logger.error("MenuSystem", f"Error converting {value} to int: {e}")
+                    # Keep the current value if conversion fails
+                    if old_value is not None:
+                        self.logger.info("MenuSystem", f"Keeping current value for {key}: {old_value}")
+                    new_value = old_value
+            else:
+                new_value = typ(value)
+
+            # No-op commits (the common <FocusOut>-without-edit case) stop
+            # here, before the dict write and any subscriber fan-out; floats
+            # compare with an absolute tolerance to ignore FP noise
+            if typ is float and old_value is not None and new_value is not None:
+                changed = not math.isclose(new_value, old_value, rel_tol=0.0, abs_tol=1e-9)
+            else:
+                changed = new_value != old_value
+            if not changed:
+                return False
+            self.config[key] = new_value
+            if key == "move_step":
+                self.logger.info("MenuSystem", f"Set value for {key}: {new_value}")
+            if publish:
+                EM.publish('config/updated', key)
+            return True
+        except Exception as e:
+            self.logger.error("MenuSystem", f"Error updating configuration {key}: {e}")
+            return False
 
     def _on_config_updated_gui(self, key):
         """
@@ -1289,23 +1947,28 @@ class MenuSystem:
         if key in self._config_vars:
             var = self._config_vars[key]
             new_val = self.config.get(key)
-            # Set variable (convert to string for non-bool)
-            if isinstance(var, tk.StringVar):
-                var.set(str(new_val))
-            else:
+            # Set variable (typed vars accept numbers directly)
+            if isinstance(var, tk.BooleanVar):
                 var.set(bool(new_val))
+            else:
+                var.set(new_val if new_val is not None else 0)
             # Visual feedback: highlight updated widget
             widget = self._config_widgets.get(key)
             if widget:
                 try:
                     widget.configure(background='lightyellow')
-                    # revert after short delay
-                    widget.after(800, lambda w=widget: w.configure(background='white'))
+                    # Queue for the shared revert timer: a burst of config
+                    # syncs costs one after() instead of one per widget
+                    self._pending_highlight_reverts.add(widget)
+                    if not self._revert_scheduled:
+                        self._revert_scheduled = True
+                        self.root.after(800, self._revert_highlights)
                 except Exception:
                     pass
             
             # Update monitoring status if the key is enable_performance_monitoring
             if key == "enable_performance_monitoring":
+                self._perf_monitoring_enabled = bool(new_val)
                 # Restart or stop monitoring based on new value
                 if new_val and not self._monitoring_active:
                     self._schedule_ui_update()
@@ -1313,21 +1976,44 @@ class MenuSystem:
                     self._clear_performance_metrics()
             
             # Update single-axis mode if needed
-            elif key == "single_axis_mode" and hasattr(self, 'single_axis_mode_var'):
+            elif key == "single_axis_mode" and self.single_axis_mode_var is not None:
                 self.single_axis_mode_var.set(self.config.get('single_axis_mode', False))
+
+            # Keep the cached movement step sizes in sync with config
+            if key in ('move_step', 'rotate_step_deg', 'single_axis_mode'):
+                self._refresh_movement_steps()
         else:
             # If key is None or unknown, refresh all
-            for k, var in self._config_vars.items():
-                val = self.config.get(k)
-                if isinstance(var, tk.StringVar):
-                    var.set(str(val))
-                else:
-                    var.set(bool(val))
+            # The keys are partitioned by var kind at build time, so these
+            # loops need no isinstance per entry; locals avoid repeated
+            # attribute lookups across the full field list
+            cfg_get = self.config.get
+            config_vars = self._config_vars
+            for k in self._num_var_keys:
+                val = cfg_get(k)
+                config_vars[k].set(val if val is not None else 0)
+            for k in self._bool_var_keys:
+                config_vars[k].set(bool(cfg_get(k)))
                     
             # Also update single-axis mode if available
-            if hasattr(self, 'single_axis_mode_var'):
+            if self.single_axis_mode_var is not None:
                 self.single_axis_mode_var.set(self.config.get('single_axis_mode', False))
 
+            # Full refresh: recompute the cached movement step sizes and the
+            # mirrored monitoring flag too
+            self._refresh_movement_steps()
+            self._perf_monitoring_enabled = bool(self.config.get("enable_performance_monitoring", False))
+
+    def _revert_highlights(self):
+        """Revert every queued highlight in one pass."""
+        self._revert_scheduled = False
+        widgets, self._pending_highlight_reverts = self._pending_highlight_reverts, set()
+        for widget in widgets:
+            try:
+                widget.configure(background='white')
+            except Exception:
+                pass  # Widget may have been destroyed
+
     def _quit(self):
         """Clean shutdown of the application"""
         try:
@@ -1336,193 +2022,276 @@ class MenuSystem:
             EM.publish('keyboard/rotate', (0.0, 8))
             
             self.logger.info("MenuSystem", "Shutting down application...")
-            
-            # Create dialog window
-            dialog = tk.Toplevel(self.root)
-            dialog.title("Confirm Exit")
-            dialog.geometry("360x180")
-            dialog.transient(self.root)  # Set to be on top of the main window
-            dialog.grab_set()  # Modal
-            
-            # Center on parent
-            dialog.update_idletasks()
-            x = self.root.winfo_x() + (self.root.winfo_width() // 2) - (dialog.winfo_width() // 2)
-            y = self.root.winfo_y() + (self.root.winfo_height() // 2) - (dialog.winfo_height() // 2)
-            dialog.geometry(f"+{x}+{y}")
-            
-            # Content
-            content_frame = ttk.Frame(dialog, padding=20)
-            content_frame.pack(fill=tk.BOTH, expand=True)
-            
-            message = ttk.Label(
-                content_frame, 
-                text="Are you sure you want to exit?\nThis will close the simulator.",
-                font=("Segoe UI", 11),
-                wraplength=300,
-                justify=tk.CENTER
-            )
-            message.pack(pady=(0, 20))
-            
-            button_frame = ttk.Frame(content_frame)
-            button_frame.pack(fill=tk.X)
-            
-            cancel_btn = ttk.Button(button_frame, text="Cancel", command=dialog.destroy)
-            cancel_btn.pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
-            
-            confirm_btn = ttk.Button(
-                button_frame, 
-                text="Exit", 
-                style="Quit.TButton",
-                command=lambda: self._confirm_quit(dialog)
-            )
-            confirm_btn.pack(side=tk.RIGHT, padx=5, expand=True, fill=tk.X)
+
+            # Build the dialog once; later invocations just re-show it
+            if self._quit_dialog is None:
+                self._build_quit_dialog()
+
+            # Only the centering depends on the current window position
+            self._center_dialog(self._quit_dialog, 360, 180)
+            self._quit_dialog.deiconify()
+            self._quit_dialog.grab_set()  # Modal
+            self._quit_dialog.lift()
         except Exception as e:
             self.logger.error("MenuSystem", f"Error during application shutdown: {e}")
             self.status_label.configure(text=f"Error: {str(e)}")
             self.root.after(2000, lambda: self.status_label.configure(text=""))
 
-    def _confirm_quit(self, dialog):
+    def _build_quit_dialog(self):
+        """Create the Confirm Exit dialog, hidden; _quit re-shows it."""
+        dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
+        dialog.title("Confirm Exit")
+        dialog.transient(self.root)  # Set to be on top of the main window
+        # The window-manager close button behaves like Cancel
+        dialog.protocol("WM_DELETE_WINDOW", self._cancel_quit)
+
+        # Content
+        content_frame = ttk.Frame(dialog, padding=20)
+        content_frame.pack(fill=tk.BOTH, expand=True)
+
+        message = ttk.Label(
+            content_frame,
+            text="Are you sure you want to exit?\nThis will close the simulator.",
+            font=("Segoe UI", 11),
+            wraplength=300,
+            justify=tk.CENTER
+        )
+        message.pack(pady=(0, 20))
+
+        button_frame = ttk.Frame(content_frame)
+        button_frame.pack(fill=tk.X)
+
+        cancel_btn = ttk.Button(button_frame, text="Cancel", command=self._cancel_quit)
+        cancel_btn.pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
+
+        confirm_btn = ttk.Button(
+            button_frame,
+            text="Exit",
+            style="Quit.TButton",
+            command=self._confirm_quit
+        )
+        confirm_btn.pack(side=tk.RIGHT, padx=5, expand=True, fill=tk.X)
+
+        self._quit_dialog = dialog
+
+    def _cancel_quit(self):
+        """Dismiss the Confirm Exit dialog without quitting."""
+        self._quit_dialog.grab_release()
+        self._quit_dialog.withdraw()
+
+    def _confirm_quit(self):
         """Handle confirmed quit action"""
-        dialog.destroy()
+        self._quit_dialog.withdraw()
+        self._shutting_down = True
         self.cleanup()
         EM.publish('simulation/shutdown', None)
-        
-        # Force application to quit in case there are hanging threads
-        if hasattr(self, 'root') and self.root:
-            # Set a force-quit timer in case normal exit fails
-            # Note: after() schedules task, but we need to immediately start quitting process
-            self.root.after(500, lambda: os._exit(0))
-            
-            # Try normal exit first
+
+        # Cooperative exit: quit the mainloop and destroy the root. A
+        # force-quit timer is only armed if destroy() itself failed; the
+        # old unconditional one meant every shutdown waited 500 ms and
+        # then os._exit'ed past atexit cleanup
+        try:
+            self.root.quit()
+            self.root.destroy()
+        except Exception as e:
+            self.logger.error("MenuSystem", f"Error during application shutdown: {e}")
             try:
-                self.root.quit()
-                self.root.destroy()
-            except Exception as e:
-                self.logger.error("MenuSystem", f"Error during application shutdown: {e}")
-                # If we reach here, the force-quit will still happen via the scheduled after() call
+                self.root.after(2000, os._exit, 1)
+            except Exception:
+                os._exit(1)  # Tk is already gone; leave directly
 
     def _on_scene_progress(self, data):
-        """Update the progress bar and status label when scene creation progresses."""
-        def update_ui():
-            progress = data.get('progress', 0.0)
-            current_category = data.get('current_category', '')
-            completed_objects = data.get('completed_objects', 0)
-            total_objects = data.get('total_objects', 0)
-            
-            # Ensure the progress bar is visible
-            if not self.progress_bar.winfo_ismapped():
-                self.progress_bar.pack(fill="x", pady=5)
-                self.logger.debug_at_level(DEBUG_L1, "MenuSystem", "Progress bar made visible")
-            
-            # Set progress bar value
-            self.progress_var.set(progress)
-            
-            # Format appropriate message based on creation state
-            if current_category == 'complete':
-                message = f"Scene created - {total_objects}/{total_objects} elements"
-            else:
-                # Format the category name nicely (capitalize)
-                category_display = current_category.capitalize()
-                message = f"Creating scene - {category_display}: {completed_objects}/{total_objects} elements"
-            
-            # Update status label
+        """Coalesce scene-creation progress into rate-limited redraws.
+
+        Scene creation reports progress per object; instead of queueing an
+        after(0) closure per event, the latest payload is parked in
+        _pending_progress_data and a single flush drains it at ~15 Hz.
+        Overwritten intermediate events merge rather than drop, so the
+        final state is always the last one rendered."""
+        self._pending_progress_data = data
+        if not self._progress_flush_scheduled:
+            self._progress_flush_scheduled = True
+            try:
+                self.root.after(0, self._flush_progress)
+            except Exception:
+                self._progress_flush_scheduled = False  # Tearing down
+
+    def _flush_progress(self):
+        """Render the most recent progress payload (Tk thread only)."""
+        now = time.monotonic()
+        dt = now - self._last_progress_update
+        if dt < 0.066:
+            # Too soon; come back at the next redraw slot. The scheduled
+            # flag stays set so new events keep merging into the pending
+            # payload instead of queueing more flushes.
+            self.root.after(int((0.066 - dt) * 1000) + 1, self._flush_progress)
+            return
+
+        data = self._pending_progress_data
+        self._pending_progress_data = None
+        self._progress_flush_scheduled = False
+        if data is None:
+            return
+
+        progress = data.get('progress', 0.0)
+        current_category = data.get('current_category', '')
+        completed_objects = data.get('completed_objects', 0)
+        total_objects = data.get('total_objects', 0)
+
+        # Format appropriate message based on creation state
+        if current_category == 'complete':
+            message = f"Scene created - {total_objects}/{total_objects} elements"
+        else:
+            # Format the category name nicely (capitalize, cached)
+            category_display = _fmt_category(current_category)
+            message = f"Creating scene - {category_display}: {completed_objects}/{total_objects} elements"
+
+        # Skip the redraw entirely when nothing visible changed: the label
+        # text is identical and the bar would move by under a pixel
+        if (message == self._last_progress_msg
+                and abs(progress - self._last_drawn_progress) < 0.005
+                and progress < 1.0 and current_category != 'complete'):
+            return
+        self._last_progress_update = now
+        self._last_drawn_progress = progress
+
+        # Ensure the progress bar is visible (cached flag, no winfo call)
+        if not self._progress_bar_visible:
+            self._set_progress_bar_visible(True)
+            self.logger.debug_at_level(DEBUG_L1, "MenuSystem", "Progress bar made visible")
+
+        # Set progress bar value
+        self.progress_var.set(progress)
+
+        # Update status label only when its text actually changed
+        if message != self._last_progress_msg:
             self.status_label.configure(text=message)
-            
-            # Update button states
-            for i, btn in enumerate(self.scene_buttons):
-                if i == 2:  # Cancel button is index 2
-                    btn.configure(state="normal")  # Enable the cancel button during creation
-                else:
-                    btn.configure(state="disabled")  # Disable other buttons during creation
-            
-            # Force the UI to update
-            self.root.update_idletasks()
-            
-        # Schedule UI update in the main thread
-        self.root.after(0, update_ui)
-        
+            self._last_progress_msg = message
+
+        # Update button states (Cancel enabled, others disabled during creation)
+        self._set_scene_buttons_state("disabled", cancel="normal")
+
+    def _set_scene_buttons_state(self, others, cancel=None):
+        """Set the scene-control button states, skipping no-op configures.
+
+        Each configure() is a Tcl round-trip, and during scene creation the
+        target states rarely change between progress events, so buttons
+        already in the requested state are left alone.
+
+        Args:
+            others: Target state for the Create/Clear buttons
+            cancel: Target state for the Cancel button; defaults to others
+        """
+        if self.scene_buttons is None:
+            return
+        if cancel is None:
+            cancel = others
+        states = self._scene_button_states
+        for i, btn in enumerate(self.scene_buttons):
+            target = cancel if i == 2 else others  # Cancel button is index 2
+            if states[i] != target:
+                btn.configure(state=target)
+                states[i] = target
+
+    def _set_progress_bar_visible(self, visible):
+        """Show/hide the progress bar without re-running pack layout.
+
+        grid_remove() keeps the widget's saved grid options, so re-showing
+        is a cheap slot restore; the cached flag replaces the per-flush
+        winfo_ismapped round-trip."""
+        if self._progress_bar_visible == visible:
+            return
+        self._progress_bar_visible = visible
+        if visible:
+            self.progress_bar.grid()
+        else:
+            self.progress_bar.grid_remove()
+
+    def _set_remove_batches_state(self, target):
+        """Set the Remove Batches button state, skipping no-op configures."""
+        if (self.remove_batches_btn is not None
+                and self._remove_batches_state != target):
+            self.remove_batches_btn.configure(state=target)
+            self._remove_batches_state = target
+
     def _on_scene_completed(self, _):
         """Handle scene creation completion."""
-        def update_ui():
-            self.status_label.configure(text="Scene creation completed!")
-            # Re-enable normal buttons and specifically disable the Cancel button
-            for i, btn in enumerate(self.scene_buttons):
-                if i == 2:  # Cancel button is index 2
-                    btn.configure(state="disabled")  # Disable the cancel button
-                else:
-                    btn.configure(state="normal")  # Enable other buttons
-            self.progress_bar.pack_forget()
-            
-            # Disable the Remove Batches button when scene is active
-            if hasattr(self, 'remove_batches_btn'):
-                self.remove_batches_btn.configure(state="disabled")
-                
-            # Update simulation stats
-            self._update_simulation_stats()
-            
-            # Update batch numbers to reflect the new scene's batch number
-            if hasattr(self, '_update_batch_numbers'):
-                self.root.after(500, self._update_batch_numbers)  # slight delay to let files update
-        
-        # Schedule the update on the main thread
-        self.root.after(0, update_ui)
-        
+        # Schedule the bound apply method on the main thread (coalesced);
+        # no per-event closure allocation
+        self._schedule_ui('scene_completed', self._apply_scene_completed)
+
+    def _apply_scene_completed(self):
+        """Render the scene-completed state (Tk thread only)."""
+        self.status_label.configure(text="Scene creation completed!")
+        # Re-enable normal buttons and specifically disable the Cancel button
+        self._set_scene_buttons_state("normal", cancel="disabled")
+        self._set_progress_bar_visible(False)
+
+        # Disable the Remove Batches button when scene is active
+        self._set_remove_batches_state("disabled")
+
+        # Update simulation stats
+        self._update_simulation_stats()
+
+        # Update batch numbers to reflect the new scene's batch number
+        self.root.after(500, self._update_batch_numbers)  # slight delay to let files update
+
     def _on_scene_canceled(self, _):
         """Handle scene creation cancellation with error handling"""
-        def update_ui():
-            try:
-                self.status_label.configure(text="Scene creation canceled", foreground="white")
-                self.progress_var.set(0.0)
-                self.progress_bar.pack_forget()
-                
-                # Re-enable all buttons except Cancel
-                for btn in self.scene_buttons:
-                    if "Cancel" in btn["text"]:
-                        btn.configure(state="disabled")
-                    else:
-                        btn.configure(state="normal")
-            except Exception as e:
-                self.logger.error("MenuSystem", f"Error updating UI after scene canceled: {e}")
-        
-        # Schedule UI update on the main thread
-        self.root.after(0, update_ui)
-        
+        self._schedule_ui('scene_canceled', self._apply_scene_canceled)
+
+    def _apply_scene_canceled(self):
+        """Render the scene-canceled state (Tk thread only)."""
+        try:
+            self.status_label.configure(text="Scene creation canceled", foreground="white")
+            self.progress_var.set(0.0)
+            self._set_progress_bar_visible(False)
+
+            # Re-enable all buttons except Cancel
+            self._set_scene_buttons_state("normal", cancel="disabled")
+        except Exception as e:
+            self.logger.error("MenuSystem", f"Error updating UI after scene canceled: {e}")
+
     def _on_scene_cleared(self, _):
         """Handle scene cleared event by updating UI state"""
-        def update_ui():
-            try:
-                # Reset status label
-                if hasattr(self, 'status_label'):
-                    self.status_label.configure(text="Scene cleared", foreground="white")
-                
-                # Reset victim indicators
-                if hasattr(self, 'distance_var'):
-                    self.distance_var.set("Not detected")
-                
-                if hasattr(self, 'elevation_var'):
-                    self.elevation_var.set("Not detected")
-                
-                if hasattr(self, 'direction_canvas'):
-                    self.direction_canvas.delete("all")  # Clear the direction indicator
-                
-                # Re-enable scene control buttons
-                if hasattr(self, 'scene_buttons'):
-                    for btn in self.scene_buttons:
-                        btn.configure(state="normal")
-                        
-                # Enable the Remove Batches button if it exists
-                if hasattr(self, 'remove_batches_btn'):
-                    self.remove_batches_btn.configure(state="normal")
-                    
-                # Update simulation stats
-                if hasattr(self, '_update_simulation_stats'):
-                    self._update_simulation_stats()
-                    
-            except Exception as e:
-                self.logger.error("MenuSystem", f"Error updating UI after scene clear: {e}")
-        
-        # Schedule UI update on the main thread
-        self.root.after(0, update_ui)
+        self._schedule_ui('scene_cleared', self._apply_scene_cleared)
+
+    def _apply_scene_cleared(self):
+        """Render the scene-cleared state (Tk thread only)."""
+        try:
+            # Reset status label
+            if self.status_label is not None:
+                self.status_label.configure(text="Scene cleared", foreground="white")
+
+            # Reset victim indicators
+            if self.distance_var is not None:
+                self.distance_var.set("Not detected")
+
+            if self.elevation_var is not None:
+                self.elevation_var.set("Not detected")
+
+            if self.direction_canvas is not None:
+                self.direction_canvas.delete("all")  # Clear the direction indicator
+                self._static_dir_size = None  # Static layer is gone too
+                self._dyn_item_ids = None  # Dynamic items too; recreate on next draw
+                self._dyn_mode = None
+
+            # The indicators were reset above, so the next victim event
+            # must repaint even if its state matches the last drawn one
+            self._last_victim_state = None
+
+            # Re-enable scene control buttons
+            self._set_scene_buttons_state("normal")
+
+            # Enable the Remove Batches button if it exists
+            self._set_remove_batches_state("normal")
+
+            # Update simulation stats
+            self._update_simulation_stats()
+
+        except Exception as e:
+            self.logger.error("MenuSystem", f"Error updating UI after scene clear: {e}")
 
     def _on_scene_creation_request(self, config=None):
         """
@@ -1542,14 +2311,11 @@ class MenuSystem:
             config = self.config
             
         # Disable buttons except for the Cancel button during scene creation
-        for i, btn in enumerate(self.scene_buttons):
-            if i == 2:  # Cancel button is index 2
-                btn.configure(state="normal")  # Enable the cancel button
-            else:
-                btn.configure(state="disabled")  # Disable other buttons
-        
+        self._set_scene_buttons_state("disabled", cancel="normal")
+
+
         # Show progress bar
-        self.progress_bar.pack(fill="x", pady=5)
+        self._set_progress_bar_visible(True)
         self.progress_var.set(0.0)
         self.status_label.configure(text="Creating scene...")
         
@@ -1558,9 +2324,13 @@ class MenuSystem:
 
     def _update_victim_indicator(self, data):
         """Update the victim distance and direction indicator based on capture data"""
+        # Nothing to update until the Status tab has been built (lazy tabs)
+        if self.distance_var is None:
+            return
+
         # Add debug logging to see what data is coming in
         self.logger.debug_at_level(DEBUG_L1, "MenuSystem", f"Received victim data: {data}")
-        
+
         # Extract victim vector data (dx, dy, dz) and distance
         if 'victim_vec' not in data:
             self.logger.warning("MenuSystem", "Missing victim_vec in update data")
@@ -1582,696 +2352,428 @@ class MenuSystem:
             self.logger.error("MenuSystem", f"Error unpacking victim vector: {e}")
             return
         
-        # Update UI safely
-        def update_ui():
-            # Update distance text
-            if distance <= 0:
-                self.distance_var.set("Not detected")
-                self.elevation_var.set("Not detected")
-            else:
-                self.distance_var.set(f"{distance:.2f} meters")
-                
-                # Update elevation text with simple numerical format
-                if abs(dz) < 0.1:  # If very close to level
-                    self.elevation_var.set("Same level (±0.1m)")
-                    self.elevation_label.configure(foreground="green")
-                elif dz > 0:
-                    self.elevation_var.set(f"{dz:.2f}m above drone")
-                    # Color based on how much higher (harder to reach)
-                    if dz > 3:
-                        self.elevation_label.configure(foreground="red")
-                    else:
-                        self.elevation_label.configure(foreground="orange")
-                else:  # dz < 0
-                    self.elevation_var.set(f"{abs(dz):.2f}m below drone")
-                    # Color based on how much lower (easier to spot)
-                    if abs(dz) > 3:
-                        self.elevation_label.configure(foreground="orange")
-                    else:
-                        self.elevation_label.configure(foreground="green")
-                
-            # Update direction indicator
-            self._draw_direction_indicator(dx, dy, dz)
-            
-            # Update signal strength (inverse of distance)
-            if distance <= 0:
-                self.signal_var.set(0.0)
-                self.signal_bar.configure(style='Red.Horizontal.TProgressbar')
-            else:
-                # Normalize signal strength: stronger when closer
-                # Maximum strength at 1m, diminishes with distance
-                strength = min(1.0, 1.0 / max(1.0, distance))
-                self.signal_var.set(strength)
-                
-                # Update signal bar color based on strength
-                if strength > 0.85:
-                    self.signal_bar.configure(style='Green.Horizontal.TProgressbar')
-                elif strength > 0.5:
-                    self.signal_bar.configure(style='Yellow.Horizontal.TProgressbar')
-                elif strength > 0.25:
-                    self.signal_bar.configure(style='Orange.Horizontal.TProgressbar')
-                else:
-                    self.signal_bar.configure(style='Red.Horizontal.TProgressbar')
-                
-            # Color-code the distance label based on proximity
-            if distance <= 0:
-                self.distance_label.configure(foreground="gray")
-            elif distance < 5.0:
-                self.distance_label.configure(foreground="green")
-            elif distance < 15.0:
-                self.distance_label.configure(foreground="orange")
+        # Stage the payload and schedule the bound apply method on the main
+        # thread; victim updates can arrive per frame, so the same-key
+        # coalescing keeps only the latest and no closure is allocated
+        self._pending_victim = (dx, dy, dz, distance)
+        self._schedule_ui('victim', self._apply_victim_update)
+
+    def _apply_victim_update(self):
+        """Render the staged victim vector (Tk thread only)."""
+        pending = self._pending_victim
+        if pending is None:
+            return
+        dx, dy, dz, distance = pending
+
+        # Re-rendering the same state is the common case when capture
+        # polls faster than the victim moves; skip the widget pass
+        state = (round(dx, 3), round(dy, 3), round(dz, 2), round(distance, 2))
+        if state == self._last_victim_state:
+            return
+        self._last_victim_state = state
+
+        # Pre-bind the touched widgets; this runs per victim event and
+        # each self.X costs a dict lookup
+        distance_var = self.distance_var
+        elevation_var = self.elevation_var
+
+        # Update distance text
+        if distance <= 0:
+            distance_var.set("Not detected")
+            elevation_var.set("Not detected")
+        else:
+            distance_var.set(_fmt_meters(round(distance * 100)))
+
+            # Update elevation text with simple numerical format
+            if abs(dz) < 0.1:  # If very close to level
+                elevation_var.set("Same level (±0.1m)")
             else:
-                self.distance_label.configure(foreground="red")
-                
-        # Schedule UI update on the main thread
-        self.root.after(0, update_ui)
-        
-    def _draw_direction_indicator(self, dx, dy, dz):
-        """Draw a futuristic aeronautical direction indicator on the canvas showing victim direction"""
-        # Clear canvas
-        self.direction_canvas.delete("all")
-        canvas_width = self.direction_canvas.winfo_width()
-        canvas_height = self.direction_canvas.winfo_height()
-        
-        # Ensure we have minimum dimensions
-        if canvas_width < 20 or canvas_height < 20:
-            canvas_width = canvas_height = 250  # Increased from 150 to 250
-            
-        # Calculate center and radius
-        center_x = canvas_width / 2
-        center_y = canvas_height / 2
-        radius = min(center_x, center_y) - 15  # Slightly larger margin (10 to 15)
-        radius_int = int(radius)
-        
-        # Draw outer circle with gradient
-        for i in range(3):
-            opacity = 0.1 + i * 0.1
-            color = f'#{int(0x00 * opacity):02x}{int(0xFF * opacity):02x}{int(0x00 * opacity):02x}'
-        self.direction_canvas.create_oval(
-            center_x - radius, center_y - radius, 
-            center_x + radius, center_y + radius, 
-                outline=color,
-                width=3  # Thicker line (2 to 3)
+                elevation_var.set(_fmt_elevation(round(dz * 100)))
+
+            # Color by elevation band (above = harder to reach, below =
+            # easier to spot); skip the Tcl call when unchanged
+            color = _ELEV_COLORS[bisect.bisect_left(_ELEV_THRESHOLDS, dz)]
+            if color != self._last_elev_color:
+                self.elevation_label.configure(foreground=color)
+                self._last_elev_color = color
+
+        # Update direction indicator
+        self._draw_direction_indicator(dx, dy, dz)
+
+        # Update signal strength (inverse of distance)
+        if distance <= 0:
+            self.signal_var.set(0.0)
+            style = _SIGNAL_STYLES[0]
+        else:
+            # Normalize signal strength: stronger when closer
+            # Maximum strength at 1m, diminishes with distance
+            strength = min(1.0, 1.0 / max(1.0, distance))
+            self.signal_var.set(strength)
+            style = _SIGNAL_STYLES[bisect.bisect_left(_SIGNAL_THRESHOLDS, strength)]
+
+        # Style swaps round-trip through ttk; only apply real changes
+        if style != self._last_signal_style:
+            self.signal_bar.configure(style=style)
+            self._last_signal_style = style
+
+        # Color-code the distance label based on proximity; like the
+        # elevation label, only configure when the band changes
+        if distance <= 0:
+            dist_color = "gray"
+        elif distance < 5.0:
+            dist_color = "green"
+        elif distance < 15.0:
+            dist_color = "orange"
+        else:
+            dist_color = "red"
+        if dist_color != self._last_distance_color:
+            self.distance_label.configure(foreground=dist_color)
+            self._last_distance_color = dist_color
+
+    def _draw_direction_static(self, canvas_width, canvas_height):
+        """(Re)draw the indicator elements that depend only on canvas size.
+
+        The outer/inner circles, crosshair and distance rings never move
+        between victim updates, so they are created once (tagged "static")
+        and only rebuilt when the canvas actually changes size."""
+        canvas = self.direction_canvas
+        canvas.delete("static")
+
+        center_x = self._dir_center_x
+        center_y = self._dir_center_y
+        radius = self._dir_radius
+        radius_int = self._dir_radius_int
+
+        # Draw outer circle (fixed 0.3 opacity; the old loop recomputed the
+        # color three times and only ever used the last value)
+        opacity = 0.3
+        color = f'#{int(0x00 * opacity):02x}{int(0xFF * opacity):02x}{int(0x00 * opacity):02x}'
+        canvas.create_oval(
+            center_x - radius, center_y - radius,
+            center_x + radius, center_y + radius,
+            outline=color,
+            width=3,  # Thicker line (2 to 3)
+            tags="static"
         )
-        
+
         # Draw inner circle
         inner_radius = radius * 0.8
-        self.direction_canvas.create_oval(
+        canvas.create_oval(
             center_x - inner_radius, center_y - inner_radius,
             center_x + inner_radius, center_y + inner_radius,
             outline="#00FF00",
-            width=2  # Thicker line (1 to 2)
+            width=2,  # Thicker line (1 to 2)
+            tags="static"
         )
-        
+
         # Add a simple crosshair in the center
         crosshair_size = radius * 0.2  # Size of the crosshair lines
         # Horizontal line
-        self.direction_canvas.create_line(
+        canvas.create_line(
             center_x - crosshair_size, center_y,
             center_x + crosshair_size, center_y,
             fill="#00FF00",
-            width=2
+            width=2,
+            tags="static"
         )
         # Vertical line
-        self.direction_canvas.create_line(
+        canvas.create_line(
             center_x, center_y - crosshair_size,
             center_x, center_y + crosshair_size,
             fill="#00FF00",
-            width=2
+            width=2,
+            tags="static"
         )
-        
-        # Draw distance rings with gradient
-        for r in range(radius_int, 0, -radius_int//4):
-            opacity = 0.2 + (1 - r/radius) * 0.3
-            color = f'#{int(0x00 * opacity):02x}{int(0xFF * opacity):02x}{int(0x00 * opacity):02x}'
-            self.direction_canvas.create_oval(
+
+        # Draw distance rings with gradient (colors cached per radius)
+        rings = self._RING_COLOR_CACHE.get(radius_int)
+        if rings is None:
+            rings = []
+            for r in range(radius_int, 0, -radius_int//4):
+                opacity = 0.2 + (1 - r/radius_int) * 0.3
+                rings.append((r, f'#{int(0x00 * opacity):02x}{int(0xFF * opacity):02x}{int(0x00 * opacity):02x}'))
+            self._RING_COLOR_CACHE[radius_int] = rings
+        for r, color in rings:
+            canvas.create_oval(
                 center_x - r, center_y - r,
                 center_x + r, center_y + r,
                 outline=color,
-                width=2  # Thicker line (1 to 2)
-        )
-        
-        # If direction is valid, draw victim indicator
-        if dx is not None and dy is not None and (dx != 0 or dy != 0):
-            # Calculate endpoint of direction vector
-            end_x = center_x + dx * radius
-            end_y = center_y - dy * radius  # Inverted y-axis
-            
-            # Draw direction vector with HUD-style arrow
-            # Main line
-            self.direction_canvas.create_line(
-                center_x, center_y,
-                end_x, end_y,
-                fill="#00FF00",
-                width=3  # Thicker line (2 to 3)
-            )
-            
-            # Draw arrow head
-            arrow_size = 15  # Increased from 10 to 15
-            angle = math.atan2(end_y - center_y, end_x - center_x)
-            arrow_angle1 = angle + math.radians(150)
-            arrow_angle2 = angle - math.radians(150)
-            
-            arrow_x1 = end_x + arrow_size * math.cos(arrow_angle1)
-            arrow_y1 = end_y + arrow_size * math.sin(arrow_angle1)
-            arrow_x2 = end_x + arrow_size * math.cos(arrow_angle2)
-            arrow_y2 = end_y + arrow_size * math.sin(arrow_angle2)
-            
-            self.direction_canvas.create_polygon(
-                end_x, end_y,
-                arrow_x1, arrow_y1,
-                arrow_x2, arrow_y2,
-                fill="#00FF00",
-                outline=""
-            )
-            
-            # Draw victim point with HUD-style targeting reticle
-            reticle_size = 22  # Increased from 15 to 22
-            # Outer circle
-            self.direction_canvas.create_oval(
-                end_x - reticle_size, end_y - reticle_size,
-                end_x + reticle_size, end_y + reticle_size,
-                outline="#00FF00",
-                width=2  # Thicker line (1 to 2)
-            )
-            # Inner circle
-            self.direction_canvas.create_oval(
-                end_x - reticle_size/2, end_y - reticle_size/2,
-                end_x + reticle_size/2, end_y + reticle_size/2,
-                outline="#00FF00",
-                width=2  # Thicker line (1 to 2)
-            )
-            
-            # Draw crosshair lines
-            self.direction_canvas.create_line(
-                end_x - reticle_size, end_y,
-                end_x + reticle_size, end_y,
-                fill="#00FF00",
-                width=2  # Thicker line (1 to 2)
+                width=2,  # Thicker line (1 to 2)
+                tags="static"
             )
-            self.direction_canvas.create_line(
-                end_x, end_y - reticle_size,
-                end_x, end_y + reticle_size,
-                fill="#00FF00",
-                width=2  # Thicker line (1 to 2)
-            )
-        else:
-            # If no vector, draw "not detected" text with HUD style
-            self.direction_canvas.create_text(
-                center_x, center_y,
-                text="NO SIGNAL",
-                fill="#00FF00",
-                font=("Courier", 16, "bold")  # Larger font (12 to 16)
-            )
-
-    def _build_status_tab(self, parent):
-        """Build the status tab with victim distance indicator"""
-        # Title
-        ttk.Label(parent, text="Simulation Status", style="Title.TLabel").pack(pady=(0,20))
-        
-        # UI Control status indicator (simplified)
-        self.control_status_label = ttk.Label(
-            parent,
-            textvariable=self.control_status_var,
-            foreground="#00FF00",  # Green text for visibility
-            font=("Segoe UI", 10, "bold"),
-            wraplength=400
-        )
-        self.control_status_label.pack(pady=5)
-        
-        # Victim indicator section
-        victim_frame = ttk.LabelFrame(parent, text="Victim Detection", padding=15, labelanchor="n")
-        victim_frame.pack(fill="x", pady=10)
-        
-        # Distance indicator
-        ttk.Label(victim_frame, text="Distance to victim:", style="Subtitle.TLabel").pack(pady=5)
-        self.distance_var = tk.StringVar(value="Not detected")
-        self.distance_label = ttk.Label(victim_frame, textvariable=self.distance_var, 
-                                      font=("Segoe UI", 14))
-        self.distance_label.pack(pady=5)
-        
-        # Elevation indicator
-        ttk.Label(victim_frame, text="Elevation difference:", style="Subtitle.TLabel").pack(pady=5)
-        self.elevation_var = tk.StringVar(value="Not detected")
-        self.elevation_label = ttk.Label(victim_frame, textvariable=self.elevation_var, 
-                                       font=("Segoe UI", 14))
-        self.elevation_label.pack(pady=5)
-            
-        # Direction indicator (graphical)
-        ttk.Label(victim_frame, text="Direction:", style="Subtitle.TLabel").pack(pady=5)
-        canvas_size = 250  # Increased from 150 to 250
-        self.direction_canvas = tk.Canvas(victim_frame, width=canvas_size, height=canvas_size, 
-                                         bg="black", highlightthickness=1, highlightbackground="#666666")
-        self.direction_canvas.pack(pady=10)
-        
-        # Draw the initial state (no detection)
-        self._draw_direction_indicator(None, None, None)
-        
-        # Signal strength (distance-based)
-        ttk.Label(victim_frame, text="Signal strength:", style="Subtitle.TLabel").pack(pady=5)
-        self.signal_var = tk.DoubleVar(value=0.0)
-        self.signal_bar = ttk.Progressbar(victim_frame, variable=self.signal_var, maximum=1.0)
-        self.signal_bar.pack(fill="x", pady=5, padx=10)
 
-    def _build_help_tab(self, parent):
-        """Build the help tab with application information and controls"""
-        # Create a ScrollFrame for the help content
-        scroll_frame = ScrollFrame(parent, bg="#0a0a0a")
-        scroll_frame.pack(fill="both", expand=True)
-        
-        # Get the scrollable frame to add content to
-        scrollable_frame = scroll_frame.scrollable_frame
-        
-        # Define enhanced styles for the help tab
-        help_title_font = ("Segoe UI", 22, "bold")  # Larger title font
-        section_title_font = ("Segoe UI", 14, "bold")  # Enhanced section title font
-        help_content_font = ("Segoe UI", 12)  # Larger content font
-        
-        # Title with enhanced styling
-        title_frame = ttk.Frame(scrollable_frame, padding=(0, 0, 0, 10))
-        title_frame.pack(fill="x", pady=(0, 25))
-        title_label = ttk.Label(
-            title_frame, 
-            text="Help & Information", 
-            font=help_title_font,
-            foreground="#00b4d8"  # Accent color for title
-        )
-        title_label.pack(pady=(5, 0))
-        
-        # Version Information Section with enhanced styling
-        version_frame = ttk.LabelFrame(
-            scrollable_frame, 
-            text="Version Information", 
-            padding=20,
-            labelanchor="n"  # Center the label
-        )
-        version_frame.pack(fill="x", pady=10, padx=15)  # Increased padding
-        
-        version_info = """
-• Version: HyperDrive Pathway v1.4.0B
-• Build: 21.05.2025
-        """
-        version_label = ttk.Label(
-            version_frame, 
-            text=version_info, 
-            justify="left",
-            font=help_content_font
-        )
-        version_label.pack(fill="x")
-        
-        # Scene Tab Section
-        scene_frame = ttk.LabelFrame(
-            scrollable_frame, 
-            text="Scene Tab", 
-            padding=20,
-            labelanchor="n"
-        )
-        scene_frame.pack(fill="x", pady=10, padx=15)
-        
-        scene_info = """
-• Scene Creation Controls:
-  - Create Environment: Generates a new disaster simulation environment with all configured objects
-  - Clear Environment: Removes all objects from the current scene
-  - Cancel Creating Environment: Stops the environment creation process if in progress
-  - Progress bar shows creation status with category and element counts
-
-• Scene Configuration:
-  - Scene settings are controlled in the Config tab
-  - Dynamic objects like birds and falling trees can be adjusted during runtime
-        """
-        scene_label = ttk.Label(
-            scene_frame, 
-            text=scene_info, 
-            justify="left",
-            font=help_content_font
-        )
-        scene_label.pack(fill="x")
-        
-        # Controls Tab Section
-        controls_frame = ttk.LabelFrame(
-            scrollable_frame, 
-            text="Controls Tab", 
-            padding=20,
-            labelanchor="n"
-        )
-        controls_frame.pack(fill="x", pady=10, padx=15)
-        
-        controls_info = """
-• Movement Mode:
-  - Single-Axis Movement: Toggle between multi-directional and single-axis movement
-  - When enabled, restricts movement to one axis at a time
-  - Only the axis with the largest input will be active, all others will be disabled
-  - For example, if you use pitch control, all other controls will be disabled until you release it
-
-• Keyboard Controls:
-  - Movement Speed: Adjust how quickly the drone moves with keyboard input
-  - Rotation Speed: Adjust how quickly the drone rotates with keyboard input
-  - Apply Keyboard Settings: Save changes to keyboard control settings
-
-• RC Controller Settings:
-  - Sensitivity: Adjust overall controller sensitivity (range 0.1-20.0)
-  - Deadzone: Set minimum input threshold to prevent drift
-  - Yaw Sensitivity: Set specific sensitivity for rotation control
-  - Axis Mapping: Configure which joystick axes control which movements
-  - Invert Controls: Toggle direction inversion for each axis
-  - Test Controls: View real-time input values from the controller with visual joystick representation
-  - RC Mapping Wizard: Visual interface for mapping controller axes with real-time feedback
-        """
-        controls_label = ttk.Label(
-            controls_frame, 
-            text=controls_info, 
-            justify="left",
-            font=help_content_font
-        )
-        controls_label.pack(fill="x")
-        
-        # Config Tab Section
-        config_frame = ttk.LabelFrame(
-            scrollable_frame, 
-            text="Config Tab", 
-            padding=20,
-            labelanchor="n"
-        )
-        config_frame.pack(fill="x", pady=10, padx=15)
-        
-        config_info = """
-• Dynamic Objects:
-  - Number of Birds: Controls how many birds appear in the scene
-  - Bird Movement Speed: Sets how fast birds fly (0.1-5.0)
-  - Number of Falling Trees: Sets how many trees will randomly fall
-  - Tree Spawn Interval: Time between tree spawns (in seconds)
-  - Keep Fallen Trees: Select whether trees remain on ground after falling or are removed
-  - Note: Birds and falling trees are managed separately
+        self._static_dir_size = (canvas_width, canvas_height)
 
-• Environment Settings:
-  - Number of Static Trees: Sets the number of non-falling trees
-  - Number of Rocks: Controls how many rock formations appear
-  - Number of Bushes: Sets the amount of bush clusters
-  - Number of Foliage: Controls ground vegetation density
-  - Area Size: Sets the overall simulation area dimensions
+    def _create_direction_dynamic(self):
+        """Create the moving indicator items once, all hidden.
 
-• Simulation Settings:
-  - Victim Count: Number of victims to place in the scene
-  - Drone Speed: Maximum velocity of the drone
-  - Move Step: Distance increment per movement command
-  - Rotate Step: Angle increment per rotation command
-  - Enable Collisions: Toggle collision detection
-  - Enable Physics: Toggle physics simulation
-  - Apply Changes: Save all configuration changes
+        Updates reposition them with coords() and flip visibility with
+        itemconfigure(state=...), so no canvas items are allocated or
+        freed per victim update."""
+        canvas = self.direction_canvas
+        self._dyn_item_ids = {
+            'vector': canvas.create_line(
+                0, 0, 0, 0, fill="#00FF00", width=3,
+                state='hidden', tags="dynamic"),
+            'arrow': canvas.create_polygon(
+                0, 0, 0, 0, 0, 0, fill="#00FF00", outline="",
+                state='hidden', tags="dynamic"),
+            'reticle_outer': canvas.create_oval(
+                0, 0, 0, 0, outline="#00FF00", width=2,
+                state='hidden', tags="dynamic"),
+            'reticle_inner': canvas.create_oval(
+                0, 0, 0, 0, outline="#00FF00", width=2,
+                state='hidden', tags="dynamic"),
+            'cross_h': canvas.create_line(
+                0, 0, 0, 0, fill="#00FF00", width=2,
+                state='hidden', tags="dynamic"),
+            'cross_v': canvas.create_line(
+                0, 0, 0, 0, fill="#00FF00", width=2,
+                state='hidden', tags="dynamic"),
+            'no_signal': canvas.create_text(
+                0, 0, text="NO SIGNAL", fill="#00FF00",
+                font=("Courier", 16, "bold"),
+                state='hidden', tags="dynamic"),
+        }
+        self._dyn_mode = None
 
-• Save/Load Settings:
-  - Save Settings: Save your current configuration to a file with custom name and location
-                   (Default location is Config folder, same as rc_mapping.json and rc_settings.json)
-  - Load Settings: Load previously saved configurations
-        """
-        config_label = ttk.Label(
-            config_frame, 
-            text=config_info, 
-            justify="left",
-            font=help_content_font
-        )
-        config_label.pack(fill="x")
-        
-        # Status Tab Section
-        status_frame = ttk.LabelFrame(
-            scrollable_frame, 
-            text="Status Tab", 
-            padding=20,
-            labelanchor="n"
-        )
-        status_frame.pack(fill="x", pady=10, padx=15)
-        
-        status_info = """
-• Control Status: Shows whether keyboard controls are active
-  - Green: UI control active and ready for keyboard input
-  - Red: UI control inactive (click window to activate)
+    def _set_dir_canvas_geometry(self, width, height):
+        """Cache the canvas size and the derived center/radius values.
 
-• Victim Detection:
-  - Distance: Shows how far the victim is from the drone
-  - Elevation: Indicates height difference between drone and victim
-  - Direction: Visual indicator showing victim's location
-  - Signal Strength: Bar showing signal quality:
-    > Green: Strong signal (close proximity)
-    > Yellow: Moderate signal
-    > Orange: Weak signal
-    > Red: Very weak signal (far distance)
+        Everything the draw path needs is precomputed here, so per-update
+        drawing never queries Tk for the canvas dimensions."""
+        self._dir_canvas_size = (width, height)
+        self._dir_center_x = width / 2
+        self._dir_center_y = height / 2
+        self._dir_radius = min(self._dir_center_x, self._dir_center_y) - 15  # Slightly larger margin (10 to 15)
+        self._dir_radius_int = int(self._dir_radius)
 
-• HUD-style radar display shows victim location relative to drone
-        """
-        status_label = ttk.Label(
-            status_frame, 
-            text=status_info, 
-            justify="left",
-            font=help_content_font
-        )
-        status_label.pack(fill="x")
-        
-        # Monitor Tab Section
-        monitor_frame = ttk.LabelFrame(
-            scrollable_frame, 
-            text="Monitor Tab", 
-            padding=20,
-            labelanchor="n"
-        )
-        monitor_frame.pack(fill="x", pady=10, padx=15)
-        
-        monitor_info = """
-• Performance Monitoring Toggle:
-  - Enable/disable real-time performance tracking
-  - When disabled, conserves CPU resources
+    def _on_dir_canvas_resize(self, event):
+        """Refresh the cached geometry and rebuild on canvas size changes."""
+        width, height = event.width, event.height
+        # Ensure we have minimum dimensions
+        if width < 20 or height < 20:
+            width = height = 250  # Increased from 150 to 250
+        if (width, height) != self._dir_canvas_size:
+            self._set_dir_canvas_geometry(width, height)
+        if (width, height) != self._static_dir_size:
+            self._draw_direction_indicator(*self._last_dir_vec)
 
-• System Information:
-  - OS Version: Shows operating system version
-  - Python Version: Shows Python interpreter version
-  - CPU Cores: Number of processor cores available
+    def _draw_direction_indicator(self, dx, dy, dz):
+        """Draw a futuristic aeronautical direction indicator on the canvas showing victim direction"""
+        canvas_width, canvas_height = self._dir_canvas_size
 
-• Performance Metrics:
-  - FPS: Frames per second of the application
-  - Memory Usage: Application memory consumption in MB
-  - Memory %: Percentage of system memory in use
-  - CPU Usage: Processor utilization percentage
-  - CPU Frequency: Current processor clock speed
-  - Active Threads: Number of running threads
+        # Static layer persists between updates; rebuild only on size change
+        canvas = self.direction_canvas
+        if (canvas_width, canvas_height) != self._static_dir_size:
+            self._draw_direction_static(canvas_width, canvas_height)
+            # A rebuilt static layer stacks above the existing dynamic items
+            canvas.tag_raise("dynamic")
 
-• Simulation Statistics:
-  - Total Objects: Count of all objects in the scene
-  - Individual counts for birds, trees, rocks, bushes, and foliage
+        # The moving parts are persistent items; just reposition them
+        if self._dyn_item_ids is None:
+            self._create_direction_dynamic()
+        items = self._dyn_item_ids
+        coords = canvas.coords  # Bound once; called for every moving item
+        self._last_dir_vec = (dx, dy, dz)
 
-• Runtime Statistics:
-  - Uptime: Duration the application has been running
-        """
-        monitor_label = ttk.Label(
-            monitor_frame, 
-            text=monitor_info, 
-            justify="left",
-            font=help_content_font
-        )
-        monitor_label.pack(fill="x")
+        # Center and radius come precomputed with the cached geometry
+        center_x = self._dir_center_x
+        center_y = self._dir_center_y
+        radius = self._dir_radius
 
-        # Dataset Tab Section
-        dataset_frame = ttk.LabelFrame(
-            scrollable_frame, 
-            text="Dataset Tab", 
-            padding=20,
-            labelanchor="n"
-        )
-        dataset_frame.pack(fill="x", pady=10, padx=15)
-        
-        dataset_info = """
-• Dataset Directory:
-  - View current dataset storage location
-  - Select Directory: Change the directory where captures are saved
-  - Uses timestamped subfolders for organization
+        # If direction is valid, draw victim indicator
+        if dx is not None and dy is not None and (dx != 0 or dy != 0):
+            # Calculate endpoint of direction vector
+            end_x = center_x + dx * radius
+            end_y = center_y - dy * radius  # Inverted y-axis
 
-• Batch Information:
-  - Current Batch: Displays the latest batch number that was created
-  - Scene Batch: Shows the batch number when the current scene was created
-  - Refresh Batch Information: Updates the displayed batch numbers
-  - Remove Batches From Current Scene: Deletes all batches created after the scene batch number
+            # Direction vector with HUD-style arrow
+            # Main line
+            coords(items['vector'], center_x, center_y, end_x, end_y)
 
-• Dataset Collection:
-  - Automatically captures depth images during simulation
-  - Organizes data into train/val/test splits
-  - Stores depth maps, poses, and victim direction vectors
-  - Includes distance-to-victim measurements
+            # Draw arrow head by rotating the unit direction vector ±150°
+            # with the precomputed matrix terms — no atan2/cos/sin per update
+            arrow_size = 15  # Increased from 10 to 15
+            length = math.hypot(end_x - center_x, end_y - center_y)
+            dxn = (end_x - center_x) / length
+            dyn = (end_y - center_y) / length
 
-• Tools:
-  - Open Depth Image Viewer: Launch a tool to examine and manipulate captured depth images
-        """
-        dataset_label = ttk.Label(
-            dataset_frame, 
-            text=dataset_info, 
-            justify="left",
-            font=help_content_font
-        )
-        dataset_label.pack(fill="x")
+            arrow_x1 = end_x + arrow_size * (dxn * _ARROW_COS150 - dyn * _ARROW_SIN150)
+            arrow_y1 = end_y + arrow_size * (dyn * _ARROW_COS150 + dxn * _ARROW_SIN150)
+            arrow_x2 = end_x + arrow_size * (dxn * _ARROW_COS150 + dyn * _ARROW_SIN150)
+            arrow_y2 = end_y + arrow_size * (dyn * _ARROW_COS150 - dxn * _ARROW_SIN150)
+            
+            coords(items['arrow'],
+                   end_x, end_y,
+                   arrow_x1, arrow_y1,
+                   arrow_x2, arrow_y2)
 
-        # Logging Tab Section
-        logging_frame = ttk.LabelFrame(
-            scrollable_frame, 
-            text="Logging Tab", 
-            padding=20,
-            labelanchor="n"
-        )
-        logging_frame.pack(fill="x", pady=10, padx=15)
-        
-        logging_info = """
-• Log Level:
-  - DEBUG: Shows all messages including detailed debugging
-  - INFO: Shows information, warnings, and errors
-  - WARNING: Shows only warnings and errors
-  - ERROR: Shows only errors
-  - CRITICAL: Shows only critical errors
+            # Victim point with HUD-style targeting reticle
+            reticle_size = 22  # Increased from 15 to 22
+            coords(items['reticle_outer'],
+                   end_x - reticle_size, end_y - reticle_size,
+                   end_x + reticle_size, end_y + reticle_size)
+            coords(items['reticle_inner'],
+                   end_x - reticle_size/2, end_y - reticle_size/2,
+                   end_x + reticle_size/2, end_y + reticle_size/2)
 
-• Debug Verbosity:
-  - L1 (Basic): High-level information and important events
-  - L2 (Medium): Detailed operations and parameters
-  - L3 (Verbose): All events including frequent updates
+            # Crosshair lines
+            coords(items['cross_h'],
+                   end_x - reticle_size, end_y,
+                   end_x + reticle_size, end_y)
+            coords(items['cross_v'],
+                   end_x, end_y - reticle_size,
+                   end_x, end_y + reticle_size)
 
-• File Logging:
-  - Enable/disable logging to file
-  - Open logs directory to view saved logs
-  - Logs are stored with timestamps for reference
+            # Visibility only needs flipping when switching from "NO SIGNAL"
+            if self._dyn_mode != 'vector':
+                for name, item in items.items():
+                    canvas.itemconfigure(
+                        item, state='hidden' if name == 'no_signal' else 'normal')
+                self._dyn_mode = 'vector'
+        else:
+            # If no vector, show the "NO SIGNAL" HUD text instead
+            coords(items['no_signal'], center_x, center_y)
+            if self._dyn_mode != 'text':
+                for name, item in items.items():
+                    canvas.itemconfigure(
+                        item, state='normal' if name == 'no_signal' else 'hidden')
+                self._dyn_mode = 'text'
 
-• Verbose Mode:
-  - Enable for maximum detail in debugging
-  - Affects console output and file logging
-        """
-        logging_label = ttk.Label(
-            logging_frame, 
-            text=logging_info, 
-            justify="left",
-            font=help_content_font
-        )
-        logging_label.pack(fill="x")
-        
-        # Keyboard Controls Section
-        keyboard_frame = ttk.LabelFrame(
-            scrollable_frame, 
-            text="Keyboard Controls", 
-            padding=20,
-            labelanchor="n"
-        )
-        keyboard_frame.pack(fill="x", pady=10, padx=15)
+    def _build_status_tab(self, parent):
+        """Build the status tab with victim distance indicator"""
+        # Title
+        ttk.Label(parent, text="Simulation Status", style="Title.TLabel").pack(pady=(0,20))
         
-        keyboard_info = """
-• Movement Controls:
-  - W: Move forward
-  - S: Move backward
-  - A: Move left
-  - D: Move right
-  - Space: Move up
-  - Z: Move down
-  - Q: Rotate counterclockwise
-  - E: Rotate clockwise
-
-• Movement Modes:
-  - Multi-directional: Default mode allowing movement in multiple directions at once
-  - Single-axis: Restricts movement to one axis at a time:
-    * Only the axis with the largest input will be active
-    * All other axes will be disabled until you release the active axis
-    * This creates clean, isolated movements for dataset collection
-        """
-        keyboard_label = ttk.Label(
-            keyboard_frame, 
-            text=keyboard_info, 
-            justify="left",
-            font=help_content_font
+        # UI Control status indicator (simplified)
+        self.control_status_label = ttk.Label(
+            parent,
+            textvariable=self.control_status_var,
+            foreground="#00FF00",  # Green text for visibility
+            font=("Segoe UI", 10, "bold"),
+            wraplength=400
         )
-        keyboard_label.pack(fill="x")
+        self.control_status_label.pack(pady=5)
         
-        # RC Joystick Controls section
-        joystick_frame = ttk.LabelFrame(
-            scrollable_frame, 
-            text="RC Joystick Controls", 
-            padding=20,
-            labelanchor="n"
-        )
-        joystick_frame.pack(fill="x", pady=10, padx=15)
+        # Victim indicator section
+        victim_frame = ttk.LabelFrame(parent, text="Victim Detection", padding=15, labelanchor="n")
+        victim_frame.pack(fill="x", pady=10)
         
-        joystick_info = """
-• Controller Setup:
-  - Connect your joystick to the computer before starting the application
-  - Select RC Controller at startup when prompted
-  - Configure mappings in the Controls tab if needed
+        # Distance indicator
+        ttk.Label(victim_frame, text="Distance to victim:", style="Subtitle.TLabel").pack(pady=5)
+        self.distance_var = tk.StringVar(value="Not detected")
+        self.distance_label = ttk.Label(victim_frame, textvariable=self.distance_var, 
+                                      font=("Segoe UI", 14))
+        self.distance_label.pack(pady=5)
+        
+        # Elevation indicator
+        ttk.Label(victim_frame, text="Elevation difference:", style="Subtitle.TLabel").pack(pady=5)
+        self.elevation_var = tk.StringVar(value="Not detected")
+        self.elevation_label = ttk.Label(victim_frame, textvariable=self.elevation_var, 
+                                       font=("Segoe UI", 14))
+        self.elevation_label.pack(pady=5)
+            
+        # Direction indicator (graphical)
+        ttk.Label(victim_frame, text="Direction:", style="Subtitle.TLabel").pack(pady=5)
+        canvas_size = 250  # Increased from 150 to 250
+        self.direction_canvas = tk.Canvas(victim_frame, width=canvas_size, height=canvas_size, 
+                                         bg="black", highlightthickness=1, highlightbackground="#666666")
+        self.direction_canvas.pack(pady=10)
 
-• Default Mappings:
-  - Left stick X: Yaw (rotation)
-  - Left stick Y: Throttle (up/down movement)
-  - Right stick X: Roll (left/right movement)
-  - Right stick Y: Pitch (forward/backward movement)
+        # Rebuild the static layer when the canvas is resized
+        self.direction_canvas.bind('<Configure>', self._on_dir_canvas_resize)
 
-• Sensitivity Settings:
-  - Main sensitivity (0.1-20.0): Adjusts overall responsiveness
-  - Deadzone: Prevents drift when sticks are near center
-  - Yaw sensitivity: Specifically adjusts rotation speed
+        # Draw the initial state (no detection)
+        self._draw_direction_indicator(None, None, None)
+        
+        # Signal strength (distance-based)
+        ttk.Label(victim_frame, text="Signal strength:", style="Subtitle.TLabel").pack(pady=5)
+        self.signal_var = tk.DoubleVar(value=0.0)
+        self.signal_bar = ttk.Progressbar(victim_frame, variable=self.signal_var, maximum=1.0)
+        self.signal_bar.pack(fill="x", pady=5, padx=10)
 
-• Visual Feedback:
-  - Test window shows real-time joystick position with visual representations
-  - Pitch/Roll visualizer shows forward/backward and left/right movement
-  - Throttle/Yaw visualizer shows up/down movement and rotation
-  - Progress bars show raw axis values for all detected joystick axes
-        """
-        joystick_label = ttk.Label(
-            joystick_frame, 
-            text=joystick_info, 
-            justify="left",
-            font=help_content_font
+    def _build_help_tab(self, parent):
+        """Build the help tab with application information and controls"""
+        # Define enhanced styles for the help tab
+        help_title_font = ("Segoe UI", 22, "bold")  # Larger title font
+        help_content_font = ("Segoe UI", 12)  # Larger content font
+
+        # Title with enhanced styling
+        title_frame = ttk.Frame(parent, padding=(0, 0, 0, 10))
+        title_frame.pack(fill="x", pady=(0, 15))
+        title_label = ttk.Label(
+            title_frame,
+            text="Help & Information",
+            font=help_title_font,
+            foreground=_ACCENT_COLOR
         )
-        joystick_label.pack(fill="x")
-        
-        # Keyboard Shortcuts Section
-        shortcuts_frame = ttk.LabelFrame(
-            scrollable_frame, 
-            text="Keyboard Shortcuts", 
-            padding=20,
-            labelanchor="n"
+        title_label.pack(pady=(5, 0))
+
+        # All sections go into one read-only Text widget with tag-styled
+        # headers. Unlike a column of LabelFrame/Label pairs inside a
+        # ScrollFrame, Text only lays out and renders the visible lines,
+        # so resizing and scrolling cost O(viewport) instead of O(total)
+        text_frame = ttk.Frame(parent)
+        text_frame.pack(fill="both", expand=True)
+
+        help_text = tk.Text(
+            text_frame,
+            wrap="word",
+            font=help_content_font,
+            background="#0a0a0a",
+            foreground=_FG_COLOR,
+            borderwidth=0,
+            highlightthickness=0,
+            padx=20,
+            pady=10,
+            cursor="arrow"
         )
-        shortcuts_frame.pack(fill="x", pady=(10, 20), padx=15)
-        
-        shortcuts_info = """
-• General Shortcuts:
-  - Enter: Apply changes in configuration fields
-  - Ctrl+S: Save current configuration
-  - Ctrl+O: Load saved configuration
-  - Esc: Cancel ongoing operations
+        scrollbar = ttk.Scrollbar(text_frame, orient="vertical", command=help_text.yview)
+        help_text.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        help_text.pack(side="left", fill="both", expand=True)
 
-• Tab Navigation:
-  - Click tabs to switch between different sections
-  - Some tabs provide real-time updates when selected
-        """
-        shortcuts_label = ttk.Label(
-            shortcuts_frame, 
-            text=shortcuts_info, 
-            justify="left",
-            font=help_content_font
+        help_text.tag_configure(
+            "h1",
+            font=("Segoe UI", 14, "bold"),
+            foreground=_ACCENT_COLOR,
+            justify="center",
+            spacing1=18,
+            spacing3=2
         )
-        shortcuts_label.pack(fill="x")
-        
-        # Note: Scrolling is now handled by the ScrollFrame class
-        # No need for manual scroll event bindings
+        for section_title, section_text in _HELP_SECTIONS:
+            help_text.insert("end", section_title + "\n", "h1")
+            help_text.insert("end", section_text)
+
+        # Read-only: content is static and disabling also blocks the caret
+        help_text.configure(state="disabled")
+
+    def _snapshot_config(self):
+        """Return the applied config merged with current UI values.
+
+        Built as one overrides dict plus a single merge rather than a
+        full copy mutated key by key. Typed vars raise TclError while an
+        entry is empty or mid-edit; those keys keep the already-applied
+        value from self.config."""
+        overrides = {}
+        for key, var in self._config_vars.items():
+            try:
+                overrides[key] = var.get()
+            except tk.TclError:
+                pass
+        return {**self.config, **overrides}
 
     def _save_config(self):
         """Save current configuration to a JSON file"""
         try:
             # First make sure we have the latest settings from the UI
             self._apply_all_config_changes()
-            
-            # Start with our complete current configuration
-            config_to_save = dict(self.config)
-            
-            # Update with any UI values not yet applied
-            for key, var in self._config_vars.items():
-                if isinstance(var, tk.BooleanVar):
-                    config_to_save[key] = var.get()
-                else:
-                    try:
-                        # Try to convert to float if possible
-                        config_to_save[key] = float(var.get())
-                    except ValueError:
-                        # Otherwise keep as string
-                        config_to_save[key] = var.get()
-            
+
+            # Current configuration plus any UI values not yet applied
+            config_to_save = self._snapshot_config()
+
+
             # Ensure move_step is not zero if it was previously non-zero
             if "move_step" in config_to_save and config_to_save["move_step"] == 0.0 and "move_step" in self.config and self.config["move_step"] > 0:
                 config_to_save["move_step"] = self.config["move_step"]
@@ -2280,18 +2782,14 @@ class MenuSystem:
             # Create a dialog to get the custom name and allow directory selection
             dialog = tk.Toplevel(self.root)
             dialog.title("Save Configuration")
-            dialog.geometry("600x450")
             dialog.transient(self.root)
             dialog.grab_set()  # Modal
-            
+
             # Set minimum size to match current size
             dialog.minsize(600, 500)
-            
+
             # Center on parent
-            dialog.update_idletasks()
-            x = self.root.winfo_x() + (self.root.winfo_width() // 2) - (dialog.winfo_width() // 2)
-            y = self.root.winfo_y() + (self.root.winfo_height() // 2) - (dialog.winfo_height() // 2)
-            dialog.geometry(f"+{x}+{y}")
+            self._center_dialog(dialog, 600, 450)
             
             # Content
             content_frame = ttk.Frame(dialog, padding=35)
@@ -2337,7 +2835,7 @@ class MenuSystem:
             ).pack(pady=(10, 5))
             
             # Default directory is Config folder
-            default_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Config")
+            default_dir = _CONFIG_DIR
             dir_var = tk.StringVar(value=default_dir)
             
             # Directory display and browse button in a frame
@@ -2384,7 +2882,7 @@ class MenuSystem:
                 directory = dir_var.get()
                 
                 # Make sure the filename is valid by removing special characters
-                filename = ''.join(c for c in filename if c.isalnum() or c in '._- ')
+                filename = _FILENAME_SANITIZE_RE.sub('', filename)
                 
                 # Check if the name already has a .json extension
                 if not filename.lower().endswith('.json'):
@@ -2396,12 +2894,12 @@ class MenuSystem:
                 # Full path to save file
                 filepath = os.path.join(directory, filename)
                 
-                # Format the JSON with indentation for readability
-                config_json = json.dumps(config_to_save, indent=4)
-                
-                # Save to file
-                with open(filepath, "w") as f:
-                    f.write(config_json)
+                # Write the JSON to a temp file and rename it in, so a
+                # crash mid-write can't leave a truncated config behind
+                tmp_path = filepath + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(_json_dumps_bytes(config_to_save))
+                os.replace(tmp_path, filepath)
                 
                 # Explicitly publish events to ensure movement settings are applied
                 EM.publish('config/updated', 'move_step')
@@ -2438,7 +2936,7 @@ class MenuSystem:
         """Load configuration from a JSON file"""
         try:
             # Get default Config directory path
-            default_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Config")
+            default_dir = _CONFIG_DIR
             
             # Open file dialog to choose file to load
             file_path = filedialog.askopenfilename(
@@ -2449,21 +2947,17 @@ class MenuSystem:
             
             if file_path:
                 # Read the configuration file
-                with open(file_path, 'r') as f:
-                    loaded_config = json.load(f)
+                with open(file_path, 'rb') as f:
+                    loaded_config = _json_loads_bytes(f.read())
                 
                 # Show confirmation dialog
                 dialog = tk.Toplevel(self.root)
                 dialog.title("Load Configuration")
-                dialog.geometry("600x350")
                 dialog.transient(self.root)
                 dialog.grab_set()  # Modal
-                
+
                 # Center on parent
-                dialog.update_idletasks()
-                x = self.root.winfo_x() + (self.root.winfo_width() // 2) - (dialog.winfo_width() // 2)
-                y = self.root.winfo_y() + (self.root.winfo_height() // 2) - (dialog.winfo_height() // 2)
-                dialog.geometry(f"+{x}+{y}")
+                self._center_dialog(dialog, 600, 350)
                 
                 # Content
                 content_frame = ttk.Frame(dialog, padding=35)
@@ -2523,324 +3017,257 @@ class MenuSystem:
     def _confirm_load_config(self, dialog, loaded_config, file_path):
         """Apply the loaded configuration after confirmation"""
         dialog.destroy()  # Close original dialog
-        
+
         try:
-            # Create a new dialog to show settings that will be changed
-            preview_dialog = tk.Toplevel(self.root)
-            preview_dialog.title("Configuration Preview")
-            preview_dialog.geometry("1000x400")  # Increased size for better readability
-            preview_dialog.minsize(1000, 400)
-            preview_dialog.configure(bg="#1a1a1a")  # Set dark background
-            preview_dialog.transient(self.root)
-            preview_dialog.grab_set()  # Modal
-            
-            # Center on parent
-            preview_dialog.update_idletasks()
-            x = self.root.winfo_x() + (self.root.winfo_width() // 2) - (preview_dialog.winfo_width() // 2)
-            y = self.root.winfo_y() + (self.root.winfo_height() // 2) - (preview_dialog.winfo_height() // 2)
-            preview_dialog.geometry(f"+{x}+{y}")
-            
-            # Content
-            frame = ttk.Frame(preview_dialog, padding=20, style="Dark.TFrame")
-            frame.pack(fill=tk.BOTH, expand=True)
-            
-            # Title
-            ttk.Label(
-                frame,
-                text=f"Preview of Settings from:\n{os.path.basename(file_path)}",
-                font=("Segoe UI", 14, "bold"),
-                foreground="#FFFFFF",  # Change text color to white
-                wraplength=550,
-                justify="center"
-            ).pack(pady=(0, 10))
-            
-            # Categorize settings
-            rc_settings = {}
-            movement_settings = {}
-            environment_settings = {}
-            other_settings = {}
-            
-            # Check for RC controller settings
-            rc_keys = ['rc_sensitivity', 'rc_deadzone', 'rc_yaw_sensitivity', 'single_axis_mode']
-            
-            # Track changed settings
-            changed_settings = []
-            
+            # Build the preview dialog once and re-populate it on every
+            # load; winfo_exists covers the dialog being torn down with
+            # the interpreter's Tcl state
+            if self._preview_dialog is None or not self._preview_dialog.winfo_exists():
+                self._build_preview_dialog()
+
+            # Categorize settings into ordered sections, precomputing each
+            # row once as (key, current value, new value, changed); the
+            # "changed only" toggle then filters rows instead of re-diffing
+            # every key against the live config
+            sections = {
+                "RC Controller Settings": [],
+                "Movement Settings": [],
+                "Environment Settings": [],
+                "Other Settings": [],
+            }
+            changes_count = 0
+
             for key, value in loaded_config.items():
                 # Skip the flag
                 if key == 'includes_rc_settings':
                     continue
-                    
+
                 # Check if value is different from current
                 current_value = self.config.get(key, "Not set")
-                if value != current_value:
-                    changed_settings.append(key)
-                
+                changed = value != current_value
+                if changed:
+                    changes_count += 1
+
                 # Categorize the setting
-                if key in rc_keys or key == 'rc_mappings':
-                    rc_settings[key] = value
-                elif key in ['move_step', 'rotate_step_deg']:
-                    movement_settings[key] = value
-                elif key in ['num_trees', 'num_rocks', 'num_bushes', 'num_birds', 
-                           'num_falling_trees', 'num_foliage', 'area_size', 'tree_spawn_interval', 'bird_speed']:
-                    environment_settings[key] = value
-                else:
-                    other_settings[key] = value
-            
-            # Show number of changes
-            changes_frame = ttk.Frame(frame, style="Dark.TFrame")
-            changes_frame.pack(fill="x", pady=5)
-            
-            changes_count = len(changed_settings)
+                section = _PREVIEW_KEY_TO_SECTION.get(key, "Other Settings")
+                sections[section].append((key, current_value, value, changed))
+
+            self._preview_sections = sections
+            self._preview_pending = (loaded_config, file_path)
+
+            # Title and change summary for this file
+            self._preview_title_label.configure(
+                text=f"Preview of Settings from:\n{os.path.basename(file_path)}"
+            )
             changes_text = f"{changes_count} setting{'s' if changes_count != 1 else ''} will be changed"
-            
-            ttk.Label(
-                changes_frame,
+            self._preview_changes_label.configure(
                 text=changes_text,
-                font=("Segoe UI", 11, "bold"),
                 foreground="#FF6600" if changes_count > 0 else "#00AA00"
-            ).pack(side="left", pady=5)
-            
-            # Add toggle for "Show changed settings only"
-            show_changed_only = tk.BooleanVar(value=True)
-            
-            def refresh_settings_display():
-                # Clear previous frames
-                for widget in settings_frame.winfo_children():
-                    widget.destroy()
-                
-                # Add sections with settings
-                add_section("RC Controller Settings", rc_settings, self.config, show_changed_only.get())
-                add_section("Movement Settings", movement_settings, self.config, show_changed_only.get())
-                add_section("Environment Settings", environment_settings, self.config, show_changed_only.get())
-                add_section("Other Settings", other_settings, self.config, show_changed_only.get())
-            
-            # Checkbox for show changed only
-            show_changed_check = ttk.Checkbutton(
-                changes_frame,
-                text="Show changed settings only",
-                variable=show_changed_only,
-                command=refresh_settings_display
-            )
-            show_changed_check.pack(side="right", padx=10)
-            
-            # Create a canvas with scrollbar for the settings
-            canvas = tk.Canvas(frame, highlightthickness=0, bg="#1a1a1a")
-            scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
-            settings_frame = ttk.Frame(canvas, style="Dark.TFrame")
-            
-            # Configure canvas
-            canvas.configure(yscrollcommand=scrollbar.set, bg="#1a1a1a")
-            canvas.create_window((0, 0), window=settings_frame, anchor="nw", width=590)  # Wider for better visibility
-            settings_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-            
-            # Pack canvas and scrollbar
-            canvas.pack(side="left", fill="both", expand=True)
-            scrollbar.pack(side="right", fill="y")
-            
-            # Function to add a section of settings
-            def add_section(title, settings_dict, current_dict, changed_only=True):
-                # Prepare data for display
-                display_data = []
-                for key, new_value in settings_dict.items():
-                    current_value = current_dict.get(key, "Not set")
-                    
-                    # Skip unchanged settings if filter is enabled
-                    if changed_only and new_value == current_value:
-                        continue
-                    
-                    display_data.append((key, current_value, new_value))
-                
-                # Skip empty sections
-                if not display_data:
-                    return
-                
-                # Section title
-                section_frame = ttk.LabelFrame(settings_frame, text=title, padding=10, style="Dark.TLabelframe")
-                section_frame.pack(fill="x", pady=5, padx=5)
-                
-                # Table headers
-                header_frame = ttk.Frame(section_frame, style="Dark.TFrame")
-                header_frame.pack(fill="x", pady=5)
-                
-                ttk.Label(
-                    header_frame,
-                    text="Setting",
-                    font=("Segoe UI", 10, "bold"),
-                    foreground="#FFFFFF",  # Add white text color
-                    width=25
-                ).pack(side="left")
-                
-                ttk.Label(
-                    header_frame,
-                    text="Current Value",
-                    font=("Segoe UI", 10, "bold"),
-                    foreground="#FFFFFF",  # Add white text color
-                    width=15
-                ).pack(side="left")
-                
-                ttk.Label(
-                    header_frame,
-                    text="New Value",
-                    font=("Segoe UI", 10, "bold"),
-                    foreground="#FFFFFF",  # Add white text color
-                    width=15
-                ).pack(side="left")
-                
-                # Add separator
-                ttk.Separator(section_frame, orient="horizontal").pack(fill="x", pady=5)
-                
-                # Mapping of raw settings to human-readable names
-                setting_names = {
-                    # RC Settings
-                    "rc_sensitivity": "RC Sensitivity",
-                    "rc_deadzone": "RC Deadzone",
-                    "rc_yaw_sensitivity": "RC Yaw Sensitivity",
-                    "rc_mappings": "RC Control Mappings",
-                    "single_axis_mode": "Single-Axis Mode",
-                    
-                    # Movement Settings
-                    "move_step": "Movement Speed",
-                    "rotate_step_deg": "Rotation Speed",
-                    
-                    # Environment Settings
-                    "num_trees": "Static Trees",
-                    "num_rocks": "Rocks",
-                    "num_bushes": "Bushes",
-                    "num_foliage": "Foliage",
-                    "num_birds": "Birds",
-                    "tree_spawn_interval": "Tree Spawn Interval (s)",
-                    "num_falling_trees": "Falling Trees",
-                    "area_size": "Area Size",
-                    "bird_speed": "Bird Speed"
-                }
-                
-                # Add settings rows
-                for key, current_value, new_value in display_data:
-                    # Create row
-                    row_frame = ttk.Frame(section_frame, style="Dark.TFrame")
-                    row_frame.pack(fill="x", pady=2)
-                    
-                    # Setting name (use human-readable name if available)
-                    display_name = setting_names.get(key, key)
-                    
-                    # Mark changed settings with a different color
-                    name_color = "#0066CC" if current_value != new_value else "#FFFFFF"
-                    
-                    ttk.Label(
-                        row_frame,
-                        text=display_name,
-                        foreground=name_color,
-                        font=("Segoe UI", 10, "bold" if current_value != new_value else "normal"),
-                        width=25
-                    ).pack(side="left")
-                    
-                    # Format values based on their type
-                    def format_value(value):
-                        if value == "Not set":
-                            return value
-                        
-                        # Format booleans
-                        if isinstance(value, bool):
-                            return "Enabled" if value else "Disabled"
-                            
-                        # Format RC mappings
-                        if key == "rc_mappings" and isinstance(value, dict):
-                            # Count mapped controls
-                            mapped_count = sum(1 for control in ["throttle", "yaw", "pitch", "roll"] if control in value)
-                            return f"{mapped_count}/4 controls mapped"
-                        
-                        # Format floats with appropriate precision
-                        if isinstance(value, float):
-                            if key == "rc_yaw_sensitivity":
-                                return f"{int(value * 100)}%"  # Display as percentage
-                            elif abs(value) < 0.1:
-                                return f"{value:.3f}"  # More precision for very small values
-                            elif abs(value) < 1:
-                                return f"{value:.2f}"
-                            else:
-                                return f"{value:.1f}"
-                                
-                        # Default formatting
-                        return str(value)
-                    
-                    # Current value
-                    current_text = format_value(current_value)
-                    if len(current_text) > 15:
-                        current_text = current_text[:12] + "..."
-                    
-                    ttk.Label(
-                        row_frame,
-                        text=current_text,
-                        foreground="#FFFFFF",  # Add white foreground color
-                        width=15
-                    ).pack(side="left")
-                    
-                    # New value
-                    new_text = format_value(new_value)
-                    if len(new_text) > 15:
-                        new_text = new_text[:12] + "..."
-                    
-                    # Show changed values in green, use regular color for unchanged values
-                    value_color = "#008800" if current_value != new_value else "#FFFFFF"
-                    
-                    ttk.Label(
-                        row_frame,
-                        text=new_text,
-                        foreground=value_color,
-                        font=("Segoe UI", 10, "bold" if current_value != new_value else "normal"),
-                        width=15
-                    ).pack(side="left")
-                    
-                    # For boolean values, add a visual indicator
-                    if isinstance(new_value, bool):
-                        indicator_color = "#00AA00" if new_value else "#AA0000"
-                        indicator = "■" if new_value else "□"
-                        ttk.Label(
-                            row_frame,
-                            text=indicator,
-                            foreground=indicator_color,
-                            font=("Segoe UI", 12, "bold")
-                        ).pack(side="left", padx=5)
-                    
-                    # For rc_mappings, add a details button
-                    if key == "rc_mappings" and isinstance(new_value, dict):
-                        details_btn = ttk.Button(
-                            row_frame,
-                            text="Details",
-                            width=8,
-                            command=lambda m=new_value: self._show_mapping_details(preview_dialog, m)
-                        )
-                        details_btn.pack(side="left", padx=5)
-            
-            # Call refresh to populate the settings display
-            refresh_settings_display()
-            
-            # Buttons
-            button_frame = ttk.Frame(frame, style="Dark.TFrame")
-            button_frame.pack(fill=tk.X, pady=20)
-            
-            cancel_btn = ttk.Button(
-                button_frame, 
-                text="Cancel", 
-                command=preview_dialog.destroy
-            )
-            cancel_btn.pack(side=tk.LEFT, padx=10, expand=True, fill=tk.X, ipady=4)
-            
-            apply_btn = ttk.Button(
-                button_frame, 
-                text="Apply These Settings", 
-                style="Apply.TButton",
-                command=lambda: self._apply_loaded_config(preview_dialog, loaded_config, file_path)
             )
-            apply_btn.pack(side=tk.RIGHT, padx=10, expand=True, fill=tk.X, ipady=4)
-        
+            self._preview_show_changed.set(True)
+            self._refresh_preview_sections()
+
+            # Show the dialog
+            self._center_dialog(self._preview_dialog, 1000, 400)
+            self._preview_dialog.deiconify()
+            self._preview_dialog.grab_set()  # Modal
         except Exception as e:
             self.logger.error("MenuSystem", f"Error showing config preview: {e}")
             self.status_label.configure(text=f"Error previewing configuration: {str(e)}")
             self.root.after(3000, lambda: self.status_label.configure(text=""))
+
+    def _build_preview_dialog(self):
+        """Create the Configuration Preview dialog, hidden; _confirm_load_config re-shows it."""
+        dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
+        dialog.title("Configuration Preview")
+        dialog.minsize(1000, 400)  # Increased size for better readability
+        dialog.configure(bg="#1a1a1a")  # Set dark background
+        dialog.transient(self.root)
+        # The window-manager close button behaves like Cancel
+        dialog.protocol("WM_DELETE_WINDOW", self._close_preview)
+
+        # Content
+        frame = ttk.Frame(dialog, padding=20, style="Dark.TFrame")
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        # Title
+        self._preview_title_label = ttk.Label(
+            frame,
+            text="",
+            font=("Segoe UI", 14, "bold"),
+            foreground="#FFFFFF",  # Change text color to white
+            wraplength=550,
+            justify="center"
+        )
+        self._preview_title_label.pack(pady=(0, 10))
+
+        # Number of changes
+        changes_frame = ttk.Frame(frame, style="Dark.TFrame")
+        changes_frame.pack(fill="x", pady=5)
+
+        self._preview_changes_label = ttk.Label(
+            changes_frame,
+            text="",
+            font=("Segoe UI", 11, "bold")
+        )
+        self._preview_changes_label.pack(side="left", pady=5)
+
+        # Toggle for "Show changed settings only"
+        self._preview_show_changed = tk.BooleanVar(value=True)
+        show_changed_check = ttk.Checkbutton(
+            changes_frame,
+            text="Show changed settings only",
+            variable=self._preview_show_changed,
+            command=self._toggle_preview_filter
+        )
+        show_changed_check.pack(side="right", padx=10)
+
+        # Details button for RC mappings; packed on demand when the
+        # previewed file carries them
+        self._preview_mapping_btn = ttk.Button(
+            changes_frame,
+            text="Mapping Details",
+            width=15,
+            command=self._show_preview_mappings
+        )
+
+        # One Treeview with native viewport scrolling holds every section;
+        # unlike the canvas + inner-frame pattern it only paints the
+        # visible rows and never re-lays-out on scroll
+        tree = ttk.Treeview(
+            frame,
+            columns=("current", "new"),
+            show="tree headings",
+            selectmode="none"
+        )
+        tree.heading("#0", text="Setting", anchor="w")
+        tree.heading("current", text="Current Value", anchor="w")
+        tree.heading("new", text="New Value", anchor="w")
+        tree.column("#0", width=280)
+        tree.column("current", width=150)
+        tree.column("new", width=150)
+        tree.tag_configure("section", font=("Segoe UI", 10, "bold"))
+        tree.tag_configure("changed", foreground="#FF6600")
+        self._preview_tree = tree
+
+        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+
+        # Pack tree and scrollbar
+        tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        # Buttons
+        button_frame = ttk.Frame(frame, style="Dark.TFrame")
+        button_frame.pack(fill=tk.X, pady=20)
+
+        cancel_btn = ttk.Button(
+            button_frame,
+            text="Cancel",
+            command=self._close_preview
+        )
+        cancel_btn.pack(side=tk.LEFT, padx=10, expand=True, fill=tk.X, ipady=4)
+
+        apply_btn = ttk.Button(
+            button_frame,
+            text="Apply These Settings",
+            style="Apply.TButton",
+            command=self._apply_preview
+        )
+        apply_btn.pack(side=tk.RIGHT, padx=10, expand=True, fill=tk.X, ipady=4)
+
+        self._preview_dialog = dialog
+
+    def _close_preview(self):
+        """Dismiss the Configuration Preview dialog without applying."""
+        self._preview_dialog.grab_release()
+        self._preview_dialog.withdraw()
+
+    def _apply_preview(self):
+        """Apply the previewed configuration and dismiss the dialog."""
+        loaded_config, file_path = self._preview_pending
+        self._close_preview()
+        self._apply_loaded_config(loaded_config, file_path)
+
+    def _refresh_preview_sections(self):
+        """Build the preview settings rows from the precomputed sections."""
+        # Clear rows from the previous load
+        tree = self._preview_tree
+        tree.delete(*tree.get_children())
+        self._preview_section_items = []
+        self._preview_mappings = None
+
+        # Build every row once; the filter toggle then only detaches and
+        # reattaches items instead of rebuilding them
+        for title, rows in self._preview_sections.items():
+            if not rows:
+                continue
+            section_item = tree.insert("", "end", text=title, open=True, tags=("section",))
+            items = []
+            for key, current_value, new_value, changed in rows:
+                item = tree.insert(
+                    section_item, "end",
+                    text=_SETTING_NAMES.get(key, key),
+                    values=(
+                        self._format_preview_value(key, current_value),
+                        self._format_preview_value(key, new_value)
+                    ),
+                    tags=("changed",) if changed else ()
+                )
+                items.append((item, changed))
+                if key == "rc_mappings" and isinstance(new_value, dict):
+                    self._preview_mappings = new_value
+            self._preview_section_items.append((section_item, items))
+
+        # Details button only applies when the file carries RC mappings
+        if self._preview_mappings is not None:
+            self._preview_mapping_btn.pack(side="right", padx=10)
+        else:
+            self._preview_mapping_btn.pack_forget()
+
+        # Apply the current filter
+        self._toggle_preview_filter()
+
+    def _toggle_preview_filter(self):
+        """Show or hide unchanged preview rows without rebuilding items."""
+        tree = self._preview_tree
+        changed_only = self._preview_show_changed.get()
+
+        for section_index, (section_item, items) in enumerate(self._preview_section_items):
+            visible = 0
+            for index, (item, changed) in enumerate(items):
+                if changed_only and not changed:
+                    tree.detach(item)
+                else:
+                    tree.move(item, section_item, index)
+                    visible += 1
+            # Hide sections whose rows are all filtered out
+            if visible:
+                tree.move(section_item, "", section_index)
+            else:
+                tree.detach(section_item)
+
+    def _show_preview_mappings(self):
+        """Show details of the RC mappings carried by the previewed config."""
+        self._show_mapping_details(self._preview_dialog, self._preview_mappings)
+
+    def _format_preview_value(self, key, value):
+        """Format a preview value based on its type."""
+        # Format RC mappings; dicts are unhashable so they bypass the cache
+        if key == "rc_mappings" and isinstance(value, dict):
+            # Count mapped controls
+            mapped_count = sum(1 for control in ["throttle", "yaw", "pitch", "roll"] if control in value)
+            return f"{mapped_count}/4 controls mapped"
+
+        try:
+            return _fmt_preview_scalar(key, value)
+        except TypeError:
+            # Other unhashable values (e.g. clear_zone_center, which
+            # round-trips through JSON as a list) skip the cache
+            return _fmt_preview_scalar.__wrapped__(key, value)
     
-    def _apply_loaded_config(self, dialog, loaded_config, file_path):
+    def _apply_loaded_config(self, loaded_config, file_path):
         """Apply loaded configuration from file"""
         try:
             # Update our configuration with the loaded values
@@ -2869,14 +3296,10 @@ class MenuSystem:
             self.root.after(2000, lambda: self.status_label.configure(text=""))
             
             self.logger.info("MenuSystem", f"Configuration loaded with move_step={self.config.get('move_step', 0.0):.2f}")
-            
-            # Close the dialog
-            dialog.destroy()
         except Exception as e:
             self.logger.error("MenuSystem", f"Error applying loaded configuration: {e}")
             self.status_label.configure(text=f"Error applying loaded configuration: {e}")
             self.root.after(2000, lambda: self.status_label.configure(text=""))
-            dialog.destroy()
 
     def _update_performance_metrics(self):
         """Update performance metrics in the UI"""
@@ -2903,30 +3326,21 @@ class MenuSystem:
             if hasattr(self, 'uptime_var'):
                 self.uptime_var.set(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
 
-            # Update memory usage
-            process = psutil.Process()
-            memory_info = process.memory_info()
-            memory_mb = memory_info.rss / (1024 * 1024)  # Convert to MB
+            # Memory/CPU figures come from the background sampler thread;
+            # here we only format the cached floats (no syscalls in Tk code)
             if hasattr(self, 'mem_var'):
-                self.mem_var.set(f"{memory_mb:.1f} MB")
-                
-            # Update memory percentage
-            mem_percent = psutil.virtual_memory().percent
+                self.mem_var.set(f"{self._last_mem_mb:.1f} MB")
+
             if hasattr(self, 'mem_percent_var'):
-                self.mem_percent_var.set(f"{mem_percent:.1f}%")
+                self.mem_percent_var.set(f"{self._last_mem_percent:.1f}%")
 
-            # Get CPU usage (this is percentage of a single core)
-            cpu_percent = psutil.cpu_percent(interval=None)
             if hasattr(self, 'cpu_usage_var'):
-                self.cpu_usage_var.set(f"{cpu_percent:.1f}%")
-                
-            # Get CPU frequency
-            try:
-                cpu_freq = psutil.cpu_freq().current
-                if hasattr(self, 'cpu_freq_var'):
-                    self.cpu_freq_var.set(f"{cpu_freq:.0f} MHz")
-            except Exception:
-                if hasattr(self, 'cpu_freq_var'):
+                self.cpu_usage_var.set(f"{self._last_cpu:.1f}%")
+
+            if hasattr(self, 'cpu_freq_var'):
+                if self._last_cpu_freq > 0:
+                    self.cpu_freq_var.set(f"{self._last_cpu_freq:.0f} MHz")
+                else:
                     self.cpu_freq_var.set("N/A")
                     
             # Get thread count
@@ -3123,18 +3537,22 @@ class MenuSystem:
 
     def _clear_performance_metrics(self):
         """Clear all performance metrics when monitoring is disabled"""
+        self._frame_times.clear()
+        if not hasattr(self, 'fps_var'):
+            # Monitor tab not built yet (tabs are built lazily)
+            return
         self.fps_var.set("N/A")
         self.mem_var.set("N/A")
         self.mem_percent_var.set("N/A")
         self.cpu_usage_var.set("N/A")
         self.cpu_freq_var.set("N/A")
         self.thread_var.set("N/A")
-        self._frame_times = []
 
     def _toggle_monitoring(self):
         """Handle monitoring toggle button click"""
         is_enabled = self.monitoring_var.get()
         self.config["enable_performance_monitoring"] = is_enabled
+        self._perf_monitoring_enabled = is_enabled
         
         if is_enabled:
             self._schedule_ui_update()
@@ -3178,6 +3596,7 @@ class MenuSystem:
         
         # Clear any pressed keys and stop movement
         self._ui_pressed_keys.clear()
+        self._key_mask = 0
         try:
             # Explicitly stop all movement by publishing zero values
             EM.publish('keyboard/move', (0.0, 0.0, 0.0, 8))
@@ -3192,18 +3611,17 @@ class MenuSystem:
             except Exception as e:
                 self.logger.error("MenuSystem", f"Error cleaning up RC settings: {e}")
         
-        # Unsubscribe from events
-        EM.unsubscribe('scene/progress', self._on_scene_progress)
-        EM.unsubscribe('scene/completed', self._on_scene_completed)
-        EM.unsubscribe('scene/canceled', self._on_scene_canceled)
-        EM.unsubscribe('scene/request_creation', self._on_scene_creation_request)
-        EM.unsubscribe('victim/detected', self._update_victim_indicator)
-        EM.unsubscribe('simulation/frame', self._on_simulation_frame)
-        EM.unsubscribe('config/updated', self._on_config_updated_gui)
-        EM.unsubscribe('dataset/batch_saved', self._on_batch_saved)
-        EM.unsubscribe('dataset/config_updated', self._on_dataset_config_updated)
-        EM.unsubscribe('dataset/status_update', self._force_ui_update)
-        
+        # Unsubscribe everything recorded by _sub. Iterating the recorded
+        # (event, callback) pairs guarantees the topic strings match the
+        # subscriptions — the old hand-written list had drifted out of sync
+        # with the actual topics and silently left callbacks registered.
+        for event, callback in self._subs:
+            try:
+                EM.unsubscribe(event, callback)
+            except Exception as e:
+                self.logger.error("MenuSystem", f"Error unsubscribing from {event}: {e}")
+        self._subs.clear()
+
         self.logger.info("MenuSystem", "Cleanup complete - all events unsubscribed")
 
     def _build_dataset_tab(self, parent):
@@ -3273,6 +3691,7 @@ class MenuSystem:
         
         # Initially disable the button until scene is cleared
         self.remove_batches_btn.configure(state="disabled")
+        self._remove_batches_state = "disabled"
         
         # Tools Section
         viewer_frame = ttk.LabelFrame(parent, text="Tools", padding=15, labelanchor="n")
@@ -3347,18 +3766,14 @@ class MenuSystem:
             # Create a dialog to get the custom name
             dialog = tk.Toplevel(self.root)
             dialog.title("Save Configuration As")
-            dialog.geometry("450x390")  
             dialog.transient(self.root)
             dialog.grab_set()  # Modal
-            
+
             # Set minimum size to match current size
             dialog.minsize(450, 390)
-            
+
             # Center on parent
-            dialog.update_idletasks()
-            x = self.root.winfo_x() + (self.root.winfo_width() // 2) - (dialog.winfo_width() // 2)
-            y = self.root.winfo_y() + (self.root.winfo_height() // 2) - (dialog.winfo_height() // 2)
-            dialog.geometry(f"+{x}+{y}")
+            self._center_dialog(dialog, 450, 390)
             
             # Content
             content_frame = ttk.Frame(dialog, padding=35)  # Increased padding from 25 to 35
@@ -3437,21 +3852,10 @@ class MenuSystem:
         # Ensure we have the latest config with all settings from UI elements
         self._apply_all_config_changes()
         
-        # Create a complete copy of the configuration
-        complete_config = dict(self.config)
-        
-        # Update with any UI values not yet applied
-        for key, var in self._config_vars.items():
-            if isinstance(var, tk.BooleanVar):
-                complete_config[key] = var.get()
-            else:
-                try:
-                    # Try to convert to float if possible
-                    complete_config[key] = float(var.get())
-                except ValueError:
-                    # If not a number, save as string
-                    complete_config[key] = var.get()
-        
+        # Current configuration plus any UI values not yet applied
+        complete_config = self._snapshot_config()
+
+
         # Update any RC controller settings from the RC settings object if it exists
         if hasattr(self, 'rc_settings') and self.rc_settings:
             # Get RC settings and add them to the configuration
@@ -3868,7 +4272,8 @@ class MenuSystem:
                 
                 # Use the set_debug_level method
                 logger_instance.set_debug_level(level)
-                
+                self._refresh_debug_flags()
+
                 level_names = {DEBUG_L1: "Basic", DEBUG_L2: "Medium", DEBUG_L3: "Verbose"}
                 self.logger.info("MenuSystem", f"Debug level changed to L{level} ({level_names[level]})")
                 
@@ -3942,7 +4347,8 @@ class MenuSystem:
                 debug_level=debug_level,
                 colored_output=True
             )
-            
+            self._refresh_debug_flags()
+
             # Show appropriate message
             message = "Verbose mode enabled" if verbose else "Verbose mode disabled"
             self.logger.info("MenuSystem", message)
@@ -4328,15 +4734,11 @@ For example:
         # Create popup dialog
         dialog = tk.Toplevel(parent)
         dialog.title("RC Mappings Details")
-        dialog.geometry("400x300")
         dialog.transient(parent)  # Make dialog modal to parent
         dialog.grab_set()
-        
+
         # Center on parent
-        dialog.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() // 2) - (dialog.winfo_width() // 2)
-        y = parent.winfo_y() + (parent.winfo_height() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f"+{x}+{y}")
+        self._center_dialog(dialog, 400, 300, parent=parent)
         
         # Content frame
         frame = ttk.Frame(dialog, padding=15)
@@ -4451,15 +4853,11 @@ For example:
             # Create a confirmation dialog
             dialog = tk.Toplevel(self.root)
             dialog.title("Confirm Batch Removal")
-            dialog.geometry("400x200")
             dialog.transient(self.root)
             dialog.grab_set()  # Make dialog modal
-            
+
             # Center dialog on parent window
-            dialog.update_idletasks()
-            x = self.root.winfo_x() + (self.root.winfo_width() - dialog.winfo_width()) // 2
-            y = self.root.winfo_y() + (self.root.winfo_height() - dialog.winfo_height()) // 2
-            dialog.geometry(f"+{x}+{y}")
+            self._center_dialog(dialog, 400, 200)
             
             # Add padding frame
             frame = ttk.Frame(dialog, padding=20)
@@ -4519,19 +4917,23 @@ For example:
                 if not os.path.exists(folder_path):
                     continue
                 
-                # Find batch files to remove (format: batch_000XXX.npz)
+                # Find batch entries to remove (legacy batch_000XXX.npz files or batch_000XXX directories)
                 for batch_id in range(scene_batch + 1, current_batch + 1):
                     # Format batch number with leading zeros (6 digits)
                     batch_str = f"{batch_id:06d}"
-                    batch_file = os.path.join(folder_path, f"batch_{batch_str}.npz")
-                    
-                    if os.path.exists(batch_file):
-                        try:
-                            os.remove(batch_file)
-                            removed_count += 1
-                            self.logger.info("MenuSystem", f"Removed batch file: {batch_file}")
-                        except Exception as e:
-                            self.logger.error("MenuSystem", f"Error removing batch file {batch_file}: {e}")
+                    for batch_file in (os.path.join(folder_path, f"batch_{batch_str}.npz"),
+                                       os.path.join(folder_path, f"batch_{batch_str}")):
+                        if os.path.exists(batch_file):
+                            try:
+                                if os.path.isdir(batch_file):
+                                    import shutil
+                                    shutil.rmtree(batch_file)
+                                else:
+                                    os.remove(batch_file)
+                                removed_count += 1
+                                self.logger.info("MenuSystem", f"Removed batch: {batch_file}")
+                            except Exception as e:
+                                self.logger.error("MenuSystem", f"Error removing batch {batch_file}: {e}")
             
             # Reset the batch counter to the scene batch number
             with open(batch_counter_file, "w") as f:
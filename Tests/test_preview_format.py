@@ -0,0 +1,42 @@
+# Tests/test_preview_format.py
+"""Regression tests for config preview value formatting."""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from Managers.menu_system import MenuSystem
+from Utils.config_utils import get_default_config
+
+
+def test_preview_formats_config_with_clear_zone_center():
+    # clear_zone_center is a tuple in the defaults but round-trips
+    # through JSON as a list; formatting every entry of a saved config
+    # must not raise on such unhashable values (lru_cache TypeError)
+    loaded = json.loads(json.dumps(get_default_config()))
+    assert isinstance(loaded["clear_zone_center"], list)
+    for key, value in loaded.items():
+        text = MenuSystem._format_preview_value(None, key, value)
+        assert isinstance(text, str)
+
+
+def test_preview_scalar_formatting_unchanged():
+    cases = [
+        ("move_step", 0.05, "0.050"),
+        ("move_step", 0.5, "0.50"),
+        ("area_size", 25.0, "25.0"),
+        ("rc_yaw_sensitivity", 0.75, "75%"),
+        ("single_axis_mode", True, "Enabled"),
+        ("num_trees", 12, "12"),
+        ("verbose", "Not set", "Not set"),
+    ]
+    for key, value, expected in cases:
+        assert MenuSystem._format_preview_value(None, key, value) == expected
+
+
+def test_preview_formats_rc_mappings_summary():
+    mappings = {"throttle": 1, "yaw": 2, "pitch": 3}
+    text = MenuSystem._format_preview_value(None, "rc_mappings", mappings)
+    assert text == "3/4 controls mapped"
@@ -48,6 +48,7 @@ if parent_dir not in sys.path:
 
 # Import from Utils package
 from Utils.log_utils import get_logger, DEBUG_L1, DEBUG_L2, DEBUG_L3, LOG_LEVEL_DEBUG, LOG_LEVEL_INFO, LOG_LEVEL_WARNING, LOG_LEVEL_ERROR, LOG_LEVEL_CRITICAL
+from Utils.save_utils import load_batch, save_batch_npy_dir
 
 # Initialize logger
 logger = get_logger()
@@ -689,7 +690,7 @@ class ImageViewer:
                 self.data_image_canvas.create_image(x, y, anchor=tk.NW, image=self.data_image_photo)
                 
                 # Add action label overlay if available
-                if 'actions' in self.current_batch.files:
+                if 'actions' in self.current_batch:
                     try:
                         action_labels = self.current_batch['actions']
                         if image_idx < len(action_labels):
@@ -755,7 +756,7 @@ class ImageViewer:
             self.data_text.tag_configure("value", font=("Helvetica", 10))
             
             # List all available arrays in the batch
-            data_types = [key for key in self.current_batch.files if key not in ('split')]
+            data_types = [key for key in self.current_batch if key not in ('split')]
             
             # Display each data type that has the current image index
             for data_type in data_types:
@@ -1223,7 +1224,7 @@ class ImageViewer:
                     
                     # Get action label if available
                     action_text = ""
-                    if 'actions' in self.current_batch.files:
+                    if 'actions' in self.current_batch:
                         try:
                             action_labels = self.current_batch['actions']
                             if i < len(action_labels):
@@ -1944,9 +1945,15 @@ Tips
                     os.makedirs(os.path.join(self.dataset_dir, "val"), exist_ok=True)
                     os.makedirs(os.path.join(self.dataset_dir, "test"), exist_ok=True)
                 
-            # Use glob to find all .npz files recursively
+            # Use glob to find all .npz files recursively, plus batch
+            # directories in the newer .npy-per-field layout (identified
+            # by their meta.json)
             all_files = glob.glob(os.path.join(self.dataset_dir, "**", "*.npz"), recursive=True)
-            
+            all_files += [
+                path for path in glob.glob(os.path.join(self.dataset_dir, "**", "batch_*"), recursive=True)
+                if os.path.isdir(path) and os.path.exists(os.path.join(path, "meta.json"))
+            ]
+
             # Define a sorting function specifically for batch numbers
             import re
             def batch_number_sort_key(filepath):
@@ -2017,10 +2024,15 @@ Tips
             filename = os.path.basename(file_path)
             self.root.title(f"Depth Image Viewer v0.4.1 - {filename}")
             
-            # Load the NPZ file
+            # Load the batch; load_batch handles both legacy .npz files
+            # and .npy batch directories. Arrays are read eagerly so a
+            # later in-place save never races an open memory map
             try:
-                self.current_batch = np.load(file_path, allow_pickle=True)
-                
+                self.current_batch = load_batch(file_path, mmap=False)
+                if self.current_batch is None:
+                    self.show_status_message(f"Error loading file: {filename}", self.error_color)
+                    return
+
                 # Check if the file contains depths array
                 if 'depths' not in self.current_batch:
                     self.show_status_message(f"No depths array in file: {filename}", self.error_color)
@@ -2142,7 +2154,10 @@ Tips
             try:
                 if os.access(backup_dir_abs, os.W_OK):
                     import shutil
-                    shutil.copy2(current_file, backup_file)
+                    if os.path.isdir(current_file):
+                        shutil.copytree(current_file, backup_file)
+                    else:
+                        shutil.copy2(current_file, backup_file)
                     logger.debug_at_level(DEBUG_L1, "ImageViewer", f"Created backup at {backup_file}")
                 else:
                     logger.warning("ImageViewer", f"Skipping backup - directory not writable")
@@ -2168,9 +2183,19 @@ Tips
                 self.flipped_images = modified_depths
             
             # Create a new npz file with the same data but flipped depths
-            save_data = {key: self.current_batch[key] for key in self.current_batch.files}
+            save_data = {key: self.current_batch[key] for key in self.current_batch}
             save_data['depths'] = self.flipped_images
-            
+
+            # Batch directories are rewritten in place via save_batch_npy_dir;
+            # the temp-file/replace dance below only applies to legacy .npz files
+            if os.path.isdir(current_file):
+                if not save_batch_npy_dir(current_file, save_data):
+                    raise Exception(f"Failed to save batch directory: {current_file}")
+                self.cleanup_old_backups(current_filename)
+                self.show_status_message(f"Saved changes to {current_filename}")
+                logger.info("ImageViewer", f"Successfully saved changes to {current_filename}")
+                return
+
             # Create a unique temporary file name using Python's tempfile module
             import tempfile
             
@@ -2302,8 +2327,12 @@ Tips
             backup_files.sort(key=lambda x: x[1], reverse=True)
             
             # Keep only the 5 most recent backups
+            import shutil
             for file_path, _ in backup_files[5:]:
-                os.remove(file_path)
+                if os.path.isdir(file_path):
+                    shutil.rmtree(file_path)
+                else:
+                    os.remove(file_path)
                 logger.debug_at_level(DEBUG_L1, "ImageViewer", f"Removed old backup: {os.path.basename(file_path)}")
         except Exception as e:
             logger.debug_at_level(DEBUG_L2, "ImageViewer", f"Error cleaning up old backups: {str(e)}")
@@ -2440,7 +2469,7 @@ Tips
             self.thumbnail_labels = []
             self.thumbnail_photos = []
             
-            if self.current_batch is None or not hasattr(self.current_batch, 'files') or 'depths' not in self.current_batch.files:
+            if not self.current_batch or 'depths' not in self.current_batch:
                 self.debug_print("No batch or missing depth data")
                 return
             
@@ -2590,7 +2619,7 @@ Tips
                     
                     # Get action label if available
                     action_text = ""
-                    if 'actions' in self.current_batch.files:
+                    if 'actions' in self.current_batch:
                         try:
                             action_labels = self.current_batch['actions']
                             if i < len(action_labels):
@@ -3149,7 +3178,7 @@ Tips
                 file_info = "No file loaded"
                 action_counts = {}
                 
-                if self.current_batch and 'depths' in self.current_batch.files:
+                if self.current_batch and 'depths' in self.current_batch:
                     # Get the full filename
                     current_file = self.npz_files[self.current_file_idx]
                     filename = os.path.basename(current_file)
@@ -3162,7 +3191,7 @@ Tips
                     file_info = f"File: {name} | Images: {total_images}"
                     
                     # Add action label info if available
-                    if 'actions' in self.current_batch.files:
+                    if 'actions' in self.current_batch:
                         try:
                             actions = self.current_batch['actions']
                             # Count occurrences of each action label
@@ -3427,7 +3456,7 @@ Tips
             
             # Get action label if available
             action_text = ""
-            if 'actions' in self.current_batch.files:
+            if 'actions' in self.current_batch:
                 try:
                     action_labels = self.current_batch['actions']
                     if image_idx < len(action_labels):
@@ -0,0 +1,86 @@
+# Utils/ring_utils.py
+
+import threading
+import time
+from collections import deque
+
+
+class Empty(Exception):
+    """Raised by RingBuffer.pop when no item arrives within the timeout."""
+    pass
+
+
+class RingBuffer:
+    """
+    Bounded FIFO for handing batches from the capture thread to the writers.
+
+    deque.append/popleft are single-bytecode operations that the GIL makes
+    atomic, so the fast path takes no mutex and never wakes the scheduler —
+    unlike queue.Queue, which acquires a lock and notifies a Condition on
+    every put/get. Events are only touched on the slow paths (consumer idle,
+    producer full), keeping the real-time simulation tick free of contention
+    with the I/O threads.
+    """
+
+    def __init__(self, capacity=8):
+        """
+        Args:
+            capacity: Maximum number of buffered items before push blocks
+        """
+        self._capacity = capacity
+        self._items = deque()
+        self._not_empty = threading.Event()
+        self._not_full = threading.Event()
+        self._not_full.set()
+
+    def push(self, item):
+        """
+        Append an item, blocking while the ring is full.
+
+        Blocking only happens when every writer is behind by a full ring of
+        batches, which signals a disk that cannot keep up rather than a
+        transient hiccup; dropping data silently would be worse.
+        """
+        while len(self._items) >= self._capacity:
+            self._not_full.clear()
+            # Re-check after clearing to close the race with a concurrent pop
+            if len(self._items) >= self._capacity:
+                self._not_full.wait(0.05)
+        self._items.append(item)
+        self._not_empty.set()
+
+    def pop(self, timeout=None):
+        """
+        Remove and return the oldest item.
+
+        Args:
+            timeout: Seconds to wait for an item; None waits forever
+
+        Raises:
+            Empty: If no item arrived within the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                item = self._items.popleft()
+            except IndexError:
+                self._not_empty.clear()
+                # Re-check after clearing to close the race with a concurrent push
+                if self._items:
+                    continue
+                if deadline is None:
+                    self._not_empty.wait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._not_empty.wait(remaining):
+                        raise Empty()
+                continue
+            self._not_full.set()
+            return item
+
+    def __len__(self):
+        return len(self._items)
+
+    def empty(self):
+        """Return True if no items are currently buffered."""
+        return not self._items
@@ -1,9 +1,89 @@
 import numpy as np
 import os
+import json
 from Utils.log_utils import get_logger, DEBUG_L1, DEBUG_L2, DEBUG_L3
 
 logger = get_logger()
 
+# Fields every saved batch must contain
+REQUIRED_KEYS = ['depths', 'poses', 'frames', 'distances', 'actions', 'victim_dirs']
+
+def save_batch_npy_dir(dirpath, batch_data):
+    """
+    Save a batch dictionary as a directory of plain uncompressed .npy files,
+    one per field, with a sibling meta.json describing shapes/dtypes/split.
+
+    Skipping the NPZ ZIP container avoids the CRC32 and central-directory
+    passes over hundreds of depth maps, so the save is a pure sequential
+    write. Files written this way can be loaded with np.load(mmap_mode='r').
+
+    Args:
+        dirpath: Full path to the target batch directory (created if missing)
+        batch_data: Dictionary with data to save
+
+    Returns:
+        bool: Success status
+    """
+    try:
+        # Verify all required data is present
+        missing_keys = [key for key in REQUIRED_KEYS if key not in batch_data]
+        if missing_keys:
+            logger.error("SaveUtils", f"Missing data keys: {missing_keys}")
+            return False
+
+        os.makedirs(dirpath, exist_ok=True)
+
+        meta = {'split': batch_data.get('split', 'train'), 'fields': {}}
+        for key in REQUIRED_KEYS:
+            arr = np.ascontiguousarray(batch_data[key])
+            with open(os.path.join(dirpath, f"{key}.npy"), 'wb') as f:
+                np.lib.format.write_array(f, arr, allow_pickle=False)
+            meta['fields'][key] = {'shape': list(arr.shape), 'dtype': str(arr.dtype)}
+
+        with open(os.path.join(dirpath, "meta.json"), 'w') as f:
+            json.dump(meta, f, indent=4)
+
+        logger.debug_at_level(DEBUG_L1, "SaveUtils", f"Saved batch to {dirpath}")
+        logger.debug_at_level(DEBUG_L2, "SaveUtils", f"- Depths shape: {batch_data['depths'].shape}")
+        logger.debug_at_level(DEBUG_L2, "SaveUtils", f"- Frames count: {len(batch_data['frames'])}")
+
+        return True
+
+    except Exception as e:
+        logger.error("SaveUtils", f"Error saving batch to {dirpath}: {e}")
+        return False
+
+def load_batch(path, mmap=True):
+    """
+    Load a saved batch from either format: a .npz file or a directory of
+    .npy files written by save_batch_npy_dir.
+
+    Args:
+        path: Path to a batch .npz file or batch directory
+        mmap: Memory-map .npy fields instead of reading them eagerly
+
+    Returns:
+        dict: Field name -> array (plus 'split'), or None on error
+    """
+    try:
+        if os.path.isdir(path):
+            with open(os.path.join(path, "meta.json"), 'r') as f:
+                meta = json.load(f)
+            batch = {key: np.load(os.path.join(path, f"{key}.npy"),
+                                  mmap_mode='r' if mmap else None)
+                     for key in meta['fields']}
+            batch['split'] = meta.get('split', 'train')
+            return batch
+        else:
+            data = np.load(path, allow_pickle=True)
+            batch = {key: data[key] for key in data.files}
+            if 'split' in batch:
+                batch['split'] = str(batch['split'])
+            return batch
+    except Exception as e:
+        logger.error("SaveUtils", f"Error loading batch from {path}: {e}")
+        return None
+
 def save_batch_npz(filepath, batch_data):
     """
     Save a batch dictionary into a compressed .npz file,
@@ -18,9 +98,8 @@ def save_batch_npz(filepath, batch_data):
     """
     try:
         # Verify all required data is present
-        required_keys = ['depths', 'poses', 'frames', 'distances', 'actions', 'victim_dirs']
-        missing_keys = [key for key in required_keys if key not in batch_data]
-        
+        missing_keys = [key for key in REQUIRED_KEYS if key not in batch_data]
+
         if missing_keys:
             logger.error("SaveUtils", f"Missing data keys: {missing_keys}")
             return False